@@ -20,6 +20,10 @@ def ucs(grafo, inicio, objetivo):
         # Extrae el nodo con el costo ACUMULADO más bajo (gracias a heapq)
         (costo_actual, nodo_actual) = heapq.heappop(cola_prioridad)
         
+        # Eliminación perezosa: la entrada es obsoleta si ya hay un costo menor
+        if costo_actual > costos[nodo_actual]:
+            continue
+        
         # Condición de Éxito
         if nodo_actual == objetivo:
             return f"¡Objetivo '{objetivo}' encontrado con costo {costo_actual}!"
@@ -38,6 +42,56 @@ def ucs(grafo, inicio, objetivo):
                 
     return f"Objetivo '{objetivo}' no alcanzable"
 
+def ucs_arbol(grafo, inicio, objetivos=None, detener_en_primero=False):
+    """
+    UCS de uno-a-todos (Dijkstra) con eliminación perezosa en el heap.
+    - objetivos=None: expande todo el grafo alcanzable (árbol completo de rutas más cortas).
+    - objetivos={...}: se detiene cuando TODOS los objetivos quedan cerrados,
+      o en el PRIMERO de ellos si detener_en_primero=True.
+    Devuelve (distancias, padres) solo de los nodos cerrados (costo definitivo).
+    """
+    cola_prioridad = [(0, inicio)]
+    costos = {inicio: 0}
+    padres = {inicio: None}
+    distancias = {}  # Nodos cerrados: su costo ya es el mínimo
+    pendientes = set(objetivos) if objetivos is not None else None
+    
+    while cola_prioridad:
+        (costo_actual, nodo_actual) = heapq.heappop(cola_prioridad)
+        
+        # 1. Salta entradas obsoletas y nodos ya cerrados
+        if nodo_actual in distancias or costo_actual > costos[nodo_actual]:
+            continue
+        distancias[nodo_actual] = costo_actual
+        
+        # 2. Salida temprana al cerrar los objetivos
+        if pendientes is not None and nodo_actual in pendientes:
+            pendientes.discard(nodo_actual)
+            if detener_en_primero or not pendientes:
+                break
+        
+        # 3. Relajación de aristas
+        for vecino, costo_arista in grafo.get(nodo_actual, {}).items():
+            nuevo_costo = costo_actual + costo_arista
+            if vecino not in costos or nuevo_costo < costos[vecino]:
+                costos[vecino] = nuevo_costo
+                padres[vecino] = nodo_actual
+                heapq.heappush(cola_prioridad, (nuevo_costo, vecino))
+    
+    padres_cerrados = {nodo: padres[nodo] for nodo in distancias}
+    return distancias, padres_cerrados
+
+def reconstruir_ruta(padres, destino):
+    """Reconstruye la ruta inicio -> destino a partir del mapa de padres."""
+    if destino not in padres:
+        return None
+    ruta = []
+    actual = destino
+    while actual is not None:
+        ruta.append(actual)
+        actual = padres[actual]
+    return list(reversed(ruta))
+
 # Definición del grafo: Nodo -> {Vecino: Costo_Arista}
 # A -> C tiene un costo más alto (4) que A -> B (1), lo que afecta la ruta
 mapa_con_costos = {
@@ -56,4 +110,16 @@ print("Grafo con costos (Mapa):")
 for nodo, vecinos in mapa_con_costos.items():
     print(f"  {nodo}: {vecinos}")
 print("-" * 30)
-print(f"Resultado de la búsqueda UCS (A → G): {resultado_ucs}")
\ No newline at end of file
+print(f"Resultado de la búsqueda UCS (A → G): {resultado_ucs}")
+
+# Una sola expansión responde consultas hacia varios destinos
+distancias, padres = ucs_arbol(mapa_con_costos, 'A', objetivos={'D', 'F', 'G'})
+print("-" * 30)
+print("Árbol de rutas más cortas desde A (objetivos D, F, G):")
+for destino in ('D', 'F', 'G'):
+    print(f"  A → {destino}: {' → '.join(reconstruir_ruta(padres, destino))} (costo {distancias[destino]})")
+
+distancias, padres = ucs_arbol(mapa_con_costos, 'A', objetivos={'F', 'G'}, detener_en_primero=True)
+# Con detener_en_primero solo queda cerrado el objetivo más cercano
+primero = next(d for d in ('F', 'G') if d in distancias)
+print(f"Objetivo más cercano entre F y G: {primero} (costo {distancias[primero]})")
\ No newline at end of file
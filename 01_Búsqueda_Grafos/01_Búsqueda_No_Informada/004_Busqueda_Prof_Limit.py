@@ -1,10 +1,13 @@
 # Búsqueda en Profundidad Limitada (DLS)
 
-def dls_recursivo(grafo, nodo_actual, objetivo, limite_actual, limite_maximo):
+def dls_recursivo(grafo, nodo_actual, objetivo, limite_actual, limite_maximo, observador=None):
     """
     Función recursiva para la Búsqueda en Profundidad Limitada.
+    observador(evento, nodo, dato) es opcional: recibe ('expandir', nodo, profundidad)
+    en cada visita. Sin observador no se hace ningún trabajo extra.
     """
-    print(f"  Visitando: {nodo_actual} (Profundidad: {limite_actual})")
+    if observador is not None:
+        observador('expandir', nodo_actual, limite_actual)
 
     # 1. PRUEBA DE OBJETIVO
     if nodo_actual == objetivo:
@@ -17,7 +20,7 @@ def dls_recursivo(grafo, nodo_actual, objetivo, limite_actual, limite_maximo):
     # 3. EXPLORACIÓN RECURSIVA
     for vecino in grafo.get(nodo_actual, []):
         # Llamada recursiva, incrementando la profundidad
-        resultado = dls_recursivo(grafo, vecino, objetivo, limite_actual + 1, limite_maximo)
+        resultado = dls_recursivo(grafo, vecino, objetivo, limite_actual + 1, limite_maximo, observador)
         
         # Si la llamada recursiva encontró el objetivo, se detiene y devuelve el resultado.
         if isinstance(resultado, str) and resultado.startswith("¡Objetivo"):
@@ -43,7 +46,10 @@ print(f"Grafo (Mapa): {mapa_profundo}")
 print(f"Límite de Profundidad (L): {LIMITE_DE_BUSQUEDA}")
 print("-" * 40)
 
-resultado_dls = dls_recursivo(mapa_profundo, 'A', 'G', 0, LIMITE_DE_BUSQUEDA)
+def imprimir_visita(evento, nodo, profundidad):
+    print(f"  Visitando: {nodo} (Profundidad: {profundidad})")
+
+resultado_dls = dls_recursivo(mapa_profundo, 'A', 'G', 0, LIMITE_DE_BUSQUEDA, observador=imprimir_visita)
 
 print("-" * 40)
 print(f"Resultado final DLS: {resultado_dls}")
\ No newline at end of file
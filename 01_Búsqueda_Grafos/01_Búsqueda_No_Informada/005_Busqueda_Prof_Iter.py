@@ -45,6 +45,87 @@ def ids(grafo, inicio, objetivo, limite_maximo_total):
             
     return "Búsqueda terminada."
 
+_FIN = object()  # Centinela: el iterador de vecinos se agotó
+
+def dls_iterativo(grafo, inicio, objetivo, limite_maximo):
+    """
+    DLS con pila explícita (sin recursión) y tabla de transposición.
+    Cada marco de la pila es (nodo, iterador_de_vecinos); la ruta actual son
+    los nodos de la pila. La tabla mejor_profundidad guarda la profundidad
+    mínima a la que se expandió cada nodo en ESTA iteración: si se vuelve a
+    alcanzar a igual o mayor profundidad, su subárbol ya fue explorado con
+    al menos el mismo presupuesto y se poda.
+    Devuelve un diccionario con la ruta (o None), la profundidad, los nodos
+    expandidos y si la búsqueda fue cortada por el límite.
+    """
+    resultado = {'ruta': None, 'profundidad': None, 'nodos_expandidos': 0, 'corte': False}
+    if inicio == objetivo:
+        resultado.update(ruta=[inicio], profundidad=0)
+        return resultado
+    if limite_maximo == 0:
+        resultado['corte'] = bool(grafo.get(inicio))
+        return resultado
+
+    mejor_profundidad = {inicio: 0}
+    pila = [(inicio, iter(grafo.get(inicio, [])))]
+    resultado['nodos_expandidos'] = 1
+
+    while pila:
+        vecino = next(pila[-1][1], _FIN)
+        if vecino is _FIN:
+            pila.pop()  # Retroceso: todos los vecinos del nodo fueron explorados
+            continue
+
+        profundidad = len(pila)  # Profundidad del vecino
+        # 1. PRUEBA DE OBJETIVO (al generar el nodo)
+        if vecino == objetivo:
+            resultado['ruta'] = [nodo for nodo, _ in pila] + [vecino]
+            resultado['profundidad'] = profundidad
+            return resultado
+
+        # 2. PRUEBA DE LÍMITE
+        if profundidad == limite_maximo:
+            if grafo.get(vecino):
+                resultado['corte'] = True
+            continue
+
+        # 3. PODA POR TRANSPOSICIÓN: ya expandido a una profundidad menor o igual
+        if mejor_profundidad.get(vecino, limite_maximo + 1) <= profundidad:
+            continue
+
+        # 4. EXPANSIÓN: apila el vecino con su propio iterador
+        mejor_profundidad[vecino] = profundidad
+        resultado['nodos_expandidos'] += 1
+        pila.append((vecino, iter(grafo.get(vecino, []))))
+
+    return resultado
+
+def ids_iterativo(grafo, inicio, objetivo, limite_maximo_total):
+    """
+    IDS sin recursión ni impresiones: llama a dls_iterativo con límites crecientes.
+    Termina antes del límite máximo si una iteración no fue cortada (el grafo
+    alcanzable ya se exploró por completo).
+    Devuelve {'ruta', 'profundidad', 'nodos_expandidos', 'iteraciones'}.
+    """
+    # Resultado "no encontrado" por si no se ejecuta ninguna iteración (límite negativo)
+    resultado = {'ruta': None, 'profundidad': None}
+    total_expandidos = 0
+    iteraciones = 0
+    for limite in range(limite_maximo_total + 1):
+        resultado = dls_iterativo(grafo, inicio, objetivo, limite)
+        total_expandidos += resultado['nodos_expandidos']
+        iteraciones += 1
+
+        if resultado['ruta'] is not None or not resultado['corte']:
+            break
+
+    return {
+        'ruta': resultado['ruta'],
+        'profundidad': resultado['profundidad'],
+        'nodos_expandidos': total_expandidos,
+        'iteraciones': iteraciones,
+    }
+
 # Definición del grafo:
 mapa = {
     'A': ['B', 'C'], # Nivel 0
@@ -63,4 +144,17 @@ print(f"Grafo (Mapa): {mapa}")
 resultado_ids = ids(mapa, 'A', 'G', LIMITE_MAXIMO_PERMITIDO)
 
 print("\n" + "=" * 40)
-print(f"Resultado final IDS: {resultado_ids}")
\ No newline at end of file
+print(f"Resultado final IDS: {resultado_ids}")
+
+# Versión iterativa (pila explícita): devuelve un resultado estructurado
+resultado_iterativo = ids_iterativo(mapa, 'A', 'G', LIMITE_MAXIMO_PERMITIDO)
+print(f"IDS iterativo: ruta {' → '.join(resultado_iterativo['ruta'])}, "
+      f"profundidad {resultado_iterativo['profundidad']}, "
+      f"{resultado_iterativo['nodos_expandidos']} nodos expandidos en "
+      f"{resultado_iterativo['iteraciones']} iteraciones")
+
+# Un grafo con ciclos y una cadena muy profunda ya no desborda la recursión
+cadena = {i: [i + 1, 0] for i in range(5000)}
+resultado_profundo = dls_iterativo(cadena, 0, 5000, 5000)
+print(f"Cadena de 5000 nodos (DLS, L=5000): profundidad {resultado_profundo['profundidad']}, "
+      f"{resultado_profundo['nodos_expandidos']} nodos expandidos")
\ No newline at end of file
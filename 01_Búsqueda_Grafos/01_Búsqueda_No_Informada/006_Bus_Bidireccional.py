@@ -1,5 +1,6 @@
 # Búsqueda Bidireccional (Bidirectional Search)
 
+import heapq
 from collections import deque
 
 def revertir_grafo(grafo_dirigido):
@@ -91,6 +92,99 @@ def reconstruir_ruta(padres_f, padres_b, interseccion, inicio, objetivo):
     return f"¡Ruta encontrada! Intersección en '{interseccion}'. Ruta: {' → '.join(ruta_final)}"
 
 
+class BusquedaBidireccional:
+    """
+    Búsqueda bidireccional reutilizable sobre un grafo dirigido (con o sin costos).
+    - El índice inverso (predecesores) se construye UNA vez y se mantiene
+      sincronizado al agregar o eliminar aristas.
+    - En cada paso se expande la frontera MÁS PEQUEÑA.
+    - Con costos usa Dijkstra en ambos sentidos y se detiene cuando
+      tope_adelante + tope_atras >= mejor costo encontrado (criterio correcto).
+    """
+
+    def __init__(self, grafo):
+        # Normaliza a {nodo: {vecino: costo}}; las listas tienen costo 1
+        self.sucesores = {}
+        self.predecesores = {}
+        for nodo, vecinos in grafo.items():
+            self.sucesores.setdefault(nodo, {})
+            self.predecesores.setdefault(nodo, {})
+            costos = vecinos if isinstance(vecinos, dict) else dict.fromkeys(vecinos, 1)
+            for vecino, costo in costos.items():
+                self.agregar_arista(nodo, vecino, costo)
+
+    def agregar_arista(self, origen, destino, costo=1):
+        self.sucesores.setdefault(origen, {})[destino] = costo
+        self.predecesores.setdefault(destino, {})[origen] = costo
+        self.sucesores.setdefault(destino, {})
+        self.predecesores.setdefault(origen, {})
+
+    def eliminar_arista(self, origen, destino):
+        del self.sucesores[origen][destino]
+        del self.predecesores[destino][origen]
+
+    def buscar(self, inicio, objetivo):
+        """
+        Devuelve {'ruta', 'costo', 'nodos_expandidos'}; ruta es None si no hay camino.
+        """
+        if inicio == objetivo:
+            return {'ruta': [inicio], 'costo': 0, 'nodos_expandidos': 0}
+
+        # Índice 0: hacia adelante (sucesores); índice 1: hacia atrás (predecesores)
+        adyacencias = (self.sucesores, self.predecesores)
+        distancias = ({inicio: 0}, {objetivo: 0})
+        padres = ({inicio: None}, {objetivo: None})
+        colas = ([(0, inicio)], [(0, objetivo)])
+        cerrados = (set(), set())
+        mejor_costo = float('inf')
+        nodo_encuentro = None
+        nodos_expandidos = 0
+
+        while colas[0] and colas[1]:
+            # 1. CRITERIO DE PARADA: ningún camino pendiente puede mejorar al mejor
+            if colas[0][0][0] + colas[1][0][0] >= mejor_costo:
+                break
+
+            # 2. BALANCEO: expande el lado con la frontera más pequeña
+            lado = 0 if len(colas[0]) <= len(colas[1]) else 1
+            opuesto = 1 - lado
+            costo_actual, nodo_actual = heapq.heappop(colas[lado])
+            if nodo_actual in cerrados[lado] or costo_actual > distancias[lado][nodo_actual]:
+                continue  # Entrada obsoleta
+            cerrados[lado].add(nodo_actual)
+            nodos_expandidos += 1
+
+            # 3. RELAJACIÓN y detección de encuentros con la búsqueda opuesta
+            for vecino, costo_arista in adyacencias[lado].get(nodo_actual, {}).items():
+                nuevo_costo = costo_actual + costo_arista
+                if nuevo_costo < distancias[lado].get(vecino, float('inf')):
+                    distancias[lado][vecino] = nuevo_costo
+                    padres[lado][vecino] = nodo_actual
+                    heapq.heappush(colas[lado], (nuevo_costo, vecino))
+                if vecino in distancias[opuesto]:
+                    costo_total = distancias[lado][vecino] + distancias[opuesto][vecino]
+                    if costo_total < mejor_costo:
+                        mejor_costo = costo_total
+                        nodo_encuentro = vecino
+
+        if nodo_encuentro is None:
+            return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': nodos_expandidos}
+
+        # 4. RECONSTRUCCIÓN: inicio -> encuentro (padres hacia adelante) + encuentro -> objetivo
+        ruta = []
+        actual = nodo_encuentro
+        while actual is not None:
+            ruta.append(actual)
+            actual = padres[0][actual]
+        ruta.reverse()
+        actual = padres[1][nodo_encuentro]
+        while actual is not None:
+            ruta.append(actual)
+            actual = padres[1][actual]
+
+        return {'ruta': ruta, 'costo': mejor_costo, 'nodos_expandidos': nodos_expandidos}
+
+
 # Definición del grafo simple (dirigido)
 mapa = {
     'A': ['B', 'G'],
@@ -119,4 +213,27 @@ print("-" * 50)
 resultado = buscar_bidireccionalmente(mapa, INICIO, OBJETIVO)
 
 print(f"Búsqueda Bidireccional ({INICIO} → {OBJETIVO}):")
-print(resultado)
\ No newline at end of file
+print(resultado)
+
+# Objeto reutilizable: el índice inverso se construye una sola vez
+print("-" * 50)
+buscador = BusquedaBidireccional(mapa)
+resultado_obj = buscador.buscar(INICIO, OBJETIVO)
+print(f"BusquedaBidireccional: {' → '.join(resultado_obj['ruta'])} "
+      f"(costo {resultado_obj['costo']}, {resultado_obj['nodos_expandidos']} nodos expandidos)")
+
+# Cambios incrementales: se agrega un atajo G → M y se elimina B → H
+buscador.agregar_arista('G', 'M')
+buscador.eliminar_arista('B', 'H')
+resultado_obj = buscador.buscar(INICIO, OBJETIVO)
+print(f"Tras agregar G → M y quitar B → H: {' → '.join(resultado_obj['ruta'])} "
+      f"(costo {resultado_obj['costo']})")
+
+# Aristas con costo: el atajo directo A → M es más caro que el camino largo
+buscador_costos = BusquedaBidireccional({
+    'A': {'B': 1, 'M': 10},
+    'B': {'C': 2},
+    'C': {'M': 3},
+})
+resultado_obj = buscador_costos.buscar('A', 'M')
+print(f"Con costos: {' → '.join(resultado_obj['ruta'])} (costo {resultado_obj['costo']})")
\ No newline at end of file
@@ -0,0 +1,214 @@
+# Grafo Compilado en Formato CSR (Compressed Sparse Row)
+
+import heapq
+import numpy as np
+
+class GrafoCSR:
+    """
+    Representación compacta de un grafo dirigido.
+    La lista de adyacencia (diccionario de listas o de diccionarios) se convierte
+    UNA sola vez en tres arreglos de numpy:
+      - offsets: los vecinos del nodo i están en vecinos[offsets[i]:offsets[i + 1]]
+      - vecinos: ids enteros de los nodos destino
+      - pesos:   costo de cada arista (1.0 si el grafo no tiene costos)
+    Además guarda una tabla de internado nombre <-> id entero.
+    """
+
+    def __init__(self, nombres, offsets, vecinos, pesos):
+        self.nombres = nombres                                    # id -> nombre
+        self.indices = {nombre: i for i, nombre in enumerate(nombres)}  # nombre -> id
+        self.offsets = offsets
+        self.vecinos = vecinos
+        self.pesos = pesos
+
+    @classmethod
+    def desde_diccionario(cls, grafo):
+        """Compila un grafo {nodo: [vecinos]} o {nodo: {vecino: costo}}."""
+        # 1. Internado: asigna un id entero a cada nodo (incluye los que solo aparecen como destino)
+        indices = {}
+        for nodo, adyacentes in grafo.items():
+            indices.setdefault(nodo, len(indices))
+            for vecino in adyacentes:
+                indices.setdefault(vecino, len(indices))
+        nombres = list(indices)
+        n = len(nombres)
+
+        # 2. Grados de salida -> offsets (suma acumulada)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        for nodo, adyacentes in grafo.items():
+            offsets[indices[nodo] + 1] = len(adyacentes)
+        np.cumsum(offsets, out=offsets)
+
+        # 3. Relleno de los arreglos de vecinos y pesos
+        vecinos = np.empty(offsets[-1], dtype=np.int32)
+        pesos = np.ones(offsets[-1], dtype=np.float64)
+        for nodo, adyacentes in grafo.items():
+            inicio = offsets[indices[nodo]]
+            fin = inicio + len(adyacentes)
+            vecinos[inicio:fin] = [indices[v] for v in adyacentes]
+            if isinstance(adyacentes, dict):
+                pesos[inicio:fin] = list(adyacentes.values())
+
+        return cls(nombres, offsets, vecinos, pesos)
+
+    @property
+    def num_nodos(self):
+        return len(self.nombres)
+
+    @property
+    def num_aristas(self):
+        return len(self.vecinos)
+
+    def indice(self, nombre):
+        return self.indices[nombre]
+
+    def vecinos_de(self, i):
+        """Devuelve (ids_vecinos, pesos) del nodo i como vistas sin copia."""
+        inicio, fin = self.offsets[i], self.offsets[i + 1]
+        return self.vecinos[inicio:fin], self.pesos[inicio:fin]
+
+    def reconstruir_ruta(self, padres, destino):
+        """Sigue el arreglo de padres (-1 = sin padre) y traduce los ids a nombres."""
+        ruta = []
+        actual = destino
+        while actual != -1:
+            ruta.append(self.nombres[actual])
+            actual = padres[actual]
+        ruta.reverse()
+        return ruta
+
+
+def bfs_csr(grafo, inicio, objetivo):
+    """
+    BFS por niveles sobre el grafo CSR.
+    Cada nivel se expande de forma vectorizada (todos los vecinos de la frontera
+    a la vez) conservando el orden FIFO de la BFS clásica.
+    Devuelve la ruta (lista de nombres) o None si el objetivo no es alcanzable.
+    """
+    origen, destino = grafo.indice(inicio), grafo.indice(objetivo)
+    padres = np.full(grafo.num_nodos, -1, dtype=np.int32)
+    visitados = np.zeros(grafo.num_nodos, dtype=bool)
+    visitados[origen] = True
+    frontera = np.array([origen], dtype=np.int64)
+
+    while frontera.size and not visitados[destino]:
+        # 1. Rangos de vecinos de cada nodo de la frontera
+        inicios = grafo.offsets[frontera]
+        grados = grafo.offsets[frontera + 1] - inicios
+        total = int(grados.sum())
+        if total == 0:
+            break
+
+        # 2. Posiciones de todos los vecinos concatenados (en orden de la frontera)
+        desplazamientos = np.repeat(inicios - (np.cumsum(grados) - grados), grados)
+        candidatos = grafo.vecinos[np.arange(total) + desplazamientos]
+        origenes = np.repeat(frontera, grados)
+
+        # 3. Filtra los ya visitados y conserva la PRIMERA aparición de cada nodo
+        nuevos = ~visitados[candidatos]
+        candidatos, origenes = candidatos[nuevos], origenes[nuevos]
+        _, primeros = np.unique(candidatos, return_index=True)
+        primeros.sort()
+        frontera = candidatos[primeros].astype(np.int64)
+
+        visitados[frontera] = True
+        padres[frontera] = origenes[primeros]
+
+    if not visitados[destino]:
+        return None
+    return grafo.reconstruir_ruta(padres, destino)
+
+
+def dfs_csr(grafo, inicio, objetivo):
+    """
+    DFS con pila explícita sobre el grafo CSR (mismo orden de exploración que dfs).
+    Devuelve la ruta encontrada o None.
+    """
+    origen, destino = grafo.indice(inicio), grafo.indice(objetivo)
+    padres = np.full(grafo.num_nodos, -1, dtype=np.int32)
+    visitados = np.zeros(grafo.num_nodos, dtype=bool)
+    visitados[origen] = True
+    pila = [origen]
+
+    while pila:
+        nodo_actual = pila.pop()
+        if nodo_actual == destino:
+            return grafo.reconstruir_ruta(padres, destino)
+
+        ids_vecinos, _ = grafo.vecinos_de(nodo_actual)
+        # Orden inverso para que el primer vecino sea el primero en salir de la pila
+        for vecino in ids_vecinos[::-1].tolist():
+            if not visitados[vecino]:
+                visitados[vecino] = True
+                padres[vecino] = nodo_actual
+                pila.append(vecino)
+
+    return None
+
+
+def ucs_csr(grafo, inicio, objetivo):
+    """
+    Búsqueda de Costo Uniforme sobre el grafo CSR.
+    Devuelve (ruta, costo) o (None, inf) si el objetivo no es alcanzable.
+    """
+    origen, destino = grafo.indice(inicio), grafo.indice(objetivo)
+    costos = np.full(grafo.num_nodos, np.inf)
+    padres = np.full(grafo.num_nodos, -1, dtype=np.int32)
+    costos[origen] = 0.0
+    cola_prioridad = [(0.0, origen)]
+
+    while cola_prioridad:
+        costo_actual, nodo_actual = heapq.heappop(cola_prioridad)
+        if costo_actual > costos[nodo_actual]:
+            continue  # Entrada obsoleta: ya se encontró un camino más barato
+
+        if nodo_actual == destino:
+            return grafo.reconstruir_ruta(padres, destino), costo_actual
+
+        ids_vecinos, pesos = grafo.vecinos_de(nodo_actual)
+        for vecino, costo_arista in zip(ids_vecinos.tolist(), pesos.tolist()):
+            nuevo_costo = costo_actual + costo_arista
+            if nuevo_costo < costos[vecino]:
+                costos[vecino] = nuevo_costo
+                padres[vecino] = nodo_actual
+                heapq.heappush(cola_prioridad, (nuevo_costo, vecino))
+
+    return None, float('inf')
+
+
+# Mismos grafos de ejemplo que BFS/DFS y UCS
+mapa_simple = {
+    'A': ['B', 'C'],
+    'B': ['D'],
+    'C': ['E', 'F'],
+    'D': [],
+    'E': ['G'],
+    'F': [],
+    'G': [] # Objetivo
+}
+
+mapa_con_costos = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 5, 'E': 2},
+    'C': {'F': 3},
+    'D': {'G': 1},
+    'E': {'G': 8},
+    'F': {},
+    'G': {} # Objetivo
+}
+
+grafo_simple = GrafoCSR.desde_diccionario(mapa_simple)
+grafo_costos = GrafoCSR.desde_diccionario(mapa_con_costos)
+
+print(f"Nodos (id -> nombre): {grafo_simple.nombres}")
+print(f"offsets: {grafo_simple.offsets.tolist()}")
+print(f"vecinos: {grafo_simple.vecinos.tolist()}")
+print("-" * 40)
+
+ruta_bfs = bfs_csr(grafo_simple, 'A', 'G')
+ruta_dfs = dfs_csr(grafo_simple, 'A', 'G')
+ruta_ucs, costo_ucs = ucs_csr(grafo_costos, 'A', 'G')
+
+print(f"BFS CSR (A → G): {' → '.join(ruta_bfs)}")
+print(f"DFS CSR (A → G): {' → '.join(ruta_dfs)}")
+print(f"UCS CSR (A → G): {' → '.join(ruta_ucs)} (costo {costo_ucs})")
@@ -0,0 +1,141 @@
+# BFS Multifuente por Niveles con Conjuntos de Bits (Bitset BFS)
+
+import contextlib
+import io
+import os
+import runpy
+import time
+from collections import deque
+import numpy as np
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+BITS_POR_PALABRA = 64  # Cada palabra uint64 representa hasta 64 fuentes a la vez
+
+def compilar_csr(grafo):
+    """
+    Convierte {nodo: [vecinos]} en (nombres, offsets, vecinos) con ids enteros.
+    Los vecinos del nodo i están en vecinos[offsets[i]:offsets[i + 1]].
+    Reutiliza GrafoCSR.desde_diccionario de 008_Grafo_CSR.py, cargado con runpy
+    y con su demostración silenciada (como en 012_Benchmark_Busquedas.py).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        espacio = runpy.run_path(os.path.join(DIRECTORIO, "008_Grafo_CSR.py"), run_name="grafo_csr")
+    grafo_csr = espacio['GrafoCSR'].desde_diccionario(grafo)
+    return grafo_csr.nombres, grafo_csr.offsets, grafo_csr.vecinos
+
+def _bfs_lote(offsets, vecinos, fuentes, distancias):
+    """
+    BFS sincronizada por niveles para un lote de hasta 64 fuentes.
+    frontera[v] y visitados[v] son palabras uint64: el bit j indica que la
+    fuente j del lote tiene al nodo v en su frontera / ya lo visitó.
+    Escribe los niveles en las filas correspondientes de 'distancias'.
+    """
+    n = len(offsets) - 1
+    frontera = np.zeros(n, dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), np.arange(len(fuentes), dtype=np.uint64))
+    np.bitwise_or.at(frontera, fuentes, bits)  # Varias fuentes pueden ser el mismo nodo
+    visitados = frontera.copy()
+    distancias[np.arange(len(fuentes)), fuentes] = 0
+    desplazamientos_bits = np.arange(BITS_POR_PALABRA, dtype=np.uint64)
+
+    nivel = 0
+    while True:
+        nivel += 1
+        # 1. Nodos activos (alguna fuente los tiene en su frontera) y sus aristas
+        activos = np.flatnonzero(frontera)
+        if activos.size == 0:
+            break
+        inicios = offsets[activos]
+        grados = offsets[activos + 1] - inicios
+        total = int(grados.sum())
+        if total == 0:
+            break
+        posiciones = np.arange(total) + np.repeat(inicios - (np.cumsum(grados) - grados), grados)
+
+        # 2. Propagación paralela por palabra: OR de las fronteras de origen en cada destino
+        siguiente = np.zeros(n, dtype=np.uint64)
+        np.bitwise_or.at(siguiente, vecinos[posiciones], np.repeat(frontera[activos], grados))
+
+        # 3. Solo bits nuevos: descarta lo que cada fuente ya había visitado
+        siguiente &= ~visitados
+        visitados |= siguiente
+        frontera = siguiente
+
+        # 4. Desempaqueta los bits nuevos para registrar la distancia (fuente, nodo)
+        alcanzados = np.flatnonzero(siguiente)
+        if alcanzados.size:
+            matriz_bits = (siguiente[alcanzados, None] >> desplazamientos_bits) & np.uint64(1)
+            filas, columnas = np.nonzero(matriz_bits)
+            distancias[columnas, alcanzados[filas]] = nivel
+
+def bfs_multifuente(grafo_csr, fuentes):
+    """
+    Distancias en saltos desde cada fuente hacia todos los nodos.
+    Procesa las fuentes en lotes de 64 (un bit por fuente en cada palabra).
+    Devuelve una matriz int32 (len(fuentes) x n); -1 significa no alcanzable.
+    """
+    nombres, offsets, vecinos = grafo_csr
+    fuentes = np.asarray(fuentes, dtype=np.int64)
+    distancias = np.full((len(fuentes), len(nombres)), -1, dtype=np.int32)
+
+    for inicio in range(0, len(fuentes), BITS_POR_PALABRA):
+        lote = fuentes[inicio:inicio + BITS_POR_PALABRA]
+        _bfs_lote(offsets, vecinos, lote, distancias[inicio:inicio + len(lote)])
+    return distancias
+
+def bfs_distancias(grafo, inicio):
+    """BFS clásica (deque + set) de una sola fuente, como referencia."""
+    distancias = {inicio: 0}
+    cola = deque([inicio])
+    while cola:
+        nodo_actual = cola.popleft()
+        for vecino in grafo.get(nodo_actual, []):
+            if vecino not in distancias:
+                distancias[vecino] = distancias[nodo_actual] + 1
+                cola.append(vecino)
+    return distancias
+
+
+# Definición de un grafo simple (el mismo de BFS)
+mapa_simple = {
+    'A': ['B', 'C'],
+    'B': ['D'],
+    'C': ['E', 'F'],
+    'D': [],
+    'E': ['G'],
+    'F': [],
+    'G': []
+}
+
+grafo_csr = compilar_csr(mapa_simple)
+nombres = grafo_csr[0]
+matriz = bfs_multifuente(grafo_csr, range(len(nombres)))
+
+print(f"Grafo (Mapa): {mapa_simple}")
+print("Matriz de distancias en saltos (-1 = no alcanzable):")
+print("     " + "  ".join(f"{n:>2}" for n in nombres))
+for nombre, fila in zip(nombres, matriz):
+    print(f"  {nombre}: " + "  ".join(f"{d:>2}" for d in fila))
+print("-" * 40)
+
+# Comparación con BFS repetida sobre un grafo aleatorio disperso
+rng = np.random.default_rng(0)
+N, GRADO, FUENTES = 20000, 4, 128
+mapa_grande = {i: rng.integers(0, N, GRADO).tolist() for i in range(N)}
+grafo_grande = compilar_csr(mapa_grande)
+indices = {nombre: i for i, nombre in enumerate(grafo_grande[0])}
+
+t0 = time.perf_counter()
+matriz_grande = bfs_multifuente(grafo_grande, [indices[f] for f in range(FUENTES)])
+t_bits = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+referencia = [bfs_distancias(mapa_grande, f) for f in range(FUENTES)]
+t_clasica = time.perf_counter() - t0
+
+coinciden = all(
+    len(ref) == int((fila >= 0).sum()) and all(fila[indices[nodo]] == d for nodo, d in ref.items())
+    for ref, fila in zip(referencia, matriz_grande)
+)
+print(f"{FUENTES} fuentes en {N} nodos: bitset {t_bits:.2f}s vs BFS repetida {t_clasica:.2f}s "
+      f"(resultados idénticos: {coinciden})")
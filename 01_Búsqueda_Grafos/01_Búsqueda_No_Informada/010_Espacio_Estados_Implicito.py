@@ -0,0 +1,289 @@
+# Búsqueda en Espacios de Estados Implícitos (sin materializar el grafo)
+
+import hashlib
+import heapq
+import pickle
+from collections import deque
+import numpy as np
+
+MASCARA_64 = (1 << 64) - 1
+MEZCLA = 0x9E3779B97F4A7C15  # Constante de Fibonacci para dispersar los bits de la huella
+
+def splitmix64(valor):
+    """Mezclador biyectivo de 64 bits (finalizador de SplitMix64)."""
+    valor = (valor + MEZCLA) & MASCARA_64
+    valor = ((valor ^ (valor >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+    valor = ((valor ^ (valor >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+    return valor ^ (valor >> 31)
+
+def huella_64(estado, clave):
+    """
+    Huella de 64 bits del estado a partir de su clave canónica.
+    Dos estados con la misma clave se consideran el mismo nodo.
+    No se usa hash() sobre enteros ni tuplas: hash(-1) == hash(-2) y
+    hash(n) == hash(n + 2^61 - 1), choques sistemáticos en espacios corrientes.
+    Los enteros de [0, 2^64) se mezclan por su valor exacto con SplitMix64
+    (biyectiva: no chocan entre sí). El resto de claves, incluidos los enteros
+    negativos o mayores, pasan por un resumen blake2b de 8 bytes de su
+    serialización (la clave debe ser canónica: tuplas, enteros, cadenas...);
+    así -1 y 2^64 - 1 no comparten huella.
+    """
+    valor = clave(estado)
+    if type(valor) is int and 0 <= valor <= MASCARA_64:
+        return splitmix64(valor)
+    resumen = hashlib.blake2b(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL), digest_size=8)
+    return int.from_bytes(resumen.digest(), 'little')
+
+class ConjuntoHuellas:
+    """
+    Conjunto cerrado compacto: tabla hash de direccionamiento abierto sobre un
+    arreglo uint64 (8 bytes por casilla) en lugar de un set de estados completos.
+    El 0 marca las casillas vacías; la huella 0, que es legítima, se guarda
+    aparte en un indicador en lugar de confundirse con otra.
+    """
+
+    def __init__(self, capacidad=1024):
+        self._tabla = np.zeros(capacidad, dtype=np.uint64)
+        self._bits = capacidad.bit_length() - 1
+        self._cantidad = 0
+        self._tiene_cero = False
+
+    def __len__(self):
+        return self._cantidad + self._tiene_cero
+
+    def _posicion(self, huella):
+        return ((huella * MEZCLA) & MASCARA_64) >> (64 - self._bits)
+
+    def agregar(self, huella):
+        """Inserta la huella; devuelve True si era nueva, False si ya estaba."""
+        if huella == 0:
+            nueva, self._tiene_cero = not self._tiene_cero, True
+            return nueva
+        if 2 * (self._cantidad + 1) > len(self._tabla):
+            self._crecer()
+        mascara = len(self._tabla) - 1
+        i = self._posicion(huella)
+        while True:
+            actual = int(self._tabla[i])
+            if actual == 0:
+                self._tabla[i] = huella
+                self._cantidad += 1
+                return True
+            if actual == huella:
+                return False
+            i = (i + 1) & mascara  # Sondeo lineal
+
+    def __contains__(self, huella):
+        if huella == 0:
+            return self._tiene_cero
+        mascara = len(self._tabla) - 1
+        i = self._posicion(huella)
+        while True:
+            actual = int(self._tabla[i])
+            if actual == 0:
+                return False
+            if actual == huella:
+                return True
+            i = (i + 1) & mascara
+
+    def _crecer(self):
+        huellas = self._tabla[self._tabla != 0].tolist()
+        self._tabla = np.zeros(2 * len(self._tabla), dtype=np.uint64)
+        self._bits += 1
+        self._cantidad = 0
+        for huella in huellas:
+            self.agregar(huella)
+
+_FIN = object()  # Centinela: el iterador de sucesores se agotó
+
+def _ruta(nodo):
+    """Los nodos de búsqueda son tuplas enlazadas (estado, nodo_padre)."""
+    ruta = []
+    while nodo is not None:
+        ruta.append(nodo[0])
+        nodo = nodo[1]
+    return list(reversed(ruta))
+
+def bfs_implicito(inicio, es_objetivo, sucesores, clave=lambda estado: estado):
+    """
+    BFS sobre un espacio implícito. sucesores(estado) genera los estados vecinos.
+    Devuelve {'ruta', 'nodos_expandidos', 'estados_alcanzados'}.
+    """
+    cerrados = ConjuntoHuellas()
+    cerrados.agregar(huella_64(inicio, clave))
+    cola = deque([(inicio, None)])
+    expandidos = 0
+
+    while cola:
+        nodo = cola.popleft()
+        if es_objetivo(nodo[0]):
+            return {'ruta': _ruta(nodo), 'nodos_expandidos': expandidos, 'estados_alcanzados': len(cerrados)}
+        expandidos += 1
+        for vecino in sucesores(nodo[0]):
+            if cerrados.agregar(huella_64(vecino, clave)):
+                cola.append((vecino, nodo))
+
+    return {'ruta': None, 'nodos_expandidos': expandidos, 'estados_alcanzados': len(cerrados)}
+
+def dfs_implicito(inicio, es_objetivo, sucesores, clave=lambda estado: estado):
+    """DFS con pila explícita sobre un espacio implícito (mismo formato de resultado que bfs_implicito)."""
+    cerrados = ConjuntoHuellas()
+    cerrados.agregar(huella_64(inicio, clave))
+    pila = [(inicio, None)]
+    expandidos = 0
+
+    while pila:
+        nodo = pila.pop()
+        if es_objetivo(nodo[0]):
+            return {'ruta': _ruta(nodo), 'nodos_expandidos': expandidos, 'estados_alcanzados': len(cerrados)}
+        expandidos += 1
+        for vecino in reversed(list(sucesores(nodo[0]))):
+            if cerrados.agregar(huella_64(vecino, clave)):
+                pila.append((vecino, nodo))
+
+    return {'ruta': None, 'nodos_expandidos': expandidos, 'estados_alcanzados': len(cerrados)}
+
+def ucs_implicito(inicio, es_objetivo, sucesores, clave=lambda estado: estado):
+    """
+    UCS sobre un espacio implícito. sucesores(estado) genera pares (vecino, costo).
+    Un estado se cierra al salir del heap. Solo se encola un sucesor si no está
+    cerrado y mejora el mejor g conocido de los estados abiertos (un dict por
+    huella que se vacía al cerrar), así que el heap crece con la frontera y no
+    con cada arista generada.
+    Devuelve {'ruta', 'costo', 'nodos_expandidos', 'estados_alcanzados'}.
+    """
+    cerrados = ConjuntoHuellas()
+    contador = 0  # Desempate: evita comparar estados dentro del heap
+    huella_inicio = huella_64(inicio, clave)
+    mejor_g = {huella_inicio: 0}  # Solo estados abiertos
+    cola_prioridad = [(0, contador, huella_inicio, (inicio, None))]
+
+    while cola_prioridad:
+        costo_actual, _, huella, nodo = heapq.heappop(cola_prioridad)
+        if huella in cerrados or costo_actual > mejor_g[huella]:
+            continue  # Entrada obsoleta: ya cerrado o mejorado después de encolarla
+        cerrados.agregar(huella)
+        del mejor_g[huella]
+        if es_objetivo(nodo[0]):
+            return {'ruta': _ruta(nodo), 'costo': costo_actual,
+                    'nodos_expandidos': len(cerrados) - 1, 'estados_alcanzados': len(cerrados)}
+        for vecino, costo_arista in sucesores(nodo[0]):
+            huella_vecino = huella_64(vecino, clave)
+            if huella_vecino in cerrados:
+                continue
+            nuevo_costo = costo_actual + costo_arista
+            if nuevo_costo >= mejor_g.get(huella_vecino, float('inf')):
+                continue
+            mejor_g[huella_vecino] = nuevo_costo
+            contador += 1
+            heapq.heappush(cola_prioridad, (nuevo_costo, contador, huella_vecino, (vecino, nodo)))
+
+    return {'ruta': None, 'costo': float('inf'),
+            'nodos_expandidos': len(cerrados), 'estados_alcanzados': len(cerrados)}
+
+def ids_implicito(inicio, es_objetivo, sucesores, limite_maximo_total, clave=lambda estado: estado):
+    """
+    IDS con pila explícita. La tabla de transposición guarda, por huella,
+    la menor profundidad a la que se expandió el estado en la iteración actual.
+    Devuelve {'ruta', 'profundidad', 'nodos_expandidos'}.
+    """
+    if es_objetivo(inicio):
+        return {'ruta': [inicio], 'profundidad': 0, 'nodos_expandidos': 0}
+
+    total_expandidos = 0
+    for limite in range(limite_maximo_total + 1):
+        mejor_profundidad = {huella_64(inicio, clave): 0}
+        pila = [(inicio, iter(sucesores(inicio)))]
+        total_expandidos += 1
+        corte = False
+
+        while pila:
+            vecino = next(pila[-1][1], _FIN)
+            if vecino is _FIN:
+                pila.pop()
+                continue
+            profundidad = len(pila)
+            if profundidad > limite:
+                corte = True  # El nodo tiene sucesores más allá del límite
+                pila.pop()
+                continue
+            if es_objetivo(vecino):
+                return {'ruta': [estado for estado, _ in pila] + [vecino],
+                        'profundidad': profundidad, 'nodos_expandidos': total_expandidos}
+            huella = huella_64(vecino, clave)
+            if mejor_profundidad.get(huella, limite + 1) <= profundidad:
+                continue
+            mejor_profundidad[huella] = profundidad
+            total_expandidos += 1
+            pila.append((vecino, iter(sucesores(vecino))))
+
+        if not corte:
+            break  # El espacio alcanzable se agotó antes del límite
+
+    return {'ruta': None, 'profundidad': None, 'nodos_expandidos': total_expandidos}
+
+
+# Problema de las jarras: una jarra de 4 L y otra de 3 L; obtener 2 L en la de 4 L
+CAPACIDADES = (4, 3)
+
+def sucesores_jarras(estado):
+    a, b = estado
+    cap_a, cap_b = CAPACIDADES
+    pasar_ab = min(a, cap_b - b)
+    pasar_ba = min(b, cap_a - a)
+    yield (cap_a, b)                     # Llenar A
+    yield (a, cap_b)                     # Llenar B
+    yield (0, b)                         # Vaciar A
+    yield (a, 0)                         # Vaciar B
+    yield (a - pasar_ab, b + pasar_ab)   # Verter A → B
+    yield (a + pasar_ba, b - pasar_ba)   # Verter B → A
+
+def sucesores_jarras_con_costo(estado):
+    # Costo = litros de agua movidos (llenar, vaciar o verter)
+    for vecino in sucesores_jarras(estado):
+        yield vecino, abs(vecino[0] - estado[0]) + abs(vecino[1] - estado[1])
+
+def objetivo_jarras(estado):
+    return estado[0] == 2
+
+# Regresión: con estados enteros, 0 y 1 deben tener huellas distintas
+cadena = {0: [1], 1: [2], 2: []}
+cadena_con_costo = {estado: [(vecino, 1) for vecino in vecinos] for estado, vecinos in cadena.items()}
+rutas = [bfs_implicito(0, lambda s: s == 2, cadena.get)['ruta'],
+         dfs_implicito(0, lambda s: s == 2, cadena.get)['ruta'],
+         ucs_implicito(0, lambda s: s == 2, cadena_con_costo.get)['ruta'],
+         ids_implicito(0, lambda s: s == 2, cadena.get, 5)['ruta']]
+assert rutas == [[0, 1, 2]] * 4, rutas
+print(f"Cadena 0 → 1 → 2 (BFS, DFS, UCS, IDS): {rutas}")
+print(f"Huellas distintas para -1, -2 y 2^64 - 1: "
+      f"{len({huella_64(e, lambda e: e) for e in (-1, -2, MASCARA_64)}) == 3}")
+
+INICIO = (0, 0)
+print(f"Problema de las jarras {CAPACIDADES}: de {INICIO} a 2 L en la jarra A")
+print("-" * 50)
+for nombre, resultado in (
+    ('BFS', bfs_implicito(INICIO, objetivo_jarras, sucesores_jarras)),
+    ('DFS', dfs_implicito(INICIO, objetivo_jarras, sucesores_jarras)),
+    ('UCS', ucs_implicito(INICIO, objetivo_jarras, sucesores_jarras_con_costo)),
+    ('IDS', ids_implicito(INICIO, objetivo_jarras, sucesores_jarras, 10)),
+):
+    print(f"{nombre}: {' → '.join(map(str, resultado['ruta']))} "
+          f"({resultado['nodos_expandidos']} nodos expandidos)")
+
+# 8-puzzle: el estado es una tupla de 9 casillas (0 = hueco); nunca se construye el grafo
+META_PUZZLE = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+MOVIMIENTOS = {i: [j for j in (i - 3, i + 3, i - 1, i + 1)
+                   if 0 <= j < 9 and (j // 3 == i // 3 or j % 3 == i % 3)] for i in range(9)}
+
+def sucesores_puzzle(estado):
+    hueco = estado.index(0)
+    for destino in MOVIMIENTOS[hueco]:
+        casillas = list(estado)
+        casillas[hueco], casillas[destino] = casillas[destino], casillas[hueco]
+        yield tuple(casillas)
+
+inicio_puzzle = (8, 6, 7, 2, 5, 4, 3, 0, 1)  # Una de las configuraciones más lejanas (31 movimientos)
+resultado = bfs_implicito(inicio_puzzle, lambda estado: estado == META_PUZZLE, sucesores_puzzle)
+print("-" * 50)
+print(f"8-puzzle BFS: {len(resultado['ruta']) - 1} movimientos, "
+      f"{resultado['estados_alcanzados']} estados en el conjunto cerrado de huellas")
@@ -0,0 +1,189 @@
+# Carga de Grafos Grandes desde Listas de Aristas con numpy.memmap
+
+import os
+import tempfile
+import time
+from collections import deque
+from collections.abc import Mapping
+import numpy as np
+
+ARISTAS_POR_BLOQUE = 1 << 20   # Aristas procesadas por bloque (acota la memoria pico)
+BYTES_POR_BLOQUE = 16 << 20    # Bytes de texto leídos por bloque
+
+REGISTRO_ARISTA = np.dtype([('origen', '<i4'), ('destino', '<i4')])
+REGISTRO_ARISTA_PESO = np.dtype([('origen', '<i4'), ('destino', '<i4'), ('peso', '<f4')])
+
+def bloques_binario(ruta, con_pesos=False):
+    """
+    Genera bloques (origen, destino, peso) de un archivo binario de registros
+    fijos (int32, int32[, float32]) mapeado en memoria: solo se leen del disco
+    las páginas del bloque actual.
+    """
+    registro = REGISTRO_ARISTA_PESO if con_pesos else REGISTRO_ARISTA
+    aristas = np.memmap(ruta, dtype=registro, mode='r')
+    for inicio in range(0, len(aristas), ARISTAS_POR_BLOQUE):
+        bloque = aristas[inicio:inicio + ARISTAS_POR_BLOQUE]
+        pesos = bloque['peso'] if con_pesos else None
+        yield bloque['origen'], bloque['destino'], pesos
+
+def bloques_texto(ruta, con_pesos=False):
+    """
+    Genera bloques de un archivo de texto "origen destino [peso]" por línea.
+    El archivo se mapea como bytes y cada bloque se corta en el último salto
+    de línea para no partir una arista entre dos bloques (si el bloque no
+    contiene ninguno, se amplía hasta encontrarlo o llegar al final).
+    """
+    columnas = 3 if con_pesos else 2
+    datos = np.memmap(ruta, dtype=np.uint8, mode='r')
+    inicio = 0
+    while inicio < len(datos):
+        fin = min(inicio + BYTES_POR_BLOQUE, len(datos))
+        while fin < len(datos):
+            saltos = np.flatnonzero(datos[inicio:fin] == ord('\n'))
+            if len(saltos):
+                fin = inicio + int(saltos[-1]) + 1
+                break
+            fin = min(inicio + 2 * (fin - inicio), len(datos))  # Línea más larga que el bloque: se amplía
+        # Los ids se convierten directamente de texto a int64 (pasar por float64
+        # fundiría los ids mayores que 2^53); solo el peso se lee como real
+        tokens = np.array(datos[inicio:fin].tobytes().split(), dtype=np.bytes_).reshape(-1, columnas)
+        inicio = fin
+        pesos = tokens[:, 2].astype(np.float64) if con_pesos else None
+        yield tokens[:, 0].astype(np.int64), tokens[:, 1].astype(np.int64), pesos
+
+def construir_csr(generar_bloques):
+    """
+    Construye el índice de nodos y la adyacencia CSR en DOS pasadas en streaming.
+    generar_bloques() debe devolver un iterador nuevo de bloques en cada llamada.
+      1. Pasada: reúne los ids distintos y el grado de salida de cada uno,
+         fusionando el np.unique de cada bloque con lo acumulado.
+      2. Pasada: escribe cada arista en su posición final (offsets + cursor).
+    La memoria por nodo depende del número de ids distintos, no del mayor id
+    (admite ids dispersos o hasheados, incluso negativos).
+    Devuelve (ids_nodos, offsets, vecinos, pesos); pesos es None si no hay pesos.
+    """
+    # 1. PRIMERA PASADA: ids distintos (ordenados) y grados de salida por id de origen
+    ids_nodos = np.zeros(0, dtype=np.int64)
+    ids_origen = np.zeros(0, dtype=np.int64)
+    grados_origen = np.zeros(0, dtype=np.int64)
+    hay_pesos = False
+    for origenes, destinos, pesos in generar_bloques():
+        hay_pesos = pesos is not None
+        ids_bloque, grados_bloque = np.unique(origenes.astype(np.int64), return_counts=True)
+        ids_origen, inversa = np.unique(np.concatenate([ids_origen, ids_bloque]), return_inverse=True)
+        grados_origen = np.bincount(inversa, weights=np.concatenate([grados_origen, grados_bloque]),
+                                    minlength=len(ids_origen)).astype(np.int64)
+        ids_nodos = np.union1d(ids_nodos, np.concatenate([ids_bloque, destinos.astype(np.int64)]))
+
+    # Índice compacto: id original -> posición en [0, n) por búsqueda binaria
+    offsets = np.zeros(len(ids_nodos) + 1, dtype=np.int64)
+    offsets[1:][np.searchsorted(ids_nodos, ids_origen)] = grados_origen
+    np.cumsum(offsets, out=offsets)
+    del ids_origen, grados_origen
+
+    # 2. SEGUNDA PASADA: relleno de vecinos (y pesos) con un cursor por nodo
+    vecinos = np.empty(offsets[-1], dtype=np.int32)
+    pesos_csr = np.empty(offsets[-1], dtype=np.float32) if hay_pesos else None
+    cursor = offsets[:-1].copy()
+    for origenes, destinos, pesos in generar_bloques():
+        origenes = np.searchsorted(ids_nodos, origenes)
+        orden = np.argsort(origenes, kind='stable')  # Conserva el orden del archivo
+        ordenados = origenes[orden]
+        # Rango de cada arista dentro de su grupo de origen en este bloque
+        primeros = np.searchsorted(ordenados, ordenados, side='left')
+        posiciones = cursor[ordenados] + (np.arange(len(ordenados)) - primeros)
+        vecinos[posiciones] = np.searchsorted(ids_nodos, destinos[orden])
+        if hay_pesos:
+            pesos_csr[posiciones] = pesos[orden]
+        cursor += np.bincount(origenes, minlength=len(cursor))
+
+    return ids_nodos, offsets, vecinos, pesos_csr
+
+class AdyacenciaCSR(Mapping):
+    """
+    Vista de solo lectura con la interfaz de diccionario que usan las búsquedas
+    existentes (grafo.get(nodo, [])), pero respaldada por los arreglos CSR.
+    Con pesos, cada nodo devuelve {vecino: costo} (apto para ucs); si no, [vecinos].
+    """
+
+    def __init__(self, ids_nodos, offsets, vecinos, pesos=None):
+        self.ids_nodos = ids_nodos
+        self.offsets = offsets
+        self.vecinos = vecinos
+        self.pesos = pesos
+
+    def _posicion(self, nodo):
+        i = int(np.searchsorted(self.ids_nodos, nodo))
+        if i == len(self.ids_nodos) or self.ids_nodos[i] != nodo:
+            raise KeyError(nodo)
+        return i
+
+    def __getitem__(self, nodo):
+        i = self._posicion(nodo)
+        inicio, fin = self.offsets[i], self.offsets[i + 1]
+        destinos = self.ids_nodos[self.vecinos[inicio:fin]].tolist()
+        if self.pesos is None:
+            return destinos
+        return dict(zip(destinos, self.pesos[inicio:fin].tolist()))
+
+    def __iter__(self):
+        return iter(self.ids_nodos.tolist())
+
+    def __len__(self):
+        return len(self.ids_nodos)
+
+def cargar_grafo(ruta, binario=True, con_pesos=False):
+    """Carga una lista de aristas y la expone como AdyacenciaCSR."""
+    generador = bloques_binario if binario else bloques_texto
+    return AdyacenciaCSR(*construir_csr(lambda: generador(ruta, con_pesos)))
+
+def bfs(grafo, inicio, objetivo):
+    """
+    BFS de 001_Busqueda_en_Anchura.py (sin cambios): solo usa grafo.get(...).
+    """
+    cola = deque([inicio])
+    visitados = {inicio}
+    while cola:
+        nodo_actual = cola.popleft()
+        if nodo_actual == objetivo:
+            return f"¡Objetivo '{objetivo}' encontrado!"
+        for vecino in grafo.get(nodo_actual, []):
+            if vecino not in visitados:
+                visitados.add(vecino)
+                cola.append(vecino)
+    return f"Objetivo '{objetivo}' no alcanzable"
+
+
+directorio = tempfile.mkdtemp()
+
+# 1. Lista de aristas en texto (el grafo simple de BFS con ids numéricos, A=0 ... G=6)
+ruta_texto = os.path.join(directorio, "mapa_simple.txt")
+with open(ruta_texto, "w") as archivo:
+    archivo.write("0 1\n0 2\n1 3\n2 4\n2 5\n4 6\n")
+
+mapa = cargar_grafo(ruta_texto, binario=False)
+print(f"Grafo cargado desde texto: {dict(mapa)}")
+print(f"BFS (0 → 6): {bfs(mapa, 0, 6)}")
+print("-" * 50)
+
+# 2. Lista de aristas binaria con pesos (grafo aleatorio grande)
+rng = np.random.default_rng(0)
+N, M = 500_000, 2_000_000
+ruta_binaria = os.path.join(directorio, "aristas.bin")
+aristas = np.empty(M, dtype=REGISTRO_ARISTA_PESO)
+aristas['origen'] = rng.integers(0, N, M)
+aristas['destino'] = rng.integers(0, N, M)
+aristas['peso'] = rng.random(M, dtype=np.float32)
+aristas.tofile(ruta_binaria)
+del aristas
+
+t0 = time.perf_counter()
+mapa_grande = cargar_grafo(ruta_binaria, con_pesos=True)
+t_carga = time.perf_counter() - t0
+print(f"{M:,} aristas / {len(mapa_grande):,} nodos cargados en {t_carga:.2f}s")
+print(f"Vecinos (con costo) del nodo 0: {mapa_grande.get(0, {})}")
+print(f"BFS (0 → {N - 1}): {bfs(mapa_grande, 0, N - 1)}")
+
+for ruta in (ruta_texto, ruta_binaria):
+    os.remove(ruta)
+os.rmdir(directorio)
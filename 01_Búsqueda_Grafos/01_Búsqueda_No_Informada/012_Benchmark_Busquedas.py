@@ -0,0 +1,272 @@
+# Banco de Pruebas (Benchmark) de los Algoritmos de Búsqueda
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Mapping
+
+import runpy
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_INFORMADA = os.path.join(os.path.dirname(DIRECTORIO), "02_Búsqueda_Informada")
+
+# Nombres de las variables locales que guardan la frontera en cada algoritmo
+NOMBRES_FRONTERA = ('cola', 'pila', 'cola_prioridad', 'cola_f', 'cola_b')
+PROFUNDIDAD_MAXIMA_IDS = 8  # IDS sin memoria es exponencial: solo se mide en objetivos cercanos
+
+def cargar_funcion(archivo, nombre, directorio=DIRECTORIO):
+    """
+    Ejecuta un script del repositorio (silenciando su demostración) y devuelve
+    una de sus funciones. Los nombres de archivo empiezan con dígitos, así que
+    no se pueden importar con 'import'.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        espacio = runpy.run_path(os.path.join(directorio, archivo), run_name="benchmark")
+    return espacio[nombre]
+
+# =================================================================
+# --- GENERADORES DE GRAFOS SINTÉTICOS (con semilla) ---
+# Todos devuelven {nodo: {vecino: costo}} y una heurística admisible {nodo: h}.
+# Las búsquedas sin costos iteran el diccionario interno como lista de vecinos.
+# =================================================================
+
+def generar_rejilla(lado, semilla):
+    """Rejilla lado x lado con 4 vecinos; h = distancia Manhattan (costo mínimo 1)."""
+    rng = random.Random(semilla)
+    grafo = {}
+    for fila in range(lado):
+        for columna in range(lado):
+            vecinos = {}
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                f, c = fila + df, columna + dc
+                if 0 <= f < lado and 0 <= c < lado:
+                    vecinos[f * lado + c] = rng.randint(1, 9)
+            grafo[fila * lado + columna] = vecinos
+    objetivo = lado * lado - 1
+    heuristica = {nodo: (lado - 1 - nodo // lado) + (lado - 1 - nodo % lado) for nodo in grafo}
+    return grafo, heuristica, 0, objetivo
+
+def generar_erdos_renyi(n, grado_medio, semilla):
+    """Grafo dirigido G(n, p) con p = grado_medio / n; sin coordenadas (h = 0)."""
+    rng = random.Random(semilla)
+    grafo = {nodo: {} for nodo in range(n)}
+    for _ in range(n * grado_medio):
+        origen, destino = rng.randrange(n), rng.randrange(n)
+        if origen != destino:
+            grafo[origen][destino] = rng.randint(1, 9)
+    return grafo, dict.fromkeys(grafo, 0), 0, n - 1
+
+def generar_ley_potencias(n, enlaces, semilla):
+    """Barabási-Albert (apego preferencial), aristas en ambos sentidos; h = 0."""
+    rng = random.Random(semilla)
+    grafo = {nodo: {} for nodo in range(n)}
+    extremos = list(range(enlaces))  # Cada nodo aparece tantas veces como su grado
+    for nodo in range(enlaces, n):
+        destinos = set()
+        while len(destinos) < enlaces:
+            destinos.add(rng.choice(extremos))
+        for destino in destinos:
+            costo = rng.randint(1, 9)
+            grafo[nodo][destino] = costo
+            grafo[destino][nodo] = costo
+            extremos.extend((nodo, destino))
+    return grafo, dict.fromkeys(grafo, 0), 0, n - 1
+
+def con_nombres(grafo, heuristica, inicio, objetivo):
+    """Renombra los nodos enteros como cadenas (algunas búsquedas unen la ruta con ' → ')."""
+    grafo = {str(nodo): {str(v): c for v, c in vecinos.items()} for nodo, vecinos in grafo.items()}
+    heuristica = {str(nodo): h for nodo, h in heuristica.items()}
+    return grafo, heuristica, str(inicio), str(objetivo)
+
+GENERADORES = {
+    'rejilla': lambda tamano, semilla: con_nombres(*generar_rejilla(max(2, int(tamano ** 0.5)), semilla)),
+    'erdos_renyi': lambda tamano, semilla: con_nombres(*generar_erdos_renyi(tamano, 3, semilla)),
+    'ley_potencias': lambda tamano, semilla: con_nombres(*generar_ley_potencias(tamano, 2, semilla)),
+}
+
+# =================================================================
+# --- INSTRUMENTACIÓN (solo en la pasada de conteo, nunca en la cronometrada) ---
+# =================================================================
+
+class GrafoContador(Mapping):
+    """Envuelve la adyacencia y cuenta cada consulta de vecinos (= nodo expandido)."""
+
+    def __init__(self, grafo):
+        self.grafo = grafo
+        self.consultas = 0
+
+    def __getitem__(self, nodo):
+        self.consultas += 1
+        return self.grafo[nodo]
+
+    def get(self, nodo, defecto=None):
+        self.consultas += 1
+        return self.grafo.get(nodo, defecto)
+
+    def items(self):
+        return self.grafo.items()  # Recorridos completos (p. ej. revertir_grafo) no cuentan
+
+    def __iter__(self):
+        return iter(self.grafo)
+
+    def __len__(self):
+        return len(self.grafo)
+
+def medir_frontera(funcion, *argumentos):
+    """
+    Ejecuta la función con un rastreador que mide el tamaño máximo de la frontera:
+    la suma de las variables locales en NOMBRES_FRONTERA o, en funciones
+    recursivas (dls_recursivo), la profundidad de la pila de llamadas.
+    """
+    codigos = {funcion.__code__} | {
+        valor.__code__ for valor in funcion.__globals__.values()
+        if callable(valor) and getattr(valor, '__code__', None) is not None
+        and valor.__code__.co_filename == funcion.__code__.co_filename
+    }
+    estado = {'maximo': 0, 'profundidad': 0}
+
+    def rastrear(marco, evento, _argumento):
+        if marco.f_code not in codigos:
+            return None
+        if evento == 'call':
+            estado['profundidad'] += 1
+            estado['maximo'] = max(estado['maximo'], estado['profundidad'] - 1)
+        elif evento == 'return':
+            estado['profundidad'] -= 1
+        elif evento == 'line':
+            tamano = sum(len(marco.f_locals[nombre]) for nombre in NOMBRES_FRONTERA
+                         if isinstance(marco.f_locals.get(nombre), (list, deque)))
+            estado['maximo'] = max(estado['maximo'], tamano)
+        return rastrear
+
+    sys.settrace(rastrear)
+    try:
+        funcion(*argumentos)
+    finally:
+        sys.settrace(None)
+    return estado['maximo']
+
+# =================================================================
+# --- EJECUCIÓN DEL BANCO DE PRUEBAS ---
+# =================================================================
+
+def preparar_algoritmos():
+    """Devuelve {nombre: (funcion, constructor_de_argumentos)}."""
+    bfs = cargar_funcion("001_Busqueda_en_Anchura.py", "bfs")
+    ucs = cargar_funcion("002_Busqueda_Costo_Uniforme.py", "ucs")
+    dfs = cargar_funcion("003_Busqueda_Profundidad.py", "dfs")
+    ids = cargar_funcion("005_Busqueda_Prof_Iter.py", "ids")
+    bidireccional = cargar_funcion("006_Bus_Bidireccional.py", "buscar_bidireccionalmente")
+    a_estrella = cargar_funcion("003-1_Astar.py", "busqueda_a_estrella", DIRECTORIO_INFORMADA)
+
+    return {
+        'bfs': (bfs, lambda g, h, s, t, _: (g, s, t)),
+        'dfs': (dfs, lambda g, h, s, t, _: (g, s, t)),
+        'ucs': (ucs, lambda g, h, s, t, _: (g, s, t)),
+        'ids': (ids, lambda g, h, s, t, saltos: (g, s, t, saltos)),
+        'buscar_bidireccionalmente': (bidireccional, lambda g, h, s, t, _: (g, s, t)),
+        'busqueda_a_estrella': (a_estrella, lambda g, h, s, t, _: (g, g, h, s, t)),
+    }
+
+def distancia_en_saltos(grafo, inicio, objetivo):
+    distancias = {inicio: 0}
+    cola = deque([inicio])
+    while cola:
+        nodo = cola.popleft()
+        if nodo == objetivo:
+            return distancias[nodo]
+        for vecino in grafo[nodo]:
+            if vecino not in distancias:
+                distancias[vecino] = distancias[nodo] + 1
+                cola.append(vecino)
+    return None
+
+def medir(funcion, argumentos, repeticiones):
+    """Tiempo (mediana), memoria pico de tracemalloc y resultado; salida silenciada."""
+    tiempos = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            resultado = funcion(*argumentos)
+            tiempos.append(time.perf_counter() - t0)
+        tracemalloc.start()
+        funcion(*argumentos)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return statistics.median(tiempos), pico, resultado
+
+def ejecutar_benchmark(tamanos, semilla, repeticiones, algoritmos, grafos):
+    registros = []
+    for tipo in grafos:
+        for tamano in tamanos:
+            grafo, heuristica, inicio, objetivo = GENERADORES[tipo](tamano, semilla)
+            saltos = distancia_en_saltos(grafo, inicio, objetivo)
+            for nombre, (funcion, construir) in algoritmos.items():
+                registro = {
+                    'algoritmo': nombre, 'grafo': tipo, 'tamano': tamano, 'semilla': semilla,
+                    'nodos': len(grafo), 'aristas': sum(len(v) for v in grafo.values()),
+                }
+                if nombre == 'ids' and (saltos is None or saltos > PROFUNDIDAD_MAXIMA_IDS):
+                    registro['omitido'] = f"profundidad del objetivo > {PROFUNDIDAD_MAXIMA_IDS}"
+                    registros.append(registro)
+                    continue
+
+                tiempo, memoria, resultado = medir(funcion, construir(grafo, heuristica, inicio, objetivo, saltos), repeticiones)
+
+                # Pasada de conteo: adyacencia envuelta (también la revertida de la búsqueda bidireccional)
+                contador = GrafoContador(grafo)
+                revertidos = []
+                revertir_original = funcion.__globals__.get('revertir_grafo')
+                if revertir_original is not None:
+                    def revertir_contando(g, revertir=revertir_original):
+                        revertidos.append(GrafoContador(revertir(g)))
+                        return revertidos[-1]
+                    funcion.__globals__['revertir_grafo'] = revertir_contando
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        frontera = medir_frontera(funcion, *construir(contador, heuristica, inicio, objetivo, saltos))
+                finally:
+                    if revertir_original is not None:
+                        funcion.__globals__['revertir_grafo'] = revertir_original
+                expandidos = contador.consultas + sum(r.consultas for r in revertidos)
+
+                registro.update({
+                    'nodos_expandidos': expandidos,
+                    'frontera_maxima': frontera,
+                    'tiempo_s': tiempo,
+                    'memoria_pico_bytes': memoria,
+                    'resultado': str(resultado),
+                })
+                registros.append(registro)
+                print(f"  {tipo:>13} n={len(grafo):>6} {nombre:>25}: {tiempo * 1000:9.2f} ms, "
+                      f"{expandidos:>7} expandidos, frontera máx. {frontera:>6}, {memoria / 1024:8.1f} KiB")
+    return registros
+
+
+parser = argparse.ArgumentParser(description="Benchmark de bfs, dfs, ucs, ids, bidireccional y A*.")
+parser.add_argument('--tamanos', type=int, nargs='+', default=[100, 1000, 5000],
+                    help="Número aproximado de nodos de cada grafo generado")
+parser.add_argument('--grafos', nargs='+', default=list(GENERADORES), choices=list(GENERADORES))
+parser.add_argument('--semilla', type=int, default=42)
+parser.add_argument('--repeticiones', type=int, default=3)
+parser.add_argument('--salida', default="benchmark_busquedas.json")
+argumentos = parser.parse_args()
+
+print(f"Benchmark de búsquedas (semilla={argumentos.semilla}, tamaños={argumentos.tamanos})")
+print("-" * 100)
+registros = ejecutar_benchmark(argumentos.tamanos, argumentos.semilla, argumentos.repeticiones,
+                               preparar_algoritmos(), argumentos.grafos)
+
+with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+    json.dump({'semilla': argumentos.semilla, 'python': sys.version.split()[0], 'registros': registros},
+              archivo, indent=2, ensure_ascii=False)
+print("-" * 100)
+print(f"Resultados guardados en {argumentos.salida} ({len(registros)} registros)")
@@ -0,0 +1,181 @@
+# BFS Paralela por Niveles con Partición de la Frontera (multiprocessing)
+
+import contextlib
+import io
+import os
+import runpy
+import time
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+UMBRAL_PARALELO = 20000  # Fronteras más pequeñas se expanden en el proceso principal
+
+def compilar_csr(grafo):
+    """
+    Convierte {nodo: [vecinos]} en (nombres, offsets, vecinos) con ids enteros.
+    Los vecinos del nodo i están en vecinos[offsets[i]:offsets[i + 1]].
+    Reutiliza GrafoCSR.desde_diccionario de 008_Grafo_CSR.py, cargado con runpy
+    y con su demostración silenciada (como en 012_Benchmark_Busquedas.py).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        espacio = runpy.run_path(os.path.join(DIRECTORIO, "008_Grafo_CSR.py"), run_name="grafo_csr")
+    grafo_csr = espacio['GrafoCSR'].desde_diccionario(grafo)
+    return grafo_csr.nombres, grafo_csr.offsets, grafo_csr.vecinos
+
+def expandir_frontera(offsets, vecinos, visitados, frontera):
+    """
+    Expande un trozo de la frontera: devuelve (candidatos, origenes) de los
+    vecinos no visitados, conservando solo la primera aparición de cada nodo
+    y el orden en que la BFS secuencial los descubriría.
+    """
+    inicios = offsets[frontera]
+    grados = offsets[frontera + 1] - inicios
+    total = int(grados.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    posiciones = np.arange(total) + np.repeat(inicios - (np.cumsum(grados) - grados), grados)
+    candidatos = vecinos[posiciones].astype(np.int64)
+    origenes = np.repeat(frontera, grados)
+
+    nuevos = ~visitados[candidatos]
+    candidatos, origenes = candidatos[nuevos], origenes[nuevos]
+    _, primeros = np.unique(candidatos, return_index=True)
+    primeros.sort()
+    return candidatos[primeros], origenes[primeros]
+
+# --- Estado de cada proceso trabajador: vistas sobre la memoria compartida ---
+_compartido = {}
+
+def _adjuntar(nombres_memoria, formas, tipos):
+    """Inicializador del Pool: cada trabajador abre los bloques compartidos una sola vez."""
+    for clave, nombre in nombres_memoria.items():
+        memoria = SharedMemory(name=nombre)
+        _compartido[clave + '_memoria'] = memoria  # Mantiene viva la asignación
+        _compartido[clave] = np.ndarray(formas[clave], dtype=tipos[clave], buffer=memoria.buf)
+
+def _trabajo_expandir(frontera):
+    return expandir_frontera(_compartido['offsets'], _compartido['vecinos'],
+                             _compartido['visitados'], frontera)
+
+def bfs_niveles(grafo_csr, inicio, expandir_partes=None, partes=1):
+    """
+    BFS por niveles. En cada nivel la frontera se parte en 'partes' trozos
+    contiguos que se expanden con expandir_partes (en paralelo) o localmente.
+    Los resultados se unen en el orden de los trozos y se deduplican otra vez,
+    así que el árbol BFS es idéntico al de la versión secuencial.
+    Devuelve (distancias, padres) como arreglos de numpy (-1 = no alcanzado).
+    """
+    _, offsets, vecinos, visitados = grafo_csr
+    n = len(offsets) - 1
+    distancias = np.full(n, -1, dtype=np.int32)
+    padres = np.full(n, -1, dtype=np.int64)
+    visitados[:] = False
+    visitados[inicio] = True
+    distancias[inicio] = 0
+    frontera = np.array([inicio], dtype=np.int64)
+    nivel = 0
+
+    while frontera.size:
+        nivel += 1
+        # 1. Reparto de la frontera (solo si es lo bastante ancha para compensar)
+        if expandir_partes is not None and frontera.size >= UMBRAL_PARALELO:
+            resultados = expandir_partes(np.array_split(frontera, partes))
+        else:
+            resultados = [expandir_frontera(offsets, vecinos, visitados, frontera)]
+
+        # 2. Fusión por nivel: un nodo descubierto por dos trozos se queda con el primero
+        candidatos = np.concatenate([c for c, _ in resultados])
+        origenes = np.concatenate([o for _, o in resultados])
+        _, primeros = np.unique(candidatos, return_index=True)
+        primeros.sort()
+        frontera = candidatos[primeros]
+
+        # 3. Marcado de visitados (los trabajadores lo ven en el siguiente nivel)
+        visitados[frontera] = True
+        distancias[frontera] = nivel
+        padres[frontera] = origenes[primeros]
+
+    return distancias, padres
+
+def bfs_paralelo(nombres, offsets, vecinos, inicio, procesos=None):
+    """
+    BFS paralela: offsets, vecinos y el arreglo de visitados viven en memoria
+    compartida y un Pool de procesos expande los trozos de cada frontera.
+    """
+    procesos = procesos or os.cpu_count()
+    visitados = np.zeros(len(offsets) - 1, dtype=bool)
+    arreglos = {'offsets': offsets, 'vecinos': vecinos, 'visitados': visitados}
+
+    memorias, vistas = {}, {}
+    try:
+        for clave, arreglo in arreglos.items():
+            memorias[clave] = SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+            vistas[clave] = np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=memorias[clave].buf)
+            vistas[clave][:] = arreglo
+
+        nombres_memoria = {clave: memoria.name for clave, memoria in memorias.items()}
+        formas = {clave: arreglo.shape for clave, arreglo in arreglos.items()}
+        tipos = {clave: arreglo.dtype.str for clave, arreglo in arreglos.items()}
+        with Pool(procesos, initializer=_adjuntar, initargs=(nombres_memoria, formas, tipos)) as pool:
+            grafo_compartido = (nombres, vistas['offsets'], vistas['vecinos'], vistas['visitados'])
+            resultado = bfs_niveles(grafo_compartido, inicio,
+                                    lambda trozos: pool.map(_trabajo_expandir, trozos), procesos)
+    finally:
+        vistas.clear()
+        for memoria in memorias.values():
+            memoria.close()
+            memoria.unlink()
+    return resultado
+
+def bfs_secuencial(nombres, offsets, vecinos, inicio):
+    visitados = np.zeros(len(offsets) - 1, dtype=bool)
+    return bfs_niveles((nombres, offsets, vecinos, visitados), inicio)
+
+def reconstruir_ruta(nombres, padres, destino):
+    ruta = []
+    actual = destino
+    while actual != -1:
+        ruta.append(nombres[actual])
+        actual = padres[actual]
+    return list(reversed(ruta))
+
+
+if __name__ == "__main__":  # Necesario: los trabajadores pueden reimportar este script
+    # Definición de un grafo simple (el mismo de BFS)
+    mapa_simple = {
+        'A': ['B', 'C'],
+        'B': ['D'],
+        'C': ['E', 'F'],
+        'D': [],
+        'E': ['G'],
+        'F': [],
+        'G': []
+    }
+    nombres, offsets, vecinos = compilar_csr(mapa_simple)
+    distancias, padres = bfs_paralelo(nombres, offsets, vecinos, 0, procesos=2)
+    print(f"Grafo (Mapa): {mapa_simple}")
+    print(f"Ruta BFS paralela (A → G): {' → '.join(reconstruir_ruta(nombres, padres, nombres.index('G')))}")
+    print("-" * 50)
+
+    # Grafo aleatorio ancho: pocas capas con fronteras de cientos de miles de nodos
+    rng = np.random.default_rng(0)
+    N, GRADO = 1_000_000, 8
+    offsets_grande = np.arange(0, N * GRADO + 1, GRADO, dtype=np.int64)
+    vecinos_grande = rng.integers(0, N, N * GRADO, dtype=np.int32)
+    nombres_grande = list(range(N))
+
+    t0 = time.perf_counter()
+    distancias_s, padres_s = bfs_secuencial(nombres_grande, offsets_grande, vecinos_grande, 0)
+    t_secuencial = time.perf_counter() - t0
+
+    procesos = os.cpu_count()
+    t0 = time.perf_counter()
+    distancias_p, padres_p = bfs_paralelo(nombres_grande, offsets_grande, vecinos_grande, 0, procesos)
+    t_paralelo = time.perf_counter() - t0
+
+    identicos = np.array_equal(distancias_s, distancias_p) and np.array_equal(padres_s, padres_p)
+    print(f"{N:,} nodos / {N * GRADO:,} aristas, {int(distancias_s.max())} niveles")
+    print(f"Secuencial: {t_secuencial:.2f}s | Paralela ({procesos} procesos): {t_paralelo:.2f}s "
+          f"| Resultados idénticos: {identicos}")
@@ -0,0 +1,301 @@
+# Jerarquías de Contracción (Contraction Hierarchies) para Consultas Repetidas de Ruta Mínima
+
+import heapq
+import os
+import random
+import tempfile
+import time
+import numpy as np
+
+SIN_MEDIO = -1            # La arista es original (no es un atajo)
+MAX_ASENTADOS_TESTIGO = 50  # Límite de la búsqueda de testigos (si se agota, se añade el atajo)
+
+class JerarquiaContraccion:
+    """
+    Preprocesado fuera de línea de un grafo dirigido {nodo: {vecino: costo}}:
+    1. Ordena los nodos por diferencia de aristas (atajos necesarios - aristas
+       eliminadas), con actualización perezosa de prioridades.
+    2. Contrae cada nodo v en ese orden: para cada par u -> v -> w busca un
+       testigo (ruta u -> w sin v igual de corta); si no existe, añade el atajo
+       u -> w recordando v como nodo medio.
+    3. Guarda el grafo 'hacia arriba' (aristas hacia nodos de mayor rango):
+       subida[v] = {w: (costo, medio)} para v -> w y bajada[v] = {u: (costo, medio)}
+       para u -> v. Una consulta es un Dijkstra bidireccional que solo sube.
+    """
+
+    def __init__(self, nombres, rango, subida, bajada):
+        self.nombres = nombres
+        self.indices = {nodo: i for i, nodo in enumerate(nombres)}
+        self.rango = rango
+        self.subida = subida
+        self.bajada = bajada
+
+    @classmethod
+    def construir(cls, grafo):
+        nombres = list(grafo)
+        for vecinos in grafo.values():
+            nombres.extend(v for v in vecinos if v not in grafo)
+        nombres = list(dict.fromkeys(nombres))
+        indices = {nodo: i for i, nodo in enumerate(nombres)}
+        n = len(nombres)
+
+        # Grafo restante (sin los nodos ya contraídos), en ambos sentidos
+        salientes = [{} for _ in range(n)]
+        entrantes = [{} for _ in range(n)]
+        for nodo, vecinos in grafo.items():
+            u = indices[nodo]
+            for vecino, costo in vecinos.items():
+                w = indices[vecino]
+                if u != w and costo < salientes[u].get(w, (float('inf'),))[0]:
+                    salientes[u][w] = entrantes[w][u] = (costo, SIN_MEDIO)
+
+        contraido = [False] * n
+        vecinos_contraidos = [0] * n
+        rango = [0] * n
+        subida, bajada = [None] * n, [None] * n
+
+        def atajos_necesarios(v):
+            """Atajos (u, w, costo) que exige contraer v según las búsquedas de testigos."""
+            atajos = []
+            for u, (costo_uv, _) in entrantes[v].items():
+                if not salientes[v]:
+                    break
+                limite = costo_uv + max(c for c, _ in salientes[v].values())
+                distancias = testigos(u, v, limite)
+                for w, (costo_vw, _) in salientes[v].items():
+                    if w != u and distancias.get(w, float('inf')) > costo_uv + costo_vw:
+                        atajos.append((u, w, costo_uv + costo_vw))
+            return atajos
+
+        def testigos(origen, excluido, limite):
+            """Dijkstra local desde 'origen' que evita 'excluido' y se corta en 'limite'."""
+            distancias = {origen: 0}
+            cola = [(0, origen)]
+            asentados = 0
+            while cola and asentados < MAX_ASENTADOS_TESTIGO:
+                d, x = heapq.heappop(cola)
+                if d > distancias[x]:
+                    continue
+                if d > limite:
+                    break
+                asentados += 1
+                for y, (costo, _) in salientes[x].items():
+                    if y != excluido and d + costo < distancias.get(y, float('inf')):
+                        distancias[y] = d + costo
+                        heapq.heappush(cola, (d + costo, y))
+            return distancias
+
+        def prioridad(v):
+            # Diferencia de aristas + vecinos ya contraídos (reparte la contracción por el grafo)
+            return (len(atajos_necesarios(v)) - len(entrantes[v]) - len(salientes[v])
+                    + vecinos_contraidos[v])
+
+        # 1. Orden inicial por diferencia de aristas
+        cola = [(prioridad(v), v) for v in range(n)]
+        heapq.heapify(cola)
+        siguiente_rango = 0
+
+        while cola:
+            _, v = heapq.heappop(cola)
+            if contraido[v]:
+                continue
+            # Actualización perezosa: si la prioridad real empeoró, se reinserta
+            actual = prioridad(v)
+            if cola and actual > cola[0][0]:
+                heapq.heappush(cola, (actual, v))
+                continue
+
+            # 2. Contracción: atajos, y v sale del grafo restante con sus aristas hacia arriba
+            for u, w, costo in atajos_necesarios(v):
+                if costo < salientes[u].get(w, (float('inf'),))[0]:
+                    salientes[u][w] = entrantes[w][u] = (costo, v)
+            subida[v], bajada[v] = salientes[v], entrantes[v]
+            for w in salientes[v]:
+                del entrantes[w][v]
+            for u in entrantes[v]:
+                del salientes[u][v]
+            contraido[v] = True
+            rango[v] = siguiente_rango
+            siguiente_rango += 1
+            for x in set(subida[v]) | set(bajada[v]):
+                vecinos_contraidos[x] += 1  # Su prioridad se recalcula al salir de la cola
+
+        return cls(nombres, rango, subida, bajada)
+
+    # --- Serialización: cada sentido como CSR (offsets, vecinos, costos, medios) en un .npz ---
+    def guardar(self, ruta):
+        arreglos = {'nombres': np.array([str(nodo) for nodo in self.nombres]),
+                    'rango': np.array(self.rango, dtype=np.int32)}
+        for sentido, adyacencia in (('subida', self.subida), ('bajada', self.bajada)):
+            offsets = np.zeros(len(adyacencia) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(aristas) for aristas in adyacencia])
+            arreglos[sentido + '_offsets'] = offsets
+            arreglos[sentido + '_vecinos'] = np.array(
+                [x for aristas in adyacencia for x in aristas], dtype=np.int32)
+            arreglos[sentido + '_costos'] = np.array(
+                [c for aristas in adyacencia for c, _ in aristas.values()], dtype=np.float64)
+            arreglos[sentido + '_medios'] = np.array(
+                [m for aristas in adyacencia for _, m in aristas.values()], dtype=np.int32)
+        # Con un archivo abierto, numpy no añade '.npz': cargar(ruta) lee la misma ruta
+        with open(ruta, 'wb') as archivo:
+            np.savez_compressed(archivo, **arreglos)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Los nombres se recuperan como texto (str) tal como se guardaron."""
+        with np.load(ruta) as datos:
+            adyacencias = {}
+            for sentido in ('subida', 'bajada'):
+                offsets = datos[sentido + '_offsets'].tolist()
+                vecinos = datos[sentido + '_vecinos'].tolist()
+                costos = datos[sentido + '_costos'].tolist()
+                medios = datos[sentido + '_medios'].tolist()
+                adyacencias[sentido] = [
+                    {vecinos[k]: (costos[k], medios[k]) for k in range(offsets[i], offsets[i + 1])}
+                    for i in range(len(offsets) - 1)
+                ]
+            return cls(datos['nombres'].tolist(), datos['rango'].tolist(),
+                       adyacencias['subida'], adyacencias['bajada'])
+
+    # --- Consulta ---
+    def consultar(self, origen, destino):
+        """
+        Dijkstra bidireccional hacia arriba: desde el origen por 'subida' y desde
+        el destino por 'bajada' (aristas invertidas). Cada sentido se detiene
+        cuando su mínimo ya no puede mejorar la mejor ruta que se encuentran.
+        Devuelve {'ruta', 'costo', 'nodos_asentados'} con la ruta desempaquetada.
+        """
+        s, t = self.indices[origen], self.indices[destino]
+        distancias = ({s: 0}, {t: 0})
+        padres = ({s: None}, {t: None})
+        colas = ([(0, s)], [(0, t)])
+        adyacencias = (self.subida, self.bajada)
+        mejor, encuentro = (0, s) if s == t else (float('inf'), None)
+        asentados = 0
+
+        while any(cola and cola[0][0] < mejor for cola in colas):
+            for lado in (0, 1):
+                cola = colas[lado]
+                if not cola or cola[0][0] >= mejor:
+                    continue
+                d, x = heapq.heappop(cola)
+                if d > distancias[lado][x]:
+                    continue
+                asentados += 1
+                otra = distancias[1 - lado].get(x)
+                if otra is not None and d + otra < mejor:
+                    mejor, encuentro = d + otra, x
+                for y, (costo, _) in adyacencias[lado][x].items():
+                    if d + costo < distancias[lado].get(y, float('inf')):
+                        distancias[lado][y] = d + costo
+                        padres[lado][y] = x
+                        heapq.heappush(cola, (d + costo, y))
+
+        if encuentro is None:
+            return {'ruta': None, 'costo': float('inf'), 'nodos_asentados': asentados}
+
+        # Ruta en la jerarquía: origen -> ... -> encuentro -> ... -> destino
+        ida, x = [], encuentro
+        while x is not None:
+            ida.append(x)
+            x = padres[0][x]
+        vuelta, x = [], padres[1][encuentro]
+        while x is not None:
+            vuelta.append(x)
+            x = padres[1][x]
+        nodos = ida[::-1] + vuelta
+        ruta = [nodos[0]]
+        for a, b in zip(nodos, nodos[1:]):
+            ruta.extend(self.desempaquetar(a, b))
+        return {'ruta': [self.nombres[i] for i in ruta], 'costo': mejor, 'nodos_asentados': asentados}
+
+    def desempaquetar(self, a, b):
+        """Sustituye la arista a -> b (quizá un atajo) por las aristas originales; devuelve los nodos tras a."""
+        nodos = []
+        pila = [(a, b)]
+        while pila:
+            a, b = pila.pop()
+            # La arista se guardó en el extremo de menor rango
+            medio = self.subida[a][b][1] if self.rango[a] < self.rango[b] else self.bajada[b][a][1]
+            if medio == SIN_MEDIO:
+                nodos.append(b)
+            else:
+                pila.append((medio, b))  # Pila: primero se resuelve a -> medio
+                pila.append((a, medio))
+        return nodos
+
+def ucs_costo(grafo, inicio, objetivo):
+    """UCS de referencia (costo y nodos asentados), como en 002_Busqueda_Costo_Uniforme.py."""
+    costos = {inicio: 0}
+    cola_prioridad = [(0, inicio)]
+    asentados = 0
+    while cola_prioridad:
+        costo_actual, nodo_actual = heapq.heappop(cola_prioridad)
+        if costo_actual > costos[nodo_actual]:
+            continue
+        asentados += 1
+        if nodo_actual == objetivo:
+            return costo_actual, asentados
+        for vecino, costo_arista in grafo.get(nodo_actual, {}).items():
+            nuevo_costo = costo_actual + costo_arista
+            if nuevo_costo < costos.get(vecino, float('inf')):
+                costos[vecino] = nuevo_costo
+                heapq.heappush(cola_prioridad, (nuevo_costo, vecino))
+    return float('inf'), asentados
+
+
+# Definición del Grafo con Costos (el mismo de UCS)
+mapa_costos = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 5, 'E': 2},
+    'C': {'F': 3},
+    'D': {'G': 1},
+    'E': {'G': 8},
+    'F': {},
+    'G': {}
+}
+jerarquia = JerarquiaContraccion.construir(mapa_costos)
+resultado = jerarquia.consultar('A', 'G')
+print(f"Orden de contracción: {sorted(jerarquia.nombres, key=lambda n: jerarquia.rango[jerarquia.indices[n]])}")
+print(f"Consulta CH (A → G): {' → '.join(resultado['ruta'])}, costo {resultado['costo']}")
+print("-" * 60)
+
+# Red vial sintética 60 x 60 con calles de doble sentido de costos distintos
+random.seed(11)
+LADO = 60
+red = {}
+for fila in range(LADO):
+    for columna in range(LADO):
+        rapida = fila % 10 == 0 or columna % 10 == 0  # Avenidas cada 10 calles
+        red[f"{fila},{columna}"] = {
+            f"{fila + df},{columna + dc}": random.randint(1, 3) if rapida else random.randint(5, 30)
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= fila + df < LADO and 0 <= columna + dc < LADO
+        }
+
+t0 = time.perf_counter()
+jerarquia = JerarquiaContraccion.construir(red)
+aristas = sum(len(a) for a in jerarquia.subida) + sum(len(a) for a in jerarquia.bajada)
+print(f"Preprocesado: {len(jerarquia.nombres)} nodos en {time.perf_counter() - t0:.2f}s, "
+      f"{aristas} aristas en la jerarquía (original: {sum(len(v) for v in red.values())})")
+
+with tempfile.TemporaryDirectory() as directorio:  # El archivo se borra al salir
+    ruta_archivo = os.path.join(directorio, "jerarquia_red.npz")
+    jerarquia.guardar(ruta_archivo)
+    jerarquia = JerarquiaContraccion.cargar(ruta_archivo)
+    print(f"Jerarquía guardada y recargada: {ruta_archivo} ({os.path.getsize(ruta_archivo) / 1024:.0f} KiB)")
+
+consultas = [(random.choice(list(red)), random.choice(list(red))) for _ in range(200)]
+t0 = time.perf_counter()
+referencia = [ucs_costo(red, origen, destino) for origen, destino in consultas]
+t_ucs = (time.perf_counter() - t0) / len(consultas)
+t0 = time.perf_counter()
+resultados = [jerarquia.consultar(origen, destino) for origen, destino in consultas]
+t_ch = (time.perf_counter() - t0) / len(consultas)
+
+correctas = all(r['costo'] == costo for r, (costo, _) in zip(resultados, referencia))
+rutas_validas = all(all(b in red[a] for a, b in zip(r['ruta'], r['ruta'][1:])) for r in resultados)
+print(f"UCS: {t_ucs * 1e6:8.0f} µs/consulta, {np.mean([a for _, a in referencia]):6.0f} nodos asentados")
+print(f"CH:  {t_ch * 1e6:8.0f} µs/consulta (con desempaquetado), "
+      f"{np.mean([r['nodos_asentados'] for r in resultados]):6.0f} nodos asentados")
+print(f"Costos idénticos a UCS: {correctas} | Rutas desempaquetadas sobre aristas originales: {rutas_validas}")
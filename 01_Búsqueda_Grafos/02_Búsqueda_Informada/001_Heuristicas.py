@@ -1,5 +1,8 @@
 # Heurísticas: Cálculo de la Estimación h(n)
 import math
+from collections import OrderedDict
+from collections.abc import Mapping
+import numpy as np
 
 def calcular_heuristica_euclidiana(punto_actual, punto_objetivo):
     """
@@ -18,6 +21,89 @@ def calcular_heuristica_euclidiana(punto_actual, punto_objetivo):
     distancia = math.sqrt(dx**2 + dy**2)
     return distancia
 
+RADIO_TIERRA_KM = 6371.0
+
+def _euclidiana(coordenadas, meta):
+    return np.sqrt(((coordenadas - meta) ** 2).sum(axis=1))
+
+def _manhattan(coordenadas, meta):
+    return np.abs(coordenadas - meta).sum(axis=1)
+
+def _chebyshev(coordenadas, meta):
+    return np.abs(coordenadas - meta).max(axis=1)
+
+def _haversine(coordenadas, meta):
+    # Coordenadas (latitud, longitud) en grados; distancia en km sobre la esfera
+    lat, lon = np.radians(coordenadas[:, 0]), np.radians(coordenadas[:, 1])
+    lat_meta, lon_meta = np.radians(meta)
+    a = (np.sin((lat_meta - lat) / 2) ** 2
+         + np.cos(lat) * np.cos(lat_meta) * np.sin((lon_meta - lon) / 2) ** 2)
+    return 2 * RADIO_TIERRA_KM * np.arcsin(np.sqrt(a))
+
+METRICAS = {
+    'euclidiana': _euclidiana,
+    'manhattan': _manhattan,
+    'chebyshev': _chebyshev,
+    'haversine': _haversine,
+}
+
+class TablaHeuristica(Mapping):
+    """
+    Vista de solo lectura {nodo: h(n)} sobre un vector de numpy, para pasarla
+    directamente a busqueda_voraz o busqueda_a_estrella sin construir un dict.
+    """
+
+    def __init__(self, indices, vector):
+        self._indices = indices
+        self.vector = vector
+
+    def __getitem__(self, nodo):
+        return float(self.vector[self._indices[nodo]])
+
+    def __iter__(self):
+        return iter(self._indices)
+
+    def __len__(self):
+        return len(self._indices)
+
+class ServicioHeuristicas:
+    """
+    Calcula vectores heurísticos completos (todos los nodos a la vez) para un
+    objetivo y los guarda en una caché LRU indexada por (objetivo, métrica).
+    El objetivo puede ser el nombre de un nodo o unas coordenadas.
+    """
+
+    def __init__(self, puntos, capacidad_cache=128):
+        self.nombres = list(puntos)
+        self.indices = {nombre: i for i, nombre in enumerate(self.nombres)}
+        self.coordenadas = np.array([puntos[nombre] for nombre in self.nombres], dtype=np.float64)
+        self.capacidad_cache = capacidad_cache
+        self._cache = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def vector(self, objetivo, metrica='euclidiana'):
+        """Vector h con un valor por nodo (en el orden de self.nombres)."""
+        clave = (objetivo, metrica)
+        if clave in self._cache:
+            self._cache.move_to_end(clave)  # Usado recientemente
+            self.aciertos += 1
+            return self._cache[clave]
+
+        self.fallos += 1
+        meta = self.coordenadas[self.indices[objetivo]] if objetivo in self.indices else np.asarray(objetivo, dtype=np.float64)
+        vector = METRICAS[metrica](self.coordenadas, meta)
+        vector.flags.writeable = False  # Compartido entre llamadas: no debe modificarse
+
+        self._cache[clave] = vector
+        if len(self._cache) > self.capacidad_cache:
+            self._cache.popitem(last=False)  # Expulsa el menos usado recientemente
+        return vector
+
+    def tabla(self, objetivo, metrica='euclidiana'):
+        """Heurística como mapeo {nodo: h(n)} lista para las búsquedas informadas."""
+        return TablaHeuristica(self.indices, self.vector(objetivo, metrica))
+
 # 1. Definición del Objetivo
 OBJETIVO = (10, 5) # Coordenadas (x, y) del destino final
 
@@ -47,4 +133,24 @@ nodo_mas_prometedor = min(resultados, key=resultados.get)
 menor_h = resultados[nodo_mas_prometedor]
 
 print(f"El nodo más prometedor es: {nodo_mas_prometedor}")
-print(f"Con la menor heurística (estimación de costo): {menor_h:.2f}")
\ No newline at end of file
+print(f"Con la menor heurística (estimación de costo): {menor_h:.2f}")
+print("-" * 40)
+
+# 5. Servicio vectorizado: todas las heurísticas de un objetivo en una sola llamada
+servicio = ServicioHeuristicas(puntos_de_mapa)
+for metrica in METRICAS:
+    if metrica == 'haversine':
+        continue  # Requiere coordenadas (latitud, longitud)
+    vector = servicio.vector(OBJETIVO, metrica)
+    print(f"h {metrica:>10}: " + ", ".join(f"{n}={h:.2f}" for n, h in zip(servicio.nombres, vector)))
+
+# Consultas repetidas del mismo objetivo se sirven desde la caché
+tabla = servicio.tabla(OBJETIVO)
+print(f"h(Ciudad B) desde la caché: {tabla['Ciudad B']:.2f} "
+      f"(aciertos: {servicio.aciertos}, fallos: {servicio.fallos})")
+
+# Objetivo dado por nombre de nodo y distancias geográficas (haversine, en km)
+ciudades = {'Monterrey': (25.67, -100.31), 'CDMX': (19.43, -99.13), 'Guadalajara': (20.67, -103.35)}
+servicio_geo = ServicioHeuristicas(ciudades)
+tabla_geo = servicio_geo.tabla('CDMX', 'haversine')
+print("h haversine a CDMX (km): " + ", ".join(f"{n}={h:.0f}" for n, h in tabla_geo.items()))
\ No newline at end of file
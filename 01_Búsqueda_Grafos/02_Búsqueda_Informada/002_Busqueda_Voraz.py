@@ -1,11 +1,18 @@
 # Búsqueda Voraz Primero (Greedy Best-First Search) con Heurísticas
 
 import heapq
+import operator
+import random
+import time
+from collections import deque
 
-def busqueda_voraz(grafo, heuristica, inicio, objetivo):
+MAX_CUBETAS = 1 << 16  # Mayor h entero para el que compensa una cola de cubetas
+
+def busqueda_voraz(grafo, heuristica, inicio, objetivo, observador=None):
     """
     Implementa la Búsqueda Voraz, usando la heurística h(n) como prioridad.
     La prioridad en la cola es SOLO el valor h(n).
+    observador(evento, nodo, dato) es opcional: recibe ('expandir', nodo, h).
     """
     # Cola de prioridad: (h(n), nodo)
     cola_prioridad = [(heuristica[inicio], inicio)]
@@ -15,7 +22,8 @@ def busqueda_voraz(grafo, heuristica, inicio, objetivo):
         # Extrae el nodo con el valor heurístico MÁS BAJO
         (h_costo, nodo_actual) = heapq.heappop(cola_prioridad)
         
-        print(f"  Visitando: {nodo_actual} (h={h_costo})")
+        if observador is not None:
+            observador('expandir', nodo_actual, h_costo)
         
         if nodo_actual == objetivo:
             return f"¡Objetivo '{objetivo}' encontrado!"
@@ -30,6 +38,121 @@ def busqueda_voraz(grafo, heuristica, inicio, objetivo):
                 
     return "Fallo en la búsqueda: No hay camino."
 
+class ColaCubetas:
+    """
+    Cola de prioridad de cubetas (bucket queue) para prioridades enteras en [0, h_maximo].
+    cubetas[h] guarda los nodos con prioridad h en orden de llegada; 'minimo' apunta
+    a la primera cubeta que puede no estar vacía. Insertar es O(1) y extraer es O(1)
+    amortizado: el puntero solo retrocede cuando se inserta una prioridad menor.
+    Una prioridad fuera de [0, h_maximo] (o no entera) lanza ValueError.
+    """
+
+    def __init__(self, h_maximo):
+        self.h_maximo = operator.index(h_maximo)
+        self.cubetas = [deque() for _ in range(self.h_maximo + 2)]  # La última: h desconocida (inf)
+        self.minimo = len(self.cubetas)
+        self.tamano = 0
+
+    def insertar(self, prioridad, nodo):
+        if prioridad == float('inf'):
+            indice = len(self.cubetas) - 1
+        else:
+            try:
+                indice = operator.index(prioridad)  # Admite enteros de numpy
+            except TypeError:
+                raise ValueError(f"Prioridad no entera para la cola de cubetas: {prioridad!r}") from None
+            if not 0 <= indice <= self.h_maximo:
+                raise ValueError(f"Prioridad {indice} fuera del rango [0, {self.h_maximo}]")
+        self.cubetas[indice].append(nodo)
+        self.minimo = min(self.minimo, indice)
+        self.tamano += 1
+
+    def extraer(self):
+        while not self.cubetas[self.minimo]:
+            self.minimo += 1
+        self.tamano -= 1
+        indice = self.minimo
+        return (float('inf') if indice == len(self.cubetas) - 1 else indice), self.cubetas[indice].popleft()
+
+    def __len__(self):
+        return self.tamano
+
+class ColaMonticulo:
+    """Misma interfaz que ColaCubetas sobre heapq, para heurísticas reales o no acotadas."""
+
+    def __init__(self):
+        self.monticulo = []
+        self.contador = 0  # Desempate por orden de llegada (los nodos pueden no ser comparables)
+
+    def insertar(self, prioridad, nodo):
+        self.contador += 1
+        heapq.heappush(self.monticulo, (prioridad, self.contador, nodo))
+
+    def extraer(self):
+        prioridad, _, nodo = heapq.heappop(self.monticulo)
+        return prioridad, nodo
+
+    def __len__(self):
+        return len(self.monticulo)
+
+def crear_cola(heuristica, h_maximo=None):
+    """
+    Cubetas si todos los h son enteros en [0, MAX_CUBETAS]; montículo en otro caso.
+    Si se conoce la cota 'h_maximo' se evita recorrer toda la heurística; cada h
+    se valida entonces al insertarla (ValueError si cae fuera de [0, h_maximo]).
+    """
+    if h_maximo is not None:
+        return ColaCubetas(h_maximo)
+    h_maximo = 0
+    for h in heuristica.values():
+        if isinstance(h, bool):
+            return ColaMonticulo()
+        try:
+            h = operator.index(h)  # int o entero de numpy
+        except TypeError:
+            return ColaMonticulo()
+        if not 0 <= h <= MAX_CUBETAS:
+            return ColaMonticulo()
+        h_maximo = max(h_maximo, h)
+    return ColaCubetas(h_maximo)
+
+def busqueda_voraz_cubetas(grafo, heuristica, inicio, objetivo, observador=None, h_maximo=None):
+    """
+    Búsqueda Voraz silenciosa: misma prioridad h(n) que busqueda_voraz, pero con
+    una cola de cubetas cuando la heurística es entera y acotada (expansión O(1)
+    amortizada) y un montículo en otro caso. Los nodos sin h van al final (h = inf).
+    h_maximo (opcional): cota entera conocida de la heurística; fuerza las cubetas
+    y un h fuera de [0, h_maximo] lanza ValueError.
+    Devuelve {'ruta', 'nodos_expandidos', 'nodos_generados', 'cola'}.
+    """
+    cola = crear_cola(heuristica, h_maximo)
+    cola.insertar(heuristica.get(inicio, float('inf')), inicio)
+    padres = {inicio: None}
+    nodos_expandidos = 0
+
+    while cola:
+        h_costo, nodo_actual = cola.extraer()
+        nodos_expandidos += 1
+
+        if observador is not None:
+            observador('expandir', nodo_actual, h_costo)
+
+        if nodo_actual == objetivo:
+            ruta = []
+            while nodo_actual is not None:
+                ruta.append(nodo_actual)
+                nodo_actual = padres[nodo_actual]
+            return {'ruta': ruta[::-1], 'nodos_expandidos': nodos_expandidos,
+                    'nodos_generados': len(padres), 'cola': type(cola).__name__}
+
+        for vecino in grafo.get(nodo_actual, []):
+            if vecino not in padres:
+                padres[vecino] = nodo_actual
+                cola.insertar(heuristica.get(vecino, float('inf')), vecino)
+
+    return {'ruta': None, 'nodos_expandidos': nodos_expandidos,
+            'nodos_generados': len(padres), 'cola': type(cola).__name__}
+
 # Definición del Grafo y la Heurística
 mapa = {
     'A': ['B', 'C'],
@@ -58,7 +181,58 @@ print(f"Grafo: {mapa}")
 print(f"Heurísticas (Estimación a 'F'): {heuristica_a_f}")
 print("-" * 50)
 print("Búsqueda Voraz (A → F):")
-resultado = busqueda_voraz(mapa, heuristica_a_f, INICIO, OBJETIVO)
+def imprimir_visita(evento, nodo, h_costo):
+    print(f"  Visitando: {nodo} (h={h_costo})")
+
+resultado = busqueda_voraz(mapa, heuristica_a_f, INICIO, OBJETIVO, observador=imprimir_visita)
 
 print("-" * 50)
-print("Resultado final: {resultado}")
\ No newline at end of file
+print("Resultado final: {resultado}")
+print("-" * 50)
+
+resultado = busqueda_voraz_cubetas(mapa, heuristica_a_f, INICIO, OBJETIVO)
+print(f"Voraz con cubetas (A → F): {' → '.join(resultado['ruta'])}, "
+      f"{resultado['nodos_expandidos']} expansiones, cola {resultado['cola']}")
+
+# Rejilla 400 x 400 con obstáculos y un muro con un único hueco lejos de la diagonal:
+# la voraz se atasca contra el muro y expande muchos nodos. Ambas colas dan la misma
+# búsqueda; aquí el tiempo lo dominan los diccionarios, no la cola (la frontera es pequeña)
+random.seed(0)
+LADO = 400
+libres = {(f, c) for f in range(LADO) for c in range(LADO)
+          if random.random() > 0.2 and not (f == LADO // 2 and c > 0)}
+libres |= {(0, 0), (LADO - 1, LADO - 1)} | {(LADO // 2 + d, 0) for d in (-1, 0, 1)}  # Hueco abierto
+rejilla = {
+    (f, c): [(f + df, c + dc) for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)) if (f + df, c + dc) in libres]
+    for f, c in libres
+}
+meta = (LADO - 1, LADO - 1)
+manhattan = {(f, c): (meta[0] - f) + (meta[1] - c) for f, c in libres}
+manhattan_real = {nodo: float(h) for nodo, h in manhattan.items()}  # Fuerza el montículo
+
+for nombre, h, cota in (("enteros", manhattan, 2 * (LADO - 1)), ("reales", manhattan_real, None)):
+    resultado = busqueda_voraz_cubetas(rejilla, h, (0, 0), meta, h_maximo=cota)
+    print(f"Rejilla con h {nombre}: cola {resultado['cola']}, "
+          f"{resultado['nodos_expandidos']} expansiones, "
+          f"ruta de {len(resultado['ruta']) - 1 if resultado['ruta'] else '-'} pasos")
+
+# Donde las cubetas sí ganan: colas grandes. Insertar y extraer 'tamano' elementos
+# con h en [0, 798]: el montículo paga O(log n) por operación y las cubetas O(1)
+print("-" * 50)
+for tamano in (1_000, 500_000):
+    prioridades = [random.randrange(2 * (LADO - 1) + 1) for _ in range(tamano)]
+    for cola in (ColaCubetas(2 * (LADO - 1)), ColaMonticulo()):
+        t0 = time.perf_counter()
+        for nodo, prioridad in enumerate(prioridades):
+            cola.insertar(prioridad, nodo)
+        while cola:
+            cola.extraer()
+        print(f"{type(cola).__name__:<13} con {tamano:>9,} elementos: "
+              f"{(time.perf_counter() - t0) * 1e9 / tamano:6.0f} ns por inserción + extracción")
+
+# h fuera de la cota declarada: error explícito en lugar de un orden de expansión erróneo
+for h_malo in ({'A': 9}, {'A': -1}):
+    try:
+        busqueda_voraz_cubetas(mapa, h_malo, INICIO, OBJETIVO, h_maximo=3)
+    except ValueError as error:
+        print(f"h_maximo = 3 con h = {h_malo}: ValueError ({error})")
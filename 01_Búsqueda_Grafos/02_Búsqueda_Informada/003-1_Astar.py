@@ -41,6 +41,124 @@ def busqueda_a_estrella(grafo, costos, heuristica, inicio, objetivo):
                 
     return "Fallo en la búsqueda: No hay camino."
 
+class MonticuloIndexado:
+    """
+    Montículo binario mínimo con índice nodo -> posición, que permite
+    disminuir la prioridad de un nodo ya encolado (decrease-key) en O(log n)
+    en lugar de insertar entradas duplicadas.
+    """
+
+    def __init__(self):
+        self.nodos = []        # Montículo de nodos
+        self.claves = {}       # nodo -> prioridad actual
+        self.posiciones = {}   # nodo -> índice dentro de self.nodos
+        self.operaciones = 0   # Intercambios realizados (costo del montículo)
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def __contains__(self, nodo):
+        return nodo in self.posiciones
+
+    def insertar_o_disminuir(self, nodo, clave):
+        """Inserta el nodo o, si ya está, baja su prioridad (nunca la sube)."""
+        if nodo in self.posiciones:
+            if clave >= self.claves[nodo]:
+                return
+            self.claves[nodo] = clave
+            self._subir(self.posiciones[nodo])
+        else:
+            self.claves[nodo] = clave
+            self.posiciones[nodo] = len(self.nodos)
+            self.nodos.append(nodo)
+            self._subir(len(self.nodos) - 1)
+
+    def extraer(self):
+        """Saca y devuelve (nodo, clave) con la prioridad mínima."""
+        ultimo = self.nodos.pop()
+        if self.nodos:
+            minimo, self.nodos[0] = self.nodos[0], ultimo
+            self.posiciones[ultimo] = 0
+            self._bajar(0)
+        else:
+            minimo = ultimo
+        del self.posiciones[minimo]
+        return minimo, self.claves.pop(minimo)
+
+    def _intercambiar(self, i, j):
+        self.nodos[i], self.nodos[j] = self.nodos[j], self.nodos[i]
+        self.posiciones[self.nodos[i]] = i
+        self.posiciones[self.nodos[j]] = j
+        self.operaciones += 1
+
+    def _subir(self, i):
+        while i > 0:
+            padre = (i - 1) // 2
+            if self.claves[self.nodos[i]] >= self.claves[self.nodos[padre]]:
+                break
+            self._intercambiar(i, padre)
+            i = padre
+
+    def _bajar(self, i):
+        n = len(self.nodos)
+        while True:
+            menor = i
+            for hijo in (2 * i + 1, 2 * i + 2):
+                if hijo < n and self.claves[self.nodos[hijo]] < self.claves[self.nodos[menor]]:
+                    menor = hijo
+            if menor == i:
+                return
+            self._intercambiar(i, menor)
+            i = menor
+
+def busqueda_a_estrella_indexada(grafo, costos, heuristica, inicio, objetivo):
+    """
+    A* con montículo indexado (decrease-key), conjunto cerrado y reconstrucción de ruta.
+    - Un nodo cerrado solo se reabre si se encuentra un g menor (heurística
+      inconsistente); esas reaperturas se cuentan.
+    - Desempate determinista: a igual f gana el mayor g (el más cercano al objetivo)
+      y después el orden de inserción.
+    Devuelve {'ruta', 'costo', 'nodos_expandidos', 'reaperturas', 'operaciones_heap'}.
+    """
+    abiertos = MonticuloIndexado()
+    g_costos = {inicio: 0}
+    padres = {inicio: None}
+    cerrados = set()
+    contador = 0
+    nodos_expandidos = 0
+    reaperturas = 0
+    abiertos.insertar_o_disminuir(inicio, (heuristica[inicio], 0, contador))
+
+    while abiertos:
+        nodo_actual, _ = abiertos.extraer()
+        cerrados.add(nodo_actual)
+
+        if nodo_actual == objetivo:
+            ruta = []
+            while nodo_actual is not None:
+                ruta.append(nodo_actual)
+                nodo_actual = padres[nodo_actual]
+            return {'ruta': ruta[::-1], 'costo': g_costos[objetivo], 'nodos_expandidos': nodos_expandidos,
+                    'reaperturas': reaperturas, 'operaciones_heap': abiertos.operaciones}
+
+        nodos_expandidos += 1
+        for vecino, costo_arista in grafo.get(nodo_actual, {}).items():
+            nuevo_g_costo = g_costos[nodo_actual] + costo_arista
+            if nuevo_g_costo >= g_costos.get(vecino, float('inf')):
+                continue  # No mejora: ni se encola ni se reabre
+
+            if vecino in cerrados:
+                cerrados.remove(vecino)
+                reaperturas += 1
+            g_costos[vecino] = nuevo_g_costo
+            padres[vecino] = nodo_actual
+            contador += 1
+            f_vecino = nuevo_g_costo + heuristica.get(vecino, float('inf'))
+            abiertos.insertar_o_disminuir(vecino, (f_vecino, -nuevo_g_costo, contador))
+
+    return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': nodos_expandidos,
+            'reaperturas': reaperturas, 'operaciones_heap': abiertos.operaciones}
+
 # Definición del Grafo con Costos (Arista: Costo)
 mapa_costos = {
     'A': {'B': 1, 'C': 4},
@@ -67,4 +185,10 @@ print(f"Búsqueda A* ({INICIO} → {OBJETIVO}):")
 resultado = busqueda_a_estrella(mapa_costos, mapa_costos, heuristica_g, INICIO, OBJETIVO)
 
 print("-" * 50)
-print(f"Resultado: {resultado}")
\ No newline at end of file
+print(f"Resultado: {resultado}")
+
+# A* con conjunto cerrado y montículo indexado: devuelve la ruta y estadísticas
+resultado_indexado = busqueda_a_estrella_indexada(mapa_costos, mapa_costos, heuristica_g, INICIO, OBJETIVO)
+print(f"A* indexado: ruta {' → '.join(resultado_indexado['ruta'])}, costo {resultado_indexado['costo']}, "
+      f"{resultado_indexado['nodos_expandidos']} nodos expandidos, "
+      f"{resultado_indexado['reaperturas']} reaperturas")
\ No newline at end of file
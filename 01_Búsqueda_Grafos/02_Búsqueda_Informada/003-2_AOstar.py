@@ -1,5 +1,7 @@
 # Búsqueda AO* (Concepto Simplificado para la Decisión)
 
+import random
+
 def calcular_decision_ao(nodo, grafo, heuristica):
     """
     Simula la decisión clave de AO*: 
@@ -40,6 +42,134 @@ def calcular_decision_ao(nodo, grafo, heuristica):
         
     return mejor_costo, mejor_accion
 
+def conectores_de(nodo, grafo):
+    """
+    Conectores del nodo: cada arco OR es un conector con un solo sucesor y la
+    lista AND es un único conector con todos sus sucesores.
+    Devuelve [(tipo, [(sucesor, costo), ...]), ...].
+    """
+    ramas_nodo = grafo.get(nodo, {})
+    conectores = [('OR', [arco]) for arco in ramas_nodo.get('OR', [])]
+    if ramas_nodo.get('AND'):
+        conectores.append(('AND', list(ramas_nodo['AND'])))
+    return conectores
+
+def busqueda_ao_estrella(grafo, heuristica, inicio, resueltos=None):
+    """
+    AO* completo sobre un grafo AND/OR acíclico (un nodo compartido por varias
+    ramas es un único nodo, no una copia):
+    1. Recorre el grafo solución parcial marcado desde 'inicio' y expande una hoja.
+    2. Revisa el costo de la hoja y lo propaga SOLO a los ancestros cuyo conector
+       marcado pasa por ella, re-marcando el mejor conector y la etiqueta RESUELTO.
+    3. Termina cuando 'inicio' está RESUELTO o su costo es infinito (sin solución).
+    Un nodo del grafo sin conectores ({}) es terminal resuelto con costo 0; uno ausente
+    del grafo no tiene solución. 'resueltos' (opcional) es un memo {nodo: costo}
+    de subproblemas ya resueltos que se reutiliza y amplía entre llamadas.
+    Devuelve {'costo', 'solucion', 'nodos_expandidos', 'revisiones'}, donde
+    'solucion' es el subgrafo {nodo: (tipo, [sucesores])} o None.
+    """
+    resueltos = {} if resueltos is None else resueltos
+    infinito = float('inf')
+    costos = dict(resueltos)
+    marcados = {}             # nodo -> índice del mejor conector
+    conectores = {}           # nodo expandido -> lista de conectores
+    padres = {}               # sucesor -> nodos que lo tienen en algún conector
+    nodos_expandidos = 0
+    revisiones = 0
+
+    def costo_de(nodo):
+        if nodo not in costos:
+            # Sin h conocida se usa 0 (optimista); fuera del grafo no hay solución
+            costos[nodo] = heuristica.get(nodo, 0) if nodo in grafo else infinito
+        return costos[nodo]
+
+    def revisar(nodo):
+        """Recalcula costo, conector marcado y etiqueta RESUELTO; True si algo cambió."""
+        mejor_costo, mejor_indice = infinito, None
+        for indice, (_, arcos) in enumerate(conectores[nodo]):
+            costo = sum(costo_accion + costo_de(sucesor) for sucesor, costo_accion in arcos)
+            if costo < mejor_costo:
+                mejor_costo, mejor_indice = costo, indice
+        resuelto = mejor_indice is not None and all(
+            sucesor in resueltos for sucesor, _ in conectores[nodo][mejor_indice][1])
+        cambio = mejor_costo != costos.get(nodo) or resuelto
+        costos[nodo] = mejor_costo
+        marcados[nodo] = mejor_indice
+        if resuelto:
+            resueltos[nodo] = mejor_costo
+        return cambio
+
+    def hoja_sin_expandir():
+        """Primer nodo sin expandir ni resolver del grafo solución parcial marcado."""
+        pila, vistos = [inicio], {inicio}
+        while pila:
+            nodo = pila.pop()
+            if nodo in resueltos:
+                continue
+            if nodo not in conectores:
+                return nodo
+            for sucesor, _ in reversed(conectores[nodo][marcados[nodo]][1]):
+                if sucesor not in vistos:
+                    vistos.add(sucesor)
+                    pila.append(sucesor)
+        return None
+
+    while inicio not in resueltos and costo_de(inicio) < infinito:
+        # 1. Expansión de una hoja del mejor grafo solución parcial
+        nodo = hoja_sin_expandir()
+        nodos_expandidos += 1
+        conectores[nodo] = conectores_de(nodo, grafo)
+        for _, arcos in conectores[nodo]:
+            for sucesor, _ in arcos:
+                padres.setdefault(sucesor, set()).add(nodo)
+                if sucesor not in resueltos and sucesor in grafo and not conectores_de(sucesor, grafo):
+                    resueltos[sucesor] = costos[sucesor] = 0  # Terminal: resuelto
+        if not conectores[nodo]:
+            if nodo in grafo:
+                resueltos[nodo] = costos[nodo] = 0
+            else:
+                costos[nodo] = infinito
+            pendientes = list(padres.get(nodo, ()))
+        else:
+            pendientes = [nodo]
+
+        # 2. Propagación de costos solo por los ancestros marcados
+        while pendientes:
+            actual = pendientes.pop()
+            if actual in resueltos:
+                continue
+            revisiones += 1
+            if not revisar(actual):
+                continue
+            for padre in padres.get(actual, ()):
+                if padre in resueltos or marcados.get(padre) is None:
+                    continue
+                if any(s == actual for s, _ in conectores[padre][marcados[padre]][1]):
+                    pendientes.append(padre)
+
+    if inicio not in resueltos:
+        return {'costo': infinito, 'solucion': None,
+                'nodos_expandidos': nodos_expandidos, 'revisiones': revisiones}
+
+    # 3. Subgrafo solución: conectores marcados alcanzables desde 'inicio'
+    solucion = {}
+    pila = [inicio]
+    while pila:
+        nodo = pila.pop()
+        if nodo in solucion or not conectores_de(nodo, grafo):
+            continue
+        if nodo in marcados:
+            tipo, arcos = conectores[nodo][marcados[nodo]]
+        else:
+            # Resuelto en una llamada anterior (memo): mejor conector con todo resuelto
+            tipo, arcos = min(
+                (c for c in conectores_de(nodo, grafo) if all(s in resueltos for s, _ in c[1])),
+                key=lambda c: sum(costo + resueltos[s] for s, costo in c[1]))
+        solucion[nodo] = (tipo, [sucesor for sucesor, _ in arcos])
+        pila.extend(sucesor for sucesor, _ in arcos)
+    return {'costo': resueltos[inicio], 'solucion': solucion,
+            'nodos_expandidos': nodos_expandidos, 'revisiones': revisiones}
+
 # Definición del Grafo AND/OR:
 AND_OR_GRAFO = {
     'P1': {'OR': [('P2', 1)], 'AND': [('P3', 2), ('P4', 2)]},
@@ -75,4 +205,41 @@ print("  Costo estimado (AND): (2 + h(P3)) + (2 + h(P4)) = 11")
 print("-" * 50)
 print("Resultado AO* (Mejor Plan de Solución):")
 print(f"  Decisión Óptima: {decision}")
-print(f"  Costo Estimado: {costo}")
\ No newline at end of file
+print(f"  Costo Estimado: {costo}")
+print("-" * 50)
+
+resultado = busqueda_ao_estrella(AND_OR_GRAFO, heuristica_ao, INICIO)
+print(f"AO* completo: costo {resultado['costo']}, solución {resultado['solucion']}, "
+      f"{resultado['nodos_expandidos']} expansiones")
+print("-" * 50)
+
+# Plan de contingencia con subproblemas compartidos: cada situación (nivel, i) se
+# resuelve atendiendo sus dos contingencias (AND) o con un plan directo (OR) cuyo costo
+# crece con la altura. Desplegado como árbol tendría 2^NIVELES hojas; como grafo, ~NIVELES^2 / 2 nodos.
+random.seed(4)
+NIVELES = 30
+plan = {}
+for nivel in range(NIVELES):
+    for i in range(nivel + 1):
+        plan[(nivel, i)] = {
+            'OR': [(('directo', nivel, i), int(2 ** (NIVELES - nivel) * random.uniform(0.8, 1.6)))],
+            'AND': [((nivel + 1, i), 1), ((nivel + 1, i + 1), 1)],
+        }
+        plan[('directo', nivel, i)] = {'OR': [('RESUELTO', 0)]}
+for i in range(NIVELES + 1):
+    plan[(NIVELES, i)] = {'OR': [('RESUELTO', 0)]}
+plan['RESUELTO'] = {}
+h_plan = dict.fromkeys(plan, 0)
+
+resultado = busqueda_ao_estrella(plan, h_plan, (0, 0))
+directos = sum(tipo == 'OR' and sucesores[0][0] == 'directo'
+               for tipo, sucesores in resultado['solucion'].values())
+print(f"Plan de {NIVELES} niveles: costo {resultado['costo']}, {resultado['nodos_expandidos']} expansiones, "
+      f"{resultado['revisiones']} revisiones, {len(resultado['solucion'])} nodos en la solución "
+      f"({directos} planes directos)")
+
+memo = {}
+busqueda_ao_estrella(plan, h_plan, (20, 10), resueltos=memo)
+resultado = busqueda_ao_estrella(plan, h_plan, (0, 0), resueltos=memo)
+print(f"Mismo plan tras resolver (20, 10) con memo de etiquetas RESUELTO: costo {resultado['costo']}, "
+      f"{resultado['nodos_expandidos']} expansiones")
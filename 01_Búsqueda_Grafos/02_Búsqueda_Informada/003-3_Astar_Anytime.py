@@ -0,0 +1,160 @@
+# Búsqueda A* Anytime Ponderada (ARA*) con Tiempo Límite
+
+import heapq
+import random
+import time
+
+def busqueda_a_estrella_anytime(grafo, costos, heuristica, inicio, objetivo,
+                                peso_inicial=3.0, decremento=0.5,
+                                tiempo_limite=None, limite_nodos=None):
+    """
+    ARA*: misma firma que busqueda_a_estrella más parámetros de presupuesto.
+    1. Encuentra rápido una solución con f = g + peso * h (peso > 1).
+    2. Reduce el peso y REUTILIZA la búsqueda anterior (g, padres y los nodos
+       inconsistentes) para mejorar la solución, hasta llegar a peso 1 o
+       agotar el tiempo (segundos) o el número de expansiones.
+    Cada solución informa su cota de subóptimo: costo <= cota * costo_óptimo.
+    Devuelve {'ruta', 'costo', 'cota', 'nodos_expandidos', 'soluciones'}.
+    """
+    t0 = time.perf_counter()
+    infinito = float('inf')
+    g_costos = {inicio: 0}
+    padres = {inicio: None}
+    abiertos = {}        # nodo -> clave actual en el montículo
+    cerrados = set()
+    inconsistentes = set()  # Mejorados tras cerrarse: se reabren en la siguiente iteración
+    monticulo = []
+    contador = 0
+    nodos_expandidos = 0
+    soluciones = []
+    peso = peso_inicial
+
+    def clave(nodo):
+        g = g_costos[nodo]
+        return (g + peso * heuristica.get(nodo, infinito), -g)  # Desempate: mayor g
+
+    def encolar(nodo):
+        nonlocal contador
+        contador += 1
+        abiertos[nodo] = clave(nodo)
+        heapq.heappush(monticulo, (abiertos[nodo], contador, nodo))
+
+    def presupuesto_agotado():
+        if limite_nodos is not None and nodos_expandidos >= limite_nodos:
+            return True
+        return tiempo_limite is not None and time.perf_counter() - t0 >= tiempo_limite
+
+    def mejorar_ruta():
+        """Expande mientras algún nodo abierto pueda mejorar g(objetivo) con el peso actual."""
+        nonlocal nodos_expandidos
+        while monticulo:
+            clave_min, _, nodo = monticulo[0]
+            if abiertos.get(nodo) != clave_min:
+                heapq.heappop(monticulo)  # Entrada obsoleta
+                continue
+            if g_costos.get(objetivo, infinito) <= clave_min[0]:
+                return True
+            if presupuesto_agotado():
+                return False
+
+            heapq.heappop(monticulo)
+            del abiertos[nodo]
+            cerrados.add(nodo)
+            nodos_expandidos += 1
+            for vecino, costo_arista in grafo.get(nodo, {}).items():
+                nuevo_g = g_costos[nodo] + costo_arista
+                if nuevo_g < g_costos.get(vecino, infinito):
+                    g_costos[vecino] = nuevo_g
+                    padres[vecino] = nodo
+                    if vecino in cerrados:
+                        inconsistentes.add(vecino)
+                    else:
+                        encolar(vecino)
+        return True
+
+    def registrar_solucion(completo):
+        # Cota: g(objetivo) / mínimo g + h entre los nodos aún abiertos o inconsistentes.
+        # El propio peso también es cota, pero solo si la iteración terminó.
+        pendientes = list(abiertos) + list(inconsistentes)
+        minimo = min((g_costos[n] + heuristica.get(n, infinito) for n in pendientes), default=infinito)
+        costo = g_costos[objetivo]
+        cota = costo / minimo if minimo > 0 else infinito
+        if completo:
+            cota = min(cota, peso)
+        ruta = []
+        nodo = objetivo
+        while nodo is not None:
+            ruta.append(nodo)
+            nodo = padres[nodo]
+        soluciones.append({'ruta': ruta[::-1], 'costo': costo, 'peso': peso, 'cota': max(cota, 1.0),
+                           'nodos_expandidos': nodos_expandidos,
+                           'tiempo_s': time.perf_counter() - t0})
+        return soluciones[-1]['cota']
+
+    encolar(inicio)
+    while True:
+        completo = mejorar_ruta()
+        if objetivo in g_costos and (not soluciones or g_costos[objetivo] < soluciones[-1]['costo']
+                                     or completo):
+            cota = registrar_solucion(completo)
+            if cota <= 1.0:
+                break  # Solución demostrada óptima
+        if not completo or peso <= 1.0 or not (monticulo or inconsistentes):
+            break
+
+        # Siguiente iteración: peso menor, se reabren los inconsistentes y se recalculan las claves
+        peso = max(1.0, peso - decremento)
+        for nodo in inconsistentes:
+            abiertos[nodo] = None
+        inconsistentes.clear()
+        cerrados.clear()
+        pendientes = list(abiertos)
+        abiertos.clear()
+        monticulo.clear()
+        for nodo in pendientes:
+            encolar(nodo)
+
+    mejor = soluciones[-1] if soluciones else {'ruta': None, 'costo': infinito, 'cota': infinito}
+    return {'ruta': mejor['ruta'], 'costo': mejor['costo'], 'cota': mejor['cota'],
+            'nodos_expandidos': nodos_expandidos, 'soluciones': soluciones}
+
+# Definición del Grafo con Costos (el mismo de A*)
+mapa_costos = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 5, 'E': 2},
+    'C': {'F': 3},
+    'D': {'G': 1},
+    'E': {'G': 8},
+    'F': {},
+    'G': {} # Objetivo
+}
+heuristica_g = {
+    'A': 8, 'B': 5, 'C': 5, 'D': 1, 'E': 2, 'F': 4, 'G': 0
+}
+
+resultado = busqueda_a_estrella_anytime(mapa_costos, mapa_costos, heuristica_g, 'A', 'G')
+print(f"ARA* (A → G): ruta {' → '.join(resultado['ruta'])}, costo {resultado['costo']}, cota {resultado['cota']:.2f}")
+print("-" * 60)
+
+# Rejilla 150 x 150 con costos aleatorios: la heurística Manhattan es débil
+random.seed(1)
+LADO = 150
+rejilla = {}
+for fila in range(LADO):
+    for columna in range(LADO):
+        rejilla[(fila, columna)] = {
+            (fila + df, columna + dc): random.randint(1, 10)
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= fila + df < LADO and 0 <= columna + dc < LADO
+        }
+meta = (LADO - 1, LADO - 1)
+manhattan = {nodo: abs(meta[0] - nodo[0]) + abs(meta[1] - nodo[1]) for nodo in rejilla}
+
+for limite in (0.05, None):
+    resultado = busqueda_a_estrella_anytime(rejilla, rejilla, manhattan, (0, 0), meta,
+                                            peso_inicial=3.0, decremento=0.5, tiempo_limite=limite)
+    print(f"Tiempo límite: {'sin límite' if limite is None else f'{limite * 1000:.0f} ms'}")
+    for solucion in resultado['soluciones']:
+        print(f"  peso {solucion['peso']:.1f}: costo {solucion['costo']:>5}, cota de subóptimo "
+              f"{solucion['cota']:.3f}, {solucion['nodos_expandidos']:>6} expansiones, "
+              f"{solucion['tiempo_s'] * 1000:7.1f} ms")
@@ -0,0 +1,255 @@
+# Búsquedas A* con Memoria Acotada: IDA* y SMA*
+
+import heapq
+import random
+
+_FIN = object()  # Centinela: el iterador de vecinos se agotó
+
+def busqueda_ida_estrella(grafo, costos, heuristica, inicio, objetivo):
+    """
+    IDA*: profundización iterativa sobre el límite de f = g + h.
+    Cada iteración es una DFS con pila explícita que poda los nodos con
+    f > límite; el siguiente límite es el menor f que se podó.
+    La memoria es O(profundidad de la solución): solo la ruta actual.
+    Devuelve {'ruta', 'costo', 'nodos_expandidos', 'iteraciones', 'memoria_maxima'}.
+    """
+    limite = heuristica[inicio]
+    nodos_expandidos = 0
+    memoria_maxima = 1
+    iteraciones = 0
+
+    while True:
+        iteraciones += 1
+        siguiente_limite = float('inf')
+        # Cada marco: (nodo, g, iterador de vecinos); en_ruta evita ciclos
+        pila = [(inicio, 0, iter(grafo.get(inicio, {}).items()))]
+        en_ruta = {inicio}
+
+        if inicio == objetivo:
+            return {'ruta': [inicio], 'costo': 0, 'nodos_expandidos': 0,
+                    'iteraciones': iteraciones, 'memoria_maxima': 1}
+
+        while pila:
+            nodo, g, vecinos = pila[-1]
+            vecino, costo_arista = next(vecinos, (_FIN, None))
+            if vecino is _FIN:
+                en_ruta.discard(nodo)
+                pila.pop()
+                continue
+            if vecino in en_ruta:
+                continue
+
+            nuevo_g = g + costo_arista
+            f = nuevo_g + heuristica.get(vecino, float('inf'))
+            if f > limite:
+                siguiente_limite = min(siguiente_limite, f)  # Candidato a próximo límite
+                continue
+            if vecino == objetivo:
+                return {'ruta': [marco[0] for marco in pila] + [vecino], 'costo': nuevo_g,
+                        'nodos_expandidos': nodos_expandidos, 'iteraciones': iteraciones,
+                        'memoria_maxima': memoria_maxima}
+
+            nodos_expandidos += 1
+            en_ruta.add(vecino)
+            pila.append((vecino, nuevo_g, iter(grafo.get(vecino, {}).items())))
+            memoria_maxima = max(memoria_maxima, len(pila))
+
+        if siguiente_limite == float('inf'):
+            return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': nodos_expandidos,
+                    'iteraciones': iteraciones, 'memoria_maxima': memoria_maxima}
+        limite = siguiente_limite
+
+
+class _NodoSMA:
+    """Nodo del árbol de búsqueda de SMA* (un estado puede aparecer por rutas distintas)."""
+    __slots__ = ('estado', 'g', 'f', 'profundidad', 'padre', 'indice', 'sucesores',
+                 'pendientes', 'f_olvidados', 'hijos', 'version', 'en_memoria')
+
+    def __init__(self, estado, g, f, padre, indice, sucesores):
+        self.estado = estado
+        self.g = g
+        self.f = f
+        self.padre = padre
+        self.profundidad = padre.profundidad + 1 if padre else 0
+        self.indice = indice                          # Posición entre los sucesores del padre
+        self.sucesores = sucesores                    # [(estado, costo)] sin ancestros (evita ciclos)
+        self.pendientes = list(range(len(sucesores)))  # Sucesores que no están en memoria
+        self.f_olvidados = {}                         # índice -> f respaldado del hijo olvidado
+        self.hijos = {}                               # índice -> _NodoSMA en memoria
+        self.version = 0
+        self.en_memoria = True
+
+def busqueda_sma_estrella(grafo, costos, heuristica, inicio, objetivo, limite_memoria=100):
+    """
+    SMA* (Simplified Memory-bounded A*): como A*, pero nunca guarda más de
+    'limite_memoria' nodos. Al llenarse la memoria se olvida la hoja con PEOR f
+    (la menos profunda en empate) y su f se respalda en el padre, que podrá
+    regenerarla si vuelve a ser prometedora. Es óptima si la ruta óptima cabe
+    en memoria (profundidad < limite_memoria).
+    Devuelve {'ruta', 'costo', 'nodos_generados', 'memoria_maxima'}.
+    """
+    infinito = float('inf')
+    abiertos = []   # Montículo (f, -profundidad): mejor nodo con sucesores pendientes
+    hojas = []      # Montículo (-f, profundidad): peor hoja para olvidar
+    contador = 0
+    en_memoria = 0
+    memoria_maxima = 0
+    nodos_generados = 0
+
+    def crear(estado, g, f, padre, indice):
+        ancestros = set()
+        nodo = padre
+        while nodo is not None:
+            ancestros.add(nodo.estado)
+            nodo = nodo.padre
+        ancestros.add(estado)
+        sucesores = [(v, c) for v, c in grafo.get(estado, {}).items() if v not in ancestros]
+        return _NodoSMA(estado, g, f, padre, indice, sucesores)
+
+    def actualizar(nodo):
+        """Registra el nuevo estado del nodo en ambos montículos (las entradas viejas caducan)."""
+        nonlocal contador
+        nodo.version += 1
+        contador += 1
+        if nodo.pendientes:
+            heapq.heappush(abiertos, (nodo.f, -nodo.profundidad, contador, nodo.version, nodo))
+        if not nodo.hijos and nodo.padre is not None:
+            heapq.heappush(hojas, (-nodo.f, nodo.profundidad, contador, nodo.version, nodo))
+
+    def vigente(entrada):
+        nodo = entrada[-1]
+        return nodo.en_memoria and nodo.version == entrada[-2]
+
+    def respaldar(nodo):
+        """Sube el f mínimo de los hijos cuando ya no quedan sucesores sin generar nunca."""
+        while nodo is not None:
+            if any(i not in nodo.f_olvidados for i in nodo.pendientes):
+                return  # Aún hay sucesores nunca generados: su f no se conoce
+            nuevo_f = min([h.f for h in nodo.hijos.values()] +
+                          [nodo.f_olvidados[i] for i in nodo.pendientes], default=infinito)
+            if nuevo_f == nodo.f:
+                return
+            nodo.f = nuevo_f
+            actualizar(nodo)
+            nodo = nodo.padre
+
+    def olvidar_peor_hoja(protegido):
+        nonlocal en_memoria
+        apartados = []
+        while hojas:
+            entrada = heapq.heappop(hojas)
+            if not vigente(entrada):
+                continue
+            hoja = entrada[-1]
+            if hoja is protegido:
+                apartados.append(entrada)
+                continue
+            padre = hoja.padre
+            del padre.hijos[hoja.indice]
+            padre.pendientes.append(hoja.indice)
+            padre.f_olvidados[hoja.indice] = hoja.f
+            hoja.en_memoria = False
+            en_memoria -= 1
+            actualizar(padre)
+            break
+        for entrada in apartados:
+            heapq.heappush(hojas, entrada)
+
+    if inicio == objetivo:
+        return {'ruta': [inicio], 'costo': 0, 'nodos_generados': 0, 'memoria_maxima': 1}
+
+    raiz = crear(inicio, 0, heuristica[inicio], None, None)
+    en_memoria = memoria_maxima = 1
+    actualizar(raiz)
+
+    while True:
+        # 1. Mejor nodo (menor f, más profundo) con algún sucesor por generar
+        while abiertos and not (vigente(abiertos[0]) and abiertos[0][-1].pendientes):
+            heapq.heappop(abiertos)
+        if not abiertos or abiertos[0][0] == infinito:
+            return {'ruta': None, 'costo': infinito, 'nodos_generados': nodos_generados,
+                    'memoria_maxima': memoria_maxima}
+        mejor = abiertos[0][-1]
+
+        if mejor.estado == objetivo:
+            ruta = []
+            nodo = mejor
+            while nodo is not None:
+                ruta.append(nodo.estado)
+                nodo = nodo.padre
+            return {'ruta': ruta[::-1], 'costo': mejor.g, 'nodos_generados': nodos_generados,
+                    'memoria_maxima': memoria_maxima}
+
+        # 2. Generar el SIGUIENTE sucesor (uno a la vez), liberando memoria si hace falta
+        if en_memoria >= limite_memoria:
+            olvidar_peor_hoja(protegido=mejor)
+            if mejor.estado != objetivo and not mejor.pendientes:
+                continue
+        indice = mejor.pendientes.pop(0)
+        estado, costo_arista = mejor.sucesores[indice]
+        g = mejor.g + costo_arista
+        if estado != objetivo and mejor.profundidad + 1 >= limite_memoria - 1:
+            f = infinito  # La ruta no cabe en memoria
+        else:
+            # Pathmax: f nunca disminuye a lo largo de una ruta; se recuerda el f olvidado
+            f = max(mejor.f, g + heuristica.get(estado, infinito), mejor.f_olvidados.pop(indice, 0))
+        hijo = crear(estado, g, f, mejor, indice)
+        if estado == objetivo:
+            hijo.pendientes = [0]  # El objetivo debe poder seleccionarse como "mejor"
+            hijo.sucesores = [(estado, 0)]
+        elif not hijo.sucesores:
+            hijo.f = infinito  # Callejón sin salida: ninguna solución pasa por aquí
+        mejor.hijos[indice] = hijo
+        nodos_generados += 1
+        en_memoria += 1
+        memoria_maxima = max(memoria_maxima, en_memoria)
+        actualizar(hijo)
+        actualizar(mejor)
+
+        # 3. Si ya se generaron todos los sucesores, respaldar f hacia los ancestros
+        respaldar(mejor)
+
+
+# Definición del Grafo con Costos (el mismo de A*)
+mapa_costos = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 5, 'E': 2},
+    'C': {'F': 3},
+    'D': {'G': 1},
+    'E': {'G': 8},
+    'F': {},
+    'G': {} # Objetivo
+}
+heuristica_g = {
+    'A': 8, 'B': 5, 'C': 5, 'D': 1, 'E': 2, 'F': 4, 'G': 0
+}
+
+resultado = busqueda_ida_estrella(mapa_costos, mapa_costos, heuristica_g, 'A', 'G')
+print(f"IDA* (A → G): {' → '.join(resultado['ruta'])}, costo {resultado['costo']}, "
+      f"{resultado['iteraciones']} iteraciones")
+resultado = busqueda_sma_estrella(mapa_costos, mapa_costos, heuristica_g, 'A', 'G', limite_memoria=5)
+print(f"SMA* (A → G, 5 nodos): {' → '.join(resultado['ruta'])}, costo {resultado['costo']}, "
+      f"memoria máxima {resultado['memoria_maxima']}")
+print("-" * 60)
+
+# Rejilla 12 x 12 con costos aleatorios y heurística Manhattan
+random.seed(3)
+LADO = 12
+rejilla = {}
+for fila in range(LADO):
+    for columna in range(LADO):
+        rejilla[(fila, columna)] = {
+            (fila + df, columna + dc): random.randint(1, 4)
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= fila + df < LADO and 0 <= columna + dc < LADO
+        }
+meta = (LADO - 1, LADO - 1)
+manhattan = {nodo: abs(meta[0] - nodo[0]) + abs(meta[1] - nodo[1]) for nodo in rejilla}
+
+resultado = busqueda_ida_estrella(rejilla, rejilla, manhattan, (0, 0), meta)
+print(f"IDA* rejilla: costo {resultado['costo']}, {resultado['nodos_expandidos']} expansiones, "
+      f"memoria máxima {resultado['memoria_maxima']} nodos")
+for limite in (60, 200, 1000):
+    resultado = busqueda_sma_estrella(rejilla, rejilla, manhattan, (0, 0), meta, limite_memoria=limite)
+    print(f"SMA* rejilla (límite {limite:>4}): costo {resultado['costo']}, "
+          f"{resultado['nodos_generados']} nodos generados, memoria máxima {resultado['memoria_maxima']}")
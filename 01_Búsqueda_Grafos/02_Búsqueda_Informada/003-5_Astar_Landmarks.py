@@ -0,0 +1,186 @@
+# Búsqueda A* con Heurística ALT (A*, Landmarks y Desigualdad Triangular)
+
+import heapq
+import random
+import time
+from collections.abc import Mapping
+import numpy as np
+
+def dijkstra_todos(grafo, origen, indices):
+    """Distancias de 'origen' a todos los nodos como vector float32 (inf = inalcanzable)."""
+    distancias = np.full(len(indices), np.inf, dtype=np.float32)
+    g_costos = {origen: 0}
+    cola = [(0, origen)]
+    while cola:
+        g, nodo = heapq.heappop(cola)
+        if g > g_costos[nodo]:
+            continue  # Entrada obsoleta
+        distancias[indices[nodo]] = g
+        for vecino, costo_arista in grafo.get(nodo, {}).items():
+            nuevo_g = g + costo_arista
+            if nuevo_g < g_costos.get(vecino, float('inf')):
+                g_costos[vecino] = nuevo_g
+                heapq.heappush(cola, (nuevo_g, vecino))
+    return distancias
+
+def invertir_grafo(grafo):
+    invertido = {nodo: {} for nodo in grafo}
+    for nodo, vecinos in grafo.items():
+        for vecino, costo_arista in vecinos.items():
+            invertido.setdefault(vecino, {})[nodo] = costo_arista
+    return invertido
+
+INALCANZABLE = np.float32(1e30)  # Sustituye a inf en la matriz: inf - inf daría nan
+
+class HeuristicaALT(Mapping):
+    """
+    Vista {nodo: h(n)} hacia un objetivo fijo, calculada en O(k) por consulta con
+    la desigualdad triangular sobre cada landmark L:
+        h(v) = max_L max(d(L, t) - d(L, v), d(v, L) - d(t, L))
+    Se pasa tal cual como 'heuristica' a busqueda_a_estrella (003-1_Astar.py)
+    o a busqueda_a_estrella_alt.
+    """
+
+    def __init__(self, landmarks, objetivo):
+        self._landmarks = landmarks
+        self._fila_t = landmarks.distancias[landmarks.indices[objetivo]]
+
+    def __getitem__(self, nodo):
+        # Una resta y un máximo sobre 2k valores: [d(L,t) - d(L,v) | d(v,L) - d(t,L)]
+        h = float((self._fila_t - self._landmarks.distancias[self._landmarks.indices[nodo]]).max())
+        if h >= INALCANZABLE / 2:
+            return float('inf')  # Algún landmark demuestra que el objetivo es inalcanzable
+        return max(h, 0.0)
+
+    def __iter__(self):
+        return iter(self._landmarks.indices)
+
+    def __len__(self):
+        return len(self._landmarks.indices)
+
+class Landmarks:
+    """
+    Preprocesado ALT: elige k landmarks por selección del punto más lejano y
+    guarda una matriz float32 de n x 2k (una fila contigua por nodo) con
+    [d(L1, v) ... d(Lk, v) | -d(v, L1) ... -d(v, Lk)]. Con costos enteros < 2^24
+    las distancias en float32 son exactas y la heurística es admisible.
+    """
+
+    def __init__(self, grafo, k=8, semilla=0):
+        invertido = invertir_grafo(grafo)
+        self.nombres = list(invertido)
+        self.indices = {nodo: i for i, nodo in enumerate(self.nombres)}
+        self.landmarks = []
+        desde, hacia = [], []
+
+        # 1. Selección del punto más lejano: el siguiente landmark es el nodo cuya
+        #    distancia mínima a los ya elegidos es máxima (el primero, desde uno aleatorio)
+        actual = random.Random(semilla).choice(self.nombres)
+        lejania = dijkstra_todos(grafo, actual, self.indices)
+        for _ in range(min(k, len(self.nombres))):
+            candidatos = np.where(np.isfinite(lejania), lejania, -1.0)
+            candidatos[[self.indices[l] for l in self.landmarks]] = -2.0  # Ya elegidos
+            actual = self.nombres[int(np.argmax(candidatos))]
+            self.landmarks.append(actual)
+
+            # 2. Caminos mínimos de uno a todos desde y hacia el landmark
+            desde.append(dijkstra_todos(grafo, actual, self.indices))
+            hacia.append(dijkstra_todos(invertido, actual, self.indices))
+            lejania = desde[-1] if len(desde) == 1 else np.minimum(lejania, desde[-1])
+
+        # 3. Matriz compacta: inf -> INALCANZABLE y las distancias 'hacia' con signo negativo
+        distancias = np.concatenate([np.stack(desde, axis=1), -np.stack(hacia, axis=1)], axis=1)
+        self.distancias = np.ascontiguousarray(
+            np.nan_to_num(distancias, posinf=INALCANZABLE, neginf=-INALCANZABLE), dtype=np.float32)
+
+    def heuristica(self, objetivo):
+        return HeuristicaALT(self, objetivo)
+
+def busqueda_a_estrella_alt(grafo, costos, heuristica, inicio, objetivo):
+    """
+    A* con entradas obsoletas descartadas y ruta reconstruida. Recibe los mismos
+    parámetros que busqueda_a_estrella de 003-1_Astar.py, pero su resultado es
+    distinto (de ahí el otro nombre): {'ruta', 'costo', 'nodos_expandidos'}.
+    """
+    cola_prioridad = [(heuristica[inicio], 0, inicio)]
+    g_costos = {inicio: 0}
+    padres = {inicio: None}
+    cerrados = set()
+    nodos_expandidos = 0
+
+    while cola_prioridad:
+        _, g, nodo_actual = heapq.heappop(cola_prioridad)
+        if nodo_actual in cerrados or g > g_costos[nodo_actual]:
+            continue
+        if nodo_actual == objetivo:
+            ruta = []
+            while nodo_actual is not None:
+                ruta.append(nodo_actual)
+                nodo_actual = padres[nodo_actual]
+            return {'ruta': ruta[::-1], 'costo': g, 'nodos_expandidos': nodos_expandidos}
+
+        cerrados.add(nodo_actual)
+        nodos_expandidos += 1
+        for vecino, costo_arista in grafo.get(nodo_actual, {}).items():
+            nuevo_g_costo = g + costo_arista
+            if nuevo_g_costo < g_costos.get(vecino, float('inf')):
+                g_costos[vecino] = nuevo_g_costo
+                padres[vecino] = nodo_actual
+                cerrados.discard(vecino)
+                f_vecino = nuevo_g_costo + heuristica.get(vecino, float('inf'))
+                heapq.heappush(cola_prioridad, (f_vecino, nuevo_g_costo, vecino))
+
+    return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': nodos_expandidos}
+
+# Definición del Grafo con Costos (el mismo de A*)
+mapa_costos = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'D': 5, 'E': 2},
+    'C': {'F': 3},
+    'D': {'G': 1},
+    'E': {'G': 8},
+    'F': {},
+    'G': {} # Objetivo
+}
+
+landmarks = Landmarks(mapa_costos, k=2)
+heuristica_alt = landmarks.heuristica('G')
+resultado = busqueda_a_estrella_alt(mapa_costos, mapa_costos, heuristica_alt, 'A', 'G')
+print(f"Landmarks: {landmarks.landmarks}")
+print(f"h ALT hacia 'G': { {nodo: heuristica_alt[nodo] for nodo in mapa_costos} }")
+print(f"A* con ALT (A → G): {' → '.join(resultado['ruta'])}, costo {resultado['costo']}")
+print("-" * 60)
+
+# Red vial sintética 80 x 80: los costos (tiempos) no guardan relación con la
+# geometría, así que la distancia Manhattan (costo mínimo 1 por paso) es muy débil
+random.seed(7)
+LADO = 80
+red = {}
+for fila in range(LADO):
+    for columna in range(LADO):
+        rapida = fila % 10 == 0 or columna % 10 == 0  # Avenidas cada 10 calles
+        red[(fila, columna)] = {
+            (fila + df, columna + dc): random.randint(1, 3) if rapida else random.randint(5, 30)
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= fila + df < LADO and 0 <= columna + dc < LADO
+        }
+
+t0 = time.perf_counter()
+landmarks = Landmarks(red, k=8)
+print(f"Preprocesado ALT: {len(landmarks.landmarks)} landmarks en {time.perf_counter() - t0:.2f}s, "
+      f"matriz float32 de {landmarks.distancias.nbytes / 1024:.0f} KiB")
+
+consultas = [(random.choice(list(red)), random.choice(list(red))) for _ in range(20)]
+for nombre, crear_heuristica in (
+        ("Dijkstra (h = 0)", lambda meta: dict.fromkeys(red, 0)),
+        ("Manhattan", lambda meta: {n: abs(n[0] - meta[0]) + abs(n[1] - meta[1]) for n in red}),
+        ("ALT (k = 8)", landmarks.heuristica)):
+    expansiones, costos_ruta = 0, []
+    t0 = time.perf_counter()
+    for origen, destino in consultas:
+        resultado = busqueda_a_estrella_alt(red, red, crear_heuristica(destino), origen, destino)
+        expansiones += resultado['nodos_expandidos']
+        costos_ruta.append(resultado['costo'])
+    print(f"{nombre:<17} {expansiones / len(consultas):8.0f} expansiones/consulta, "
+          f"{(time.perf_counter() - t0) * 1000 / len(consultas):6.1f} ms/consulta, "
+          f"costo total {sum(costos_ruta)}")
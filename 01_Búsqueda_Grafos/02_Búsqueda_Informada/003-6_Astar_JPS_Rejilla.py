@@ -0,0 +1,230 @@
+# Búsqueda A* en Rejillas de Ocupación: Jump Point Search (JPS) con Heurística Octil
+
+import heapq
+import math
+import random
+import time
+import numpy as np
+
+RAIZ2 = math.sqrt(2)
+DIRECCIONES = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+def octil(df, dc):
+    """Distancia octil: movimientos rectos de costo 1 y diagonales de costo raíz de 2."""
+    df, dc = abs(df), abs(dc)
+    return RAIZ2 * min(df, dc) + abs(df - dc)
+
+def preparar_rejilla(ocupado):
+    """
+    Convierte la matriz booleana (True = obstáculo) en un bytes de 1 byte por
+    celda con un borde de obstáculos, para indexar celdas por posición lineal
+    p = fila * ancho + columna sin comprobar límites.
+    """
+    alto, ancho = ocupado.shape
+    libre = np.zeros((alto + 2, ancho + 2), dtype=np.uint8)
+    libre[1:-1, 1:-1] = ~ocupado
+    return libre.tobytes(), ancho + 2
+
+def _movimiento_valido(libre, ancho, p, df, dc):
+    # Diagonal solo si ambas celdas rectas adyacentes están libres (no se cortan esquinas)
+    if not libre[p + df * ancho + dc]:
+        return False
+    return not (df and dc) or (libre[p + df * ancho] and libre[p + dc])
+
+def _reconstruir(padres, p, ancho):
+    ruta = []
+    while p is not None:
+        ruta.append((p // ancho - 1, p % ancho - 1))
+        p = padres[p]
+    return ruta[::-1]
+
+def busqueda_a_estrella_rejilla(ocupado, inicio, objetivo):
+    """
+    A* de referencia sobre la rejilla (8 vecinos, heurística octil), sin
+    construir un grafo de diccionarios. Devuelve la ruta celda a celda y
+    {'ruta', 'costo', 'nodos_expandidos', 'operaciones_heap'}.
+    """
+    libre, ancho = preparar_rejilla(ocupado)
+    p_inicio = (inicio[0] + 1) * ancho + inicio[1] + 1
+    p_meta = (objetivo[0] + 1) * ancho + objetivo[1] + 1
+    f_meta, c_meta = objetivo[0] + 1, objetivo[1] + 1
+    if not libre[p_inicio] or not libre[p_meta]:
+        return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': 0, 'operaciones_heap': 0}
+
+    g_costos = {p_inicio: 0.0}
+    padres = {p_inicio: None}
+    cerrados = set()
+    cola = [(octil(inicio[0] - objetivo[0], inicio[1] - objetivo[1]), 0.0, p_inicio)]
+    operaciones_heap = 1
+    nodos_expandidos = 0
+
+    while cola:
+        _, g, p = heapq.heappop(cola)
+        operaciones_heap += 1
+        if p in cerrados:
+            continue
+        if p == p_meta:
+            return {'ruta': _reconstruir(padres, p, ancho), 'costo': g,
+                    'nodos_expandidos': nodos_expandidos, 'operaciones_heap': operaciones_heap}
+        cerrados.add(p)
+        nodos_expandidos += 1
+        for df, dc in DIRECCIONES:
+            if not _movimiento_valido(libre, ancho, p, df, dc):
+                continue
+            vecino = p + df * ancho + dc
+            nuevo_g = g + (RAIZ2 if df and dc else 1.0)
+            if nuevo_g < g_costos.get(vecino, float('inf')):
+                g_costos[vecino] = nuevo_g
+                padres[vecino] = p
+                h = octil(vecino // ancho - f_meta, vecino % ancho - c_meta)
+                heapq.heappush(cola, (nuevo_g + h, nuevo_g, vecino))
+                operaciones_heap += 1
+
+    return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': nodos_expandidos,
+            'operaciones_heap': operaciones_heap}
+
+def _saltar_recto(libre, ancho, p, paso, lateral, p_meta):
+    """Avanza en línea recta hasta el objetivo, un obstáculo (None) o un vecino forzado."""
+    while True:
+        p += paso
+        if not libre[p]:
+            return None
+        if p == p_meta:
+            return p
+        # Vecino forzado: un lateral se abre justo después de un obstáculo
+        if (libre[p + lateral] and not libre[p - paso + lateral]) or \
+           (libre[p - lateral] and not libre[p - paso - lateral]):
+            return p
+
+def _saltar(libre, ancho, p, df, dc, p_meta):
+    """Salto JPS desde p en la dirección (df, dc); devuelve el punto de salto o None."""
+    if not (df and dc):
+        paso = df * ancho + dc
+        return _saltar_recto(libre, ancho, p, paso, 1 if df else ancho, p_meta)
+    paso = df * ancho + dc
+    while True:
+        p += paso
+        if not libre[p]:
+            return None
+        if p == p_meta:
+            return p
+        # En diagonal, p es punto de salto si algún salto recto desde él encuentra algo
+        if _saltar_recto(libre, ancho, p, dc, ancho, p_meta) is not None or \
+           _saltar_recto(libre, ancho, p, df * ancho, 1, p_meta) is not None:
+            return p
+        if not (libre[p + dc] and libre[p + df * ancho]):
+            return None  # No se puede seguir en diagonal sin cortar una esquina
+
+def _direcciones_podadas(libre, ancho, p, padre):
+    """Direcciones naturales y forzadas a explorar desde p según la dirección de llegada."""
+    if padre is None:
+        return [(df, dc) for df, dc in DIRECCIONES if _movimiento_valido(libre, ancho, p, df, dc)]
+    fila, columna = divmod(p, ancho)
+    fila_padre, columna_padre = divmod(padre, ancho)
+    df = (fila > fila_padre) - (fila < fila_padre)
+    dc = (columna > columna_padre) - (columna < columna_padre)
+
+    direcciones = []
+    if df and dc:
+        if libre[p + df * ancho]:
+            direcciones.append((df, 0))
+        if libre[p + dc]:
+            direcciones.append((0, dc))
+        if libre[p + df * ancho] and libre[p + dc]:
+            direcciones.append((df, dc))
+    elif dc:
+        siguiente = libre[p + dc]
+        for lado in (-1, 1):
+            if libre[p + lado * ancho]:
+                direcciones.append((lado, 0))
+                if siguiente:
+                    direcciones.append((lado, dc))
+        if siguiente:
+            direcciones.append((0, dc))
+    else:
+        siguiente = libre[p + df * ancho]
+        for lado in (-1, 1):
+            if libre[p + lado]:
+                direcciones.append((0, lado))
+                if siguiente:
+                    direcciones.append((df, lado))
+        if siguiente:
+            direcciones.append((df, 0))
+    return direcciones
+
+def busqueda_jps(ocupado, inicio, objetivo):
+    """
+    Jump Point Search sobre una matriz de ocupación de numpy (True = obstáculo),
+    8 vecinos sin cortar esquinas y heurística octil. En lugar de encolar cada
+    celda, salta en línea recta o diagonal hasta los puntos de salto (cambios
+    de dirección obligados por obstáculos), así que solo estos pasan por el montículo.
+    Devuelve {'ruta' (puntos de paso), 'costo', 'nodos_expandidos', 'operaciones_heap'}.
+    """
+    libre, ancho = preparar_rejilla(ocupado)
+    p_inicio = (inicio[0] + 1) * ancho + inicio[1] + 1
+    p_meta = (objetivo[0] + 1) * ancho + objetivo[1] + 1
+    f_meta, c_meta = objetivo[0] + 1, objetivo[1] + 1
+    if not libre[p_inicio] or not libre[p_meta]:
+        return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': 0, 'operaciones_heap': 0}
+
+    g_costos = {p_inicio: 0.0}
+    padres = {p_inicio: None}
+    cerrados = set()
+    cola = [(octil(inicio[0] - objetivo[0], inicio[1] - objetivo[1]), 0.0, p_inicio)]
+    operaciones_heap = 1
+    nodos_expandidos = 0
+
+    while cola:
+        _, g, p = heapq.heappop(cola)
+        operaciones_heap += 1
+        if p in cerrados:
+            continue
+        if p == p_meta:
+            return {'ruta': _reconstruir(padres, p, ancho), 'costo': g,
+                    'nodos_expandidos': nodos_expandidos, 'operaciones_heap': operaciones_heap}
+        cerrados.add(p)
+        nodos_expandidos += 1
+
+        for df, dc in _direcciones_podadas(libre, ancho, p, padres[p]):
+            salto = _saltar(libre, ancho, p, df, dc, p_meta)
+            if salto is None or salto in cerrados:
+                continue
+            nuevo_g = g + octil(salto // ancho - p // ancho, salto % ancho - p % ancho)
+            if nuevo_g < g_costos.get(salto, float('inf')):
+                g_costos[salto] = nuevo_g
+                padres[salto] = p
+                h = octil(salto // ancho - f_meta, salto % ancho - c_meta)
+                heapq.heappush(cola, (nuevo_g + h, nuevo_g, salto))
+                operaciones_heap += 1
+
+    return {'ruta': None, 'costo': float('inf'), 'nodos_expandidos': nodos_expandidos,
+            'operaciones_heap': operaciones_heap}
+
+# Rejilla pequeña: 0 = libre, 1 = obstáculo
+mapa = np.array([
+    [0, 0, 0, 0, 0, 0, 0],
+    [0, 1, 1, 1, 1, 1, 0],
+    [0, 0, 0, 0, 0, 1, 0],
+    [1, 1, 1, 1, 0, 1, 0],
+    [0, 0, 0, 0, 0, 0, 0],
+], dtype=bool)
+resultado = busqueda_jps(mapa, (0, 0), (4, 0))
+print(f"JPS (0, 0) → (4, 0): puntos de paso {resultado['ruta']}, costo {resultado['costo']:.3f}")
+print("-" * 60)
+
+# Mapa abierto 500 x 500 con obstáculos rectangulares dispersos
+random.seed(5)
+LADO = 500
+ocupado = np.zeros((LADO, LADO), dtype=bool)
+for _ in range(100):
+    fila, columna = random.randrange(LADO), random.randrange(LADO)
+    ocupado[fila:fila + random.randint(2, 40), columna:columna + random.randint(2, 40)] = True
+ocupado[0, 0] = ocupado[-1, -1] = False
+print(f"Mapa {LADO} x {LADO}: {ocupado.nbytes / 1024:.0f} KiB como matriz de numpy")
+
+for nombre, buscar in (("A* celda a celda", busqueda_a_estrella_rejilla), ("JPS", busqueda_jps)):
+    t0 = time.perf_counter()
+    resultado = buscar(ocupado, (0, 0), (LADO - 1, LADO - 1))
+    print(f"{nombre:<17} costo {resultado['costo']:.3f}, {len(resultado['ruta']):>4} puntos en la ruta, "
+          f"{resultado['nodos_expandidos']:>6} expansiones, {resultado['operaciones_heap']:>6} operaciones "
+          f"de montículo, {(time.perf_counter() - t0) * 1000:6.0f} ms")
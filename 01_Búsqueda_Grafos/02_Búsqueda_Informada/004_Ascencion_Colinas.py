@@ -1,30 +1,25 @@
 # Búsqueda de Ascensión de Colinas (Steepest Ascent)
 
+import os
 import random
+import runpy
+import time
+
+# Tablero compartido (tablero_reinas.py). Se carga con runpy por ruta absoluta,
+# como en 012_Benchmark_Busquedas.py, para que funcione aunque este script se
+# ejecute desde otro directorio
+TableroReinas = runpy.run_path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablero_reinas.py"))['TableroReinas']
 
 # Función de Valoración (Heurística): Número de pares de reinas que NO se atacan
 def evaluar_estado(tablero):
     """
     Calcula la "bondad" del tablero. Queremos MAXIMIZAR este valor.
     El máximo posible de pares que no se atacan es 8 * 7 / 2 = 28.
+    Cuenta los ataques (misma fila o diagonal) con los contadores de
+    TableroReinas: O(n) en lugar de comparar los O(n²) pares.
     """
-    ataques = 0
-    n = len(tablero) # 8
-    
-    # Comprobar ataques por pares
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Ataque en la misma fila (no debería ocurrir en esta representación)
-            if tablero[i] == tablero[j]:
-                ataques += 1
-            # Ataque en diagonal: |fila1 - fila2| == |columna1 - columna2|
-            elif abs(i - j) == abs(tablero[i] - tablero[j]):
-                ataques += 1
-                
-    # La bondad (valoración) es el total de pares menos los ataques
-    total_pares = n * (n - 1) // 2 
-    valoracion = total_pares - ataques
-    return valoracion
+    return TableroReinas(tablero).valoracion
 
 # Función para obtener todos los vecinos (moviendo una reina por una columna)
 def obtener_vecinos(tablero):
@@ -73,6 +68,89 @@ def hill_climbing(n=8):
         valoracion_actual = mejor_valoracion
         print(f"Ascenso: {tablero_actual} (Valoración: {valoracion_actual})")
 
+def iterar_vecinos(tablero, inicio=0):
+    """
+    Recorre perezosamente los n(n-1) movimientos (columna, nueva_fila) sin crear
+    tableros: memoria O(1) por paso. 'inicio' rota el punto de partida del
+    recorrido (útil para primera mejora sin sesgo hacia las primeras columnas).
+    """
+    n = tablero.n
+    for k in range(inicio, inicio + n * n):
+        columna, fila = divmod(k % (n * n), n)
+        if fila != tablero.filas[columna]:
+            yield columna, fila
+
+def muestrear_vecinos(tablero, cantidad, rng):
+    """Genera 'cantidad' movimientos aleatorios (con reemplazo) sin recorrer el vecindario."""
+    n = tablero.n
+    for _ in range(cantidad):
+        columna, fila = rng.randrange(n), rng.randrange(n - 1)
+        yield columna, fila + (fila >= tablero.filas[columna])  # Salta la fila actual
+
+ESTRATEGIAS = ('maxima_pendiente', 'primera_mejora', 'muestreo')
+
+def hill_climbing_incremental(n=8, estrategia='primera_mejora', max_reinicios=10, max_laterales=100,
+                              presupuesto_evaluaciones=1_000_000, tamano_muestra=None, semilla=None):
+    """
+    Ascensión de colinas sobre TableroReinas con vecinos perezosos y deltas O(1).
+    Estrategias:
+      - 'maxima_pendiente': recorre todo el vecindario y toma el mejor movimiento.
+      - 'primera_mejora': toma el primer movimiento que mejora.
+      - 'muestreo': evalúa 'tamano_muestra' movimientos aleatorios y toma el mejor.
+    Si no hay mejora se admiten hasta 'max_laterales' movimientos laterales
+    (delta 0) o muestras fallidas seguidas; después se reinicia desde un tablero
+    aleatorio (hasta 'max_reinicios' veces). Cada delta evaluado consume el presupuesto.
+    Devuelve {'tablero', 'conflictos', 'evaluaciones', 'pasos', 'reinicios'}.
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia desconocida: {estrategia!r} (válidas: {', '.join(ESTRATEGIAS)})")
+    rng = random.Random(semilla)
+    tamano_muestra = tamano_muestra or min(4 * n, 64)
+    mejor_tablero, mejor_conflictos = None, float('inf')
+    evaluaciones = pasos = reinicios = 0
+
+    while True:
+        tablero = TableroReinas([rng.randrange(n) for _ in range(n)])
+        laterales = 0
+        while tablero.conflictos > 0 and evaluaciones < presupuesto_evaluaciones:
+            # 1. Elección del movimiento según la estrategia (sin materializar vecinos)
+            if estrategia == 'muestreo':
+                movimientos = muestrear_vecinos(tablero, tamano_muestra, rng)
+            else:
+                movimientos = iterar_vecinos(tablero, rng.randrange(n * n))
+            mejor_movimiento, mejor_delta, lateral = None, 0, None
+            for columna, fila in movimientos:
+                evaluaciones += 1
+                delta = tablero.delta(columna, fila)
+                if delta < mejor_delta:
+                    mejor_movimiento, mejor_delta = (columna, fila), delta
+                    if estrategia == 'primera_mejora':
+                        break
+                elif delta == 0 and lateral is None:
+                    lateral = (columna, fila)
+                if evaluaciones >= presupuesto_evaluaciones:
+                    break
+
+            # 2. Ascenso, movimiento lateral o fin de esta subida
+            if mejor_movimiento is not None:
+                laterales = 0
+            elif laterales < max_laterales and (lateral is not None or estrategia == 'muestreo'):
+                mejor_movimiento = lateral  # En muestreo puede no haberlo: se vuelve a muestrear
+                laterales += 1
+            else:
+                break  # Óptimo local (o meseta agotada)
+            if mejor_movimiento is None:
+                continue
+            tablero.mover(*mejor_movimiento)
+            pasos += 1
+
+        if tablero.conflictos < mejor_conflictos:
+            mejor_tablero, mejor_conflictos = tablero.tupla(), tablero.conflictos
+        if mejor_conflictos == 0 or reinicios >= max_reinicios or evaluaciones >= presupuesto_evaluaciones:
+            return {'tablero': mejor_tablero, 'conflictos': mejor_conflictos,
+                    'evaluaciones': evaluaciones, 'pasos': pasos, 'reinicios': reinicios}
+        reinicios += 1
+
 # Ejecución del algoritmo
 SOLUCION_OPT = 28 # El valor de valoración ideal (máximo de pares sin atacar)
 resultado_tablero, resultado_valoracion = hill_climbing()
@@ -85,4 +163,39 @@ print(f"  Valoración: {resultado_valoracion} / {SOLUCION_OPT} (Máximo)")
 if resultado_valoracion == SOLUCION_OPT:
     print("  ¡Éxito! Se encontró una solución global (no hay ataques).")
 else:
-    print("  La búsqueda se detuvo en un ÓPTIMO LOCAL.")
\ No newline at end of file
+    print("  La búsqueda se detuvo en un ÓPTIMO LOCAL.")
+# Evaluación incremental: delta de un movimiento en O(1) frente a recontar los pares
+print("-" * 50)
+tablero = TableroReinas(resultado_tablero)
+columna, fila = 0, (resultado_tablero[0] + 1) % len(resultado_tablero)
+vecino = list(resultado_tablero)
+vecino[columna] = fila
+print(f"Delta de mover la reina de la columna {columna} a la fila {fila}: {tablero.delta(columna, fila)} "
+      f"ataques (recontando: {evaluar_estado(resultado_tablero) - evaluar_estado(tuple(vecino))})")
+
+random.seed(0)
+N_GRANDE = 200_000
+tablero = TableroReinas([random.randrange(N_GRANDE) for _ in range(N_GRANDE)])
+t0 = time.perf_counter()
+for _ in range(100_000):
+    columna = random.randrange(N_GRANDE)
+    fila = random.randrange(N_GRANDE)
+    if tablero.delta(columna, fila) < 0:
+        tablero.mover(columna, fila)  # Solo se aplican los movimientos que mejoran
+print(f"n = {N_GRANDE:,}: 100,000 deltas evaluados en {time.perf_counter() - t0:.2f}s, "
+      f"ataques {TableroReinas(tablero.filas).conflictos} (recalculado) = {tablero.conflictos} (incremental)")
+
+# Estrategias con vecinos perezosos: memoria constante por paso
+print("-" * 50)
+for estrategia in ESTRATEGIAS:
+    resultados = [hill_climbing_incremental(8, estrategia, semilla=semilla) for semilla in range(50)]
+    exitos = sum(r['conflictos'] == 0 for r in resultados)
+    evaluaciones = sum(r['evaluaciones'] for r in resultados) / len(resultados)
+    print(f"n = 8, {estrategia:<16}: {exitos}/50 soluciones, {evaluaciones:7.0f} evaluaciones de media")
+
+for n, estrategia in ((1000, 'primera_mejora'), (1000, 'muestreo'), (100_000, 'muestreo')):
+    t0 = time.perf_counter()
+    resultado = hill_climbing_incremental(n, estrategia, max_laterales=500,
+                                          presupuesto_evaluaciones=2_000_000, semilla=1)
+    print(f"n = {n:,}, {estrategia:<16}: {resultado['conflictos']} ataques, {resultado['pasos']} pasos, "
+          f"{resultado['evaluaciones']:,} evaluaciones, {time.perf_counter() - t0:.2f}s")
@@ -1,18 +1,21 @@
 # Búsqueda Tabú (Tabu Search) para las 8 Reinas
 
+import os
 import random
+import runpy
+import time
+from collections import deque
+
+# Tablero compartido (tablero_reinas.py). Se carga con runpy por ruta absoluta,
+# como en 012_Benchmark_Busquedas.py, para que funcione aunque este script se
+# ejecute desde otro directorio
+TableroReinas = runpy.run_path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablero_reinas.py"))['TableroReinas']
 
 # Valoración: Pares de reinas que NO se atacan (MÁXIMO 28)
 def evaluar_estado(tablero):
-    ataques = 0
-    n = len(tablero)
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Comprueba ataques en diagonal
-            if abs(i - j) == abs(tablero[i] - tablero[j]):
-                ataques += 1
-    total_pares = n * (n - 1) // 2 
-    return total_pares - ataques
+    # Ataques en fila y diagonal contados con TableroReinas en O(n)
+    return TableroReinas(tablero).valoracion
 
 # Función para obtener vecinos y los movimientos
 def obtener_vecinos_y_movimientos(tablero):
@@ -97,6 +100,88 @@ def busqueda_tabu(n=8, tenencia_tabu=7, max_iteraciones=1000):
             
     return mejor_tablero_global, mejor_valoracion_global
 
+class MemoriaTabu:
+    """
+    Memoria tabú con consulta y expiración O(1): un diccionario
+    movimiento -> última iteración en que sigue prohibido, y una cola en orden
+    de inserción para purgar los vencidos sin recorrer toda la memoria.
+    Un movimiento prohibido en la iteración i es tabú en las iteraciones
+    i + 1 ... i + tenencia (igual que la lista de los últimos 'tenencia' movimientos).
+    """
+
+    def __init__(self, tenencia):
+        self.tenencia = tenencia
+        self.expira = {}
+        self.orden = deque()
+
+    def prohibir(self, movimiento, iteracion):
+        self.expira[movimiento] = iteracion + self.tenencia
+        self.orden.append((iteracion + self.tenencia, movimiento))
+        # Purga amortizada O(1): cada entrada entra y sale de la cola una sola vez.
+        # Las que vencen en 'iteracion' ya no afectan a las iteraciones siguientes.
+        while self.orden and self.orden[0][0] <= iteracion:
+            vencimiento, viejo = self.orden.popleft()
+            if self.expira.get(viejo) == vencimiento:  # Si no se volvió a prohibir después
+                del self.expira[viejo]
+
+    def es_tabu(self, movimiento, iteracion):
+        return self.expira.get(movimiento, -1) >= iteracion
+
+    def __len__(self):
+        return len(self.expira)
+
+def busqueda_tabu_incremental(n=8, tenencia_tabu=7, max_iteraciones=1000, tamano_muestra=None, semilla=None):
+    """
+    Búsqueda tabú sobre TableroReinas: cada movimiento (columna, fila_destino) se
+    puntúa con su delta O(1) en lugar de reevaluar el tablero, y la memoria tabú
+    es O(1) por consulta. Aspiración por objetivo: un movimiento tabú se admite
+    si deja menos ataques que el mejor tablero global.
+    Con tamano_muestra, cada iteración evalúa esa cantidad de movimientos
+    aleatorios en vez del vecindario completo (para n grandes). Sin impresiones.
+    Devuelve {'tablero', 'valoracion', 'conflictos', 'iteraciones', 'aspiraciones'}.
+    """
+    if tamano_muestra is not None and tamano_muestra <= 0:
+        raise ValueError(f"tamano_muestra debe ser positivo o None: {tamano_muestra}")
+    rng = random.Random(semilla)
+    tablero = TableroReinas([rng.randrange(n) for _ in range(n)])
+    mejor_tablero, mejor_conflictos = tablero.tupla(), tablero.conflictos
+    memoria = MemoriaTabu(tenencia_tabu)
+    aspiraciones = 0
+    iteracion = 0
+
+    # 'iteracion' cuenta las iteraciones ejecutadas: se para justo al encontrar la solución
+    while iteracion < max_iteraciones and mejor_conflictos > 0:
+        iteracion += 1
+        # 1. Movimientos candidatos (vecindario completo o muestra), sin crear tableros
+        if tamano_muestra is None:
+            movimientos = ((c, f) for c in range(n) for f in range(n) if f != tablero.filas[c])
+        else:
+            movimientos = ((c, f) for c, f in ((rng.randrange(n), rng.randrange(n)) for _ in range(tamano_muestra))
+                           if f != tablero.filas[c])
+
+        # 2. Mejor movimiento admisible: no tabú, o tabú que cumple la aspiración
+        mejor_movimiento, mejor_delta, por_aspiracion = None, float('inf'), False
+        for movimiento in movimientos:
+            delta = tablero.delta(*movimiento)
+            if delta >= mejor_delta:
+                continue
+            tabu = memoria.es_tabu(movimiento, iteracion)
+            if tabu and tablero.conflictos + delta >= mejor_conflictos:
+                continue
+            mejor_movimiento, mejor_delta, por_aspiracion = movimiento, delta, tabu
+        if mejor_movimiento is None:
+            continue  # Todos los candidatos eran tabú (solo posible con muestras pequeñas)
+
+        # 3. Transición y memoria
+        tablero.mover(*mejor_movimiento)
+        memoria.prohibir(mejor_movimiento, iteracion)
+        aspiraciones += por_aspiracion
+        if tablero.conflictos < mejor_conflictos:
+            mejor_tablero, mejor_conflictos = tablero.tupla(), tablero.conflictos
+
+    return {'tablero': mejor_tablero, 'valoracion': n * (n - 1) // 2 - mejor_conflictos,
+            'conflictos': mejor_conflictos, 'iteraciones': iteracion, 'aspiraciones': aspiraciones}
+
 # Ejecución del algoritmo
 SOLUCION_OPT = 28 # El valor de valoración ideal (máximo de pares sin atacar)
 print("Configuración: Tenencia Tabú = 7, Máx. Iteraciones = 1000")
@@ -110,4 +195,17 @@ print(f"  Valoración: {resultado_valoracion} / {SOLUCION_OPT}")
 if resultado_valoracion == SOLUCION_OPT:
     print("  ¡Éxito! La Búsqueda Tabú encontró la solución óptima.")
 else:
-    print("  La búsqueda finalizó sin encontrar la solución óptima (posiblemente atrapada o límite de iteración).")
\ No newline at end of file
+    print("  La búsqueda finalizó sin encontrar la solución óptima (posiblemente atrapada o límite de iteración).")
+
+# Búsqueda tabú incremental: deltas O(1) y memoria tabú O(1)
+print("-" * 50)
+resultado = busqueda_tabu_incremental(n=8, semilla=0)
+print(f"Incremental (n = 8): {resultado['tablero']}, valoración {resultado['valoracion']}, "
+      f"{resultado['iteraciones']} iteraciones")
+# Con la memoria O(1), una tenencia 100 veces mayor apenas cambia el tiempo por iteración
+for n, tenencia, muestra in ((30, 10, None), (200, 20, 400), (200, 2000, 400)):
+    t0 = time.perf_counter()
+    resultado = busqueda_tabu_incremental(n, tenencia, max_iteraciones=3000, tamano_muestra=muestra, semilla=1)
+    print(f"n = {n}, tenencia {tenencia:>4}: {resultado['conflictos']} ataques, "
+          f"{resultado['iteraciones']} iteraciones, {resultado['aspiraciones']} aspiraciones, "
+          f"{time.perf_counter() - t0:.2f}s")
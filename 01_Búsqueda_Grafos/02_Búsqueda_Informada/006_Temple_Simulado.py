@@ -1,22 +1,26 @@
 # Búsqueda de Temple Simulado (Simulated Annealing)
 
-import random
 import math
+import os
+import random
+import runpy
+import time
+import numpy as np
+
+# Tablero compartido (tablero_reinas.py). Se carga con runpy por ruta absoluta,
+# como en 012_Benchmark_Busquedas.py, para que funcione aunque este script se
+# ejecute desde otro directorio
+TableroReinas = runpy.run_path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablero_reinas.py"))['TableroReinas']
 
 # Función de Costo: Número de ataques (Queremos MINIMIZAR este valor a 0)
 def calcular_costo(tablero):
     """
     Calcula el número de pares de reinas que se atacan.
     El mínimo es 0 (solución perfecta).
+    Los ataques en fila y diagonal se cuentan con TableroReinas en O(n).
     """
-    ataques = 0
-    n = len(tablero)
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Ataque en la misma fila (no sucede en esta representación) o diagonal
-            if abs(i - j) == abs(tablero[i] - tablero[j]):
-                ataques += 1
-    return ataques
+    return TableroReinas(tablero).conflictos
 
 # Función para generar un vecino aleatorio
 def generar_vecino(tablero):
@@ -96,6 +100,131 @@ def temple_simulado(n=8, T_inicial=1.0, T_final=0.0001, factor_enfriamiento=0.99
 
     return mejor_tablero_global, mejor_costo_global
 
+# Programas de enfriamiento: cada uno devuelve T(paso), un escalar o un vector
+# con una temperatura por cadena (numpy difunde ambos casos)
+def enfriamiento_geometrico(T_inicial=1.0, factor=0.99):
+    """T = T_inicial * factor^paso (el recocido geométrico de temple_simulado)."""
+    return lambda paso: T_inicial * factor ** paso
+
+def enfriamiento_lineal(T_inicial=1.0, T_final=0.0001, pasos=1000):
+    """Baja linealmente de T_inicial a T_final en 'pasos' pasos y se queda ahí."""
+    return lambda paso: T_inicial + (T_final - T_inicial) * min(paso, pasos) / pasos
+
+def enfriamiento_logaritmico(T_inicial=1.0):
+    """T = T_inicial / ln(paso + e): enfriamiento lento con garantías asintóticas."""
+    return lambda paso: T_inicial / math.log(paso + math.e)
+
+def escalera_temperaturas(T_min=0.05, T_max=2.0, niveles=256):
+    """
+    Temperaturas fijas en progresión geométrica, de la más fría a la más caliente
+    (temple paralelo). Por defecto, un nivel por cadena de temple_simulado_lotes.
+    """
+    escalera = np.geomspace(T_min, T_max, niveles)
+    return lambda paso: escalera
+
+def _contar_ocupacion(indices, tamano, cadenas):
+    """Contadores por cadena: fila i de la matriz = histograma de 'indices[i]'."""
+    desplazados = indices + np.arange(cadenas)[:, None] * tamano
+    return np.bincount(desplazados.ravel(), minlength=cadenas * tamano).reshape(cadenas, tamano)
+
+def temple_simulado_lotes(n=8, cadenas=256, max_pasos=10_000, enfriamiento=None,
+                          intercambio_cada=0, semilla=None):
+    """
+    Temple simulado vectorizado: avanza 'cadenas' cadenas independientes a la
+    vez sobre matrices de numpy. En cada paso, todas las cadenas proponen un
+    movimiento (columna, fila nueva), calculan su delta en O(1) con los
+    contadores por fila, diagonal y antidiagonal (como TableroReinas) y aplican
+    el criterio de Metropolis en bloque.
+    'enfriamiento' es un programa paso -> T (por defecto enfriamiento_geometrico()).
+    Si devuelve un vector de L temperaturas (una escalera), L debe dividir a
+    'cadenas': las cadenas forman cadenas / L grupos y, en cada grupo, el nivel
+    k de la escalera usa la temperatura k-ésima.
+    Con intercambio_cada > 0 se activa el temple paralelo: cada esos pasos, dentro
+    de cada grupo, los niveles vecinos de la escalera (ordenada de fría a
+    caliente) intercambian sus cadenas con probabilidad
+    min(1, exp((1/T_k - 1/T_k+1) * (E_k - E_k+1))). Requiere una escalera de al
+    menos dos niveles: con una T escalar todos los intercambios se aceptarían
+    siempre y no aportarían nada, así que esa combinación lanza ValueError.
+    Se detiene cuando alguna cadena llega a cero ataques.
+    Devuelve {'tablero', 'conflictos', 'pasos', 'evaluaciones', 'intercambios'}.
+    """
+    rng = np.random.default_rng(semilla)
+    programa = enfriamiento or enfriamiento_geometrico()
+    cadena = np.arange(cadenas)
+    niveles = np.size(programa(1))
+    if cadenas % niveles:
+        raise ValueError(f"La escalera tiene {niveles} temperaturas y no divide a {cadenas} cadenas")
+    if intercambio_cada and niveles < 2:
+        raise ValueError("El temple paralelo (intercambio_cada > 0) necesita una escalera de temperaturas")
+
+    # 1. ESTADOS INICIALES ALEATORIOS Y CONTADORES DE OCUPACIÓN (una fila por cadena)
+    filas = rng.integers(0, n, size=(cadenas, n))
+    columnas = np.arange(n)
+    por_fila = _contar_ocupacion(filas, n, cadenas)
+    por_diagonal = _contar_ocupacion(filas - columnas + n - 1, 2 * n - 1, cadenas)
+    por_antidiagonal = _contar_ocupacion(filas + columnas, 2 * n - 1, cadenas)
+    conflictos = sum((c * (c - 1) // 2).sum(axis=1) for c in (por_fila, por_diagonal, por_antidiagonal))
+
+    mejor = int(conflictos.argmin())
+    mejor_tablero, mejor_conflictos = tuple(filas[mejor].tolist()), int(conflictos[mejor])
+    # Temple paralelo: cadena_en_nivel[g, k] es la cadena del grupo g que usa la k-ésima temperatura
+    cadena_en_nivel = cadena.reshape(-1, niveles).copy()
+    nivel_de_cadena = cadena % niveles
+    intercambios = 0
+    paso = 0
+
+    for paso in range(1, max_pasos + 1):
+        if mejor_conflictos == 0:
+            break
+        temperaturas = np.asarray(programa(paso), dtype=float).reshape(-1)
+        if len(temperaturas) != niveles:
+            raise ValueError(f"El programa pasó de {niveles} a {len(temperaturas)} temperaturas")
+        T = temperaturas[nivel_de_cadena]
+
+        # 2. PROPUESTAS: una reina por cadena a una fila distinta de la actual
+        columna = rng.integers(0, n, size=cadenas)
+        vieja = filas[cadena, columna]
+        nueva = (vieja + rng.integers(1, n, size=cadenas)) % n
+
+        # 3. DELTA O(1) POR CADENA: ataques en destino menos ataques en origen
+        ataques = (por_fila[cadena, vieja] + por_diagonal[cadena, vieja - columna + n - 1]
+                   + por_antidiagonal[cadena, vieja + columna] - 3)
+        delta = (por_fila[cadena, nueva] + por_diagonal[cadena, nueva - columna + n - 1]
+                 + por_antidiagonal[cadena, nueva + columna]) - ataques
+
+        # 4. CRITERIO DE METROPOLIS EN BLOQUE: P = e^(-Delta_E / T) si empeora
+        aceptar = (delta <= 0) | (rng.random(cadenas) < np.exp(-np.maximum(delta, 0) / np.maximum(T, 1e-12)))
+
+        # 5. TRANSICIÓN: cada cadena toca una sola celda de cada contador (sin índices repetidos)
+        c, col, v, nv = cadena[aceptar], columna[aceptar], vieja[aceptar], nueva[aceptar]
+        por_fila[c, v] -= 1
+        por_diagonal[c, v - col + n - 1] -= 1
+        por_antidiagonal[c, v + col] -= 1
+        por_fila[c, nv] += 1
+        por_diagonal[c, nv - col + n - 1] += 1
+        por_antidiagonal[c, nv + col] += 1
+        filas[c, col] = nv
+        conflictos[c] += delta[aceptar]
+
+        mejor = int(conflictos.argmin())
+        if conflictos[mejor] < mejor_conflictos:
+            mejor_tablero, mejor_conflictos = tuple(filas[mejor].tolist()), int(conflictos[mejor])
+
+        # 6. TEMPLE PARALELO: intercambio entre niveles vecinos de cada grupo (pares e impares alternados)
+        if intercambio_cada and paso % intercambio_cada == 0:
+            nivel = np.arange((paso // intercambio_cada) % 2, niveles - 1, 2)
+            beta = 1 / np.maximum(temperaturas, 1e-12)
+            fria, caliente = cadena_en_nivel[:, nivel], cadena_en_nivel[:, nivel + 1]
+            exponente = (beta[nivel] - beta[nivel + 1]) * (conflictos[fria] - conflictos[caliente])
+            grupo, par = np.nonzero(rng.random(exponente.shape) < np.exp(np.minimum(exponente, 0)))
+            cadena_en_nivel[grupo, nivel[par]] = caliente[grupo, par]
+            cadena_en_nivel[grupo, nivel[par] + 1] = fria[grupo, par]
+            nivel_de_cadena[cadena_en_nivel] = np.arange(niveles)
+            intercambios += len(grupo)
+
+    return {'tablero': mejor_tablero, 'conflictos': mejor_conflictos, 'pasos': paso,
+            'evaluaciones': paso * cadenas, 'intercambios': intercambios}
+
 # Ejecución del algoritmo
 SOLUCION_OPT = 0 # El valor de costo ideal (cero ataques)
 print("Configuración: T_inicial=1.0, Factor_enfriamiento=0.99")
@@ -109,4 +238,29 @@ print(f"  Costo (Ataques): {resultado_costo} / {SOLUCION_OPT} (Mínimo)")
 if resultado_costo == SOLUCION_OPT:
     print("  ¡Éxito! Temple Simulado encontró la solución óptima (cero ataques).")
 else:
-    print("  La búsqueda finalizó sin alcanzar el óptimo global.")
\ No newline at end of file
+    print("  La búsqueda finalizó sin alcanzar el óptimo global.")
+
+# Temple simulado vectorizado: muchas cadenas por paso con deltas O(1)
+print("-" * 70)
+N = 64
+tablero = tuple(random.randint(0, N - 1) for _ in range(N))
+t0 = time.perf_counter()
+for _ in range(2000):
+    calcular_costo(generar_vecino(tablero))
+print(f"Una cadena (n = {N}): {2000 / (time.perf_counter() - t0):>12,.0f} propuestas/s")
+
+programas = (
+    ("geométrico", enfriamiento_geometrico(1.0, 0.999), 0),
+    ("lineal", enfriamiento_lineal(1.0, 0.01, 5000), 0),
+    ("logarítmico", enfriamiento_logaritmico(0.5), 0),
+    ("temple paralelo", escalera_temperaturas(0.05, 1.5), 10),
+    ("16 grupos x 16", escalera_temperaturas(0.05, 1.5, 16), 10),
+)
+for nombre, programa, intercambio_cada in programas:
+    t0 = time.perf_counter()
+    resultado = temple_simulado_lotes(N, cadenas=256, max_pasos=20_000, enfriamiento=programa,
+                                      intercambio_cada=intercambio_cada, semilla=1)
+    segundos = time.perf_counter() - t0
+    print(f"256 cadenas, {nombre:<15}: {resultado['evaluaciones'] / segundos:>12,.0f} propuestas/s, "
+          f"{resultado['conflictos']} ataques en {resultado['pasos']} pasos "
+          f"({resultado['intercambios']} intercambios), {segundos:.2f}s")
@@ -1,17 +1,22 @@
 # Búsqueda de Haz Local (Local Beam Search)
 
+import heapq
+import math
+import os
 import random
+import runpy
+import time
+
+# Tablero compartido (tablero_reinas.py). Se carga con runpy por ruta absoluta,
+# como en 012_Benchmark_Busquedas.py, para que funcione aunque este script se
+# ejecute desde otro directorio
+TableroReinas = runpy.run_path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablero_reinas.py"))['TableroReinas']
 
 # Función de Valoración (Queremos MAXIMIZAR a 28)
 def evaluar_estado(tablero):
-    ataques = 0
-    n = len(tablero)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if abs(i - j) == abs(tablero[i] - tablero[j]):
-                ataques += 1
-    total_pares = n * (n - 1) // 2 
-    return total_pares - ataques
+    # Ataques en fila y diagonal contados con TableroReinas en O(n)
+    return TableroReinas(tablero).valoracion
 
 # Función para obtener TODOS los vecinos de un estado
 def obtener_todos_vecinos(tablero):
@@ -83,6 +88,99 @@ def busqueda_haz_local(n=8, k=5, max_iteraciones=100):
         
     return mejor_tablero_global, mejor_valoracion_global
 
+def busqueda_haz_incremental(n=8, k=5, max_iteraciones=100, seleccion='determinista',
+                             temperatura=1.0, semilla=None):
+    """
+    Búsqueda de haz local sobre TableroReinas sin construir ni ordenar la lista
+    de sucesores: cada movimiento (columna, fila) se puntúa con su delta O(1) y
+    pasa por un montículo acotado a k entradas, así que elegir el nuevo haz
+    cuesta O(m log k) para m sucesores y O(k) de memoria.
+    Los sucesores repetidos (alcanzados desde varios estados del haz) se
+    detectan con claves de Zobrist: la clave de un sucesor se obtiene de la del
+    padre con dos XOR, y un mismo estado nunca ocupa dos plazas del haz.
+    seleccion='determinista' conserva los k sucesores con menos ataques;
+    seleccion='estocastica' muestrea k sin reemplazo con probabilidad
+    proporcional a e^(-ataques / temperatura) (truco de Gumbel-top-k).
+    Sin impresiones. Devuelve {'tablero', 'valoracion', 'conflictos',
+    'iteraciones', 'evaluaciones', 'duplicados'}.
+    """
+    rng = random.Random(semilla)
+    # Clave de Zobrist: XOR de un entero aleatorio por cada par (columna, fila) ocupado
+    zobrist = [rng.getrandbits(64) for _ in range(n * n)]
+
+    def clave_de(filas):
+        clave = 0
+        for columna, fila in enumerate(filas):
+            clave ^= zobrist[columna * n + fila]
+        return clave
+
+    # 1. INICIALIZACIÓN: k estados aleatorios distintos
+    haz = {}
+    for _ in range(k):
+        tablero = TableroReinas([rng.randrange(n) for _ in range(n)])
+        haz.setdefault(clave_de(tablero.filas), tablero)
+    haz = list(haz.items())
+    mejor = min((tablero for _, tablero in haz), key=lambda t: t.conflictos)
+    mejor_tablero, mejor_conflictos = mejor.tupla(), mejor.conflictos
+    evaluaciones = duplicados = iteracion = 0
+
+    for iteracion in range(1, max_iteraciones + 1):
+        if mejor_conflictos == 0:
+            break
+        # 2. TOP-K EN FLUJO: montículo de mínimos con las k mejores prioridades
+        #    (mayor = mejor); la raíz es la peor de las elegidas hasta ahora
+        seleccionados = []   # (prioridad, clave, índice en el haz, columna, fila)
+        en_monticulo = set()
+        for indice, (clave_padre, tablero) in enumerate(haz):
+            por_fila, por_diagonal, por_antidiagonal = (
+                tablero.por_fila, tablero.por_diagonal, tablero.por_antidiagonal)
+            for columna in range(n):
+                fila_actual = tablero.filas[columna]
+                base = clave_padre ^ zobrist[columna * n + fila_actual]
+                # TableroReinas.delta en línea: los ataques en origen no dependen de la fila destino
+                sin_reina = tablero.conflictos - tablero.ataques_de(columna)
+                for fila in range(n):
+                    if fila == fila_actual:
+                        continue
+                    evaluaciones += 1
+                    conflictos = (sin_reina + por_fila[fila] + por_diagonal[fila - columna + n - 1]
+                                  + por_antidiagonal[fila + columna])
+                    if seleccion == 'estocastica':
+                        prioridad = -conflictos / temperatura - math.log(-math.log(1.0 - rng.random()))
+                    else:
+                        prioridad = -conflictos
+                    if len(seleccionados) == k and prioridad < seleccionados[0][0]:
+                        continue  # Poda barata: ni siquiera hace falta la clave
+                    clave = base ^ zobrist[columna * n + fila]
+                    if clave in en_monticulo:
+                        duplicados += 1
+                        continue
+                    entrada = (prioridad, clave, indice, columna, fila)
+                    if len(seleccionados) < k:
+                        heapq.heappush(seleccionados, entrada)
+                    elif entrada[:2] > seleccionados[0][:2]:
+                        en_monticulo.discard(heapq.heapreplace(seleccionados, entrada)[1])
+                    else:
+                        continue
+                    en_monticulo.add(clave)
+
+        if not seleccionados:
+            break  # Sin sucesores (n = 1)
+
+        # 3. NUEVO HAZ: solo se materializan los k tableros elegidos
+        nuevo_haz = []
+        for _, clave, indice, columna, fila in seleccionados:
+            tablero = TableroReinas(haz[indice][1].filas)
+            tablero.mover(columna, fila)
+            nuevo_haz.append((clave, tablero))
+            if tablero.conflictos < mejor_conflictos:
+                mejor_tablero, mejor_conflictos = tablero.tupla(), tablero.conflictos
+        haz = nuevo_haz
+
+    return {'tablero': mejor_tablero, 'valoracion': n * (n - 1) // 2 - mejor_conflictos,
+            'conflictos': mejor_conflictos, 'iteraciones': iteracion,
+            'evaluaciones': evaluaciones, 'duplicados': duplicados}
+
 # Ejecución del algoritmo
 N = 8
 SOLUCION_OPT = N * (N - 1) // 2 # 28
@@ -97,4 +195,20 @@ print(f"  Valoración: {resultado_valoracion} / {SOLUCION_OPT}")
 if resultado_valoracion == SOLUCION_OPT:
     print("  ¡Éxito! Se encontró la solución óptima.")
 else:
-    print("  La búsqueda finalizó sin alcanzar el óptimo global.")
\ No newline at end of file
+    print("  La búsqueda finalizó sin alcanzar el óptimo global.")
+# Haz incremental: top-k con montículo acotado y sucesores sin duplicados
+print("-" * 50)
+for seleccion in ('determinista', 'estocastica'):
+    resultados = [busqueda_haz_incremental(8, k=5, max_iteraciones=100, seleccion=seleccion,
+                                           temperatura=0.5, semilla=semilla) for semilla in range(50)]
+    exitos = sum(r['conflictos'] == 0 for r in resultados)
+    print(f"n = 8, k = 5, {seleccion:<12}: {exitos}/50 soluciones, "
+          f"{sum(r['duplicados'] for r in resultados)} sucesores duplicados descartados")
+
+for n, k, seleccion in ((30, 20, 'determinista'), (30, 20, 'estocastica'), (60, 50, 'determinista')):
+    t0 = time.perf_counter()
+    resultado = busqueda_haz_incremental(n, k, max_iteraciones=200, seleccion=seleccion,
+                                         temperatura=0.5, semilla=1)
+    print(f"n = {n}, k = {k}, {seleccion:<12}: {resultado['conflictos']} ataques en "
+          f"{resultado['iteraciones']} iteraciones, {resultado['evaluaciones']:,} sucesores puntuados, "
+          f"{time.perf_counter() - t0:.2f}s")
@@ -1,4 +1,12 @@
 import math
+import os
+import random
+import tempfile
+import time
+from collections.abc import Mapping
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
 
 # --- 1. CONFIGURACIÓN DEL ENTORNO ---
 # Grafo: {Nodo: {Vecino: Costo_Real}}
@@ -22,13 +30,17 @@ ruta_tomada = []
 costo_real_acumulado = 0
 
 # --- 2. FUNCIÓN DE DECISIÓN LRTA* ---
-def lrta_star_decision(nodo_actual, h_table, grafo):
+def lrta_star_decision(nodo_actual, h_table, grafo, observador=None):
     """
     Simula un paso del algoritmo LRTA*: 
     1. Evalúa los sucesores (f(S') = costo + h(S')).
     2. Actualiza la heurística del nodo actual (h(S)).
     3. Devuelve el mejor sucesor para moverse.
+    observador(evento, nodo, dato) es opcional: recibe ('expandir', nodo, h_anterior)
+    y ('actualizar_h', nodo, h_nueva).
     """
+    if observador is not None:
+        observador('expandir', nodo_actual, h_table.get(nodo_actual))
     sucesores = grafo.get(nodo_actual, {})
     if not sucesores:
         return None, float('inf')  # Nodo sin salida o objetivo
@@ -47,48 +59,217 @@ def lrta_star_decision(nodo_actual, h_table, grafo):
     # b) Actualizar Heurística del Nodo Actual
     # h(S) <- min(costo(S, S') + h(S'))
     h_table[nodo_actual] = mejor_f
+    if observador is not None:
+        observador('actualizar_h', nodo_actual, mejor_f)
     
     return mejor_sucesor, costo_movimiento
 
 # =================================================================
-# --- SIMULACIÓN DE BÚSQUEDA ONLINE ---
+# --- 3. TABLA h PERSISTENTE Y COMPARTIDA PARA ENSAYOS REPETIDOS ---
 # =================================================================
 
-nodo_actual = INICIO
+class TablaH(Mapping):
+    """
+    h_table respaldada por un arreglo float64 (un valor por nodo) que
+    lrta_star_decision usa igual que un dict: get, [] y asignación.
+    El arreglo puede vivir en memoria propia o en memoria compartida, y se
+    guarda en disco como .npz (nombres + valores) para arrancar en caliente.
+    """
+
+    def __init__(self, nombres, valores):
+        self.nombres = list(nombres)
+        self.indices = {nodo: i for i, nodo in enumerate(self.nombres)}
+        self.valores = valores
+
+    @classmethod
+    def desde_heuristica(cls, grafo, heuristica):
+        nombres = list(grafo)
+        for sucesores in grafo.values():
+            nombres.extend(v for v in sucesores if v not in grafo)
+        nombres = list(dict.fromkeys(nombres))
+        return cls(nombres, np.array([heuristica.get(n, float('inf')) for n in nombres], dtype=np.float64))
+
+    @classmethod
+    def cargar(cls, ruta, grafo, heuristica):
+        """Arranque en caliente: los nodos guardados (por nombre) recuperan su h aprendida."""
+        tabla = cls.desde_heuristica(grafo, heuristica)
+        with np.load(ruta) as datos:
+            guardados = dict(zip(datos['nombres'].tolist(), datos['valores'].tolist()))
+        for i, nodo in enumerate(tabla.nombres):
+            tabla.valores[i] = guardados.get(str(nodo), tabla.valores[i])
+        return tabla
+
+    def guardar(self, ruta):
+        # Con un archivo abierto, np.savez no añade '.npz': cargar(ruta) lee la misma ruta
+        with open(ruta, 'wb') as archivo:
+            np.savez(archivo, nombres=np.array([str(n) for n in self.nombres]), valores=self.valores)
+
+    def __getitem__(self, nodo):
+        return float(self.valores[self.indices[nodo]])
+
+    def __setitem__(self, nodo, valor):
+        self.valores[self.indices[nodo]] = valor
+
+    def __iter__(self):
+        return iter(self.nombres)
+
+    def __len__(self):
+        return len(self.nombres)
+
+def ejecutar_ensayos(grafo, h_table, inicio, objetivo, ensayos, max_pasos=100_000, hasta_converger=True):
+    """
+    Repite 'ensayos' recorridos LRTA* desde 'inicio' sobre la misma h_table.
+    Con hasta_converger, se detiene tras el primer ensayo sin ninguna
+    actualización de h (la ruta ya no cambia). Sin impresiones.
+    Devuelve [{'costo', 'pasos', 'actualizaciones', 'alcanzado'}, ...] por ensayo.
+    """
+    historial = []
+    for _ in range(ensayos):
+        nodo_actual, costo, pasos, actualizaciones = inicio, 0, 0, 0
+        while nodo_actual != objetivo and pasos < max_pasos:
+            h_anterior = h_table.get(nodo_actual)
+            nodo_siguiente, costo_movimiento = lrta_star_decision(nodo_actual, h_table, grafo)
+            if nodo_siguiente is None:
+                break
+            actualizaciones += h_table[nodo_actual] != h_anterior
+            costo += costo_movimiento
+            pasos += 1
+            nodo_actual = nodo_siguiente
+        historial.append({'costo': costo, 'pasos': pasos, 'actualizaciones': actualizaciones,
+                          'alcanzado': nodo_actual == objetivo})
+        if hasta_converger and actualizaciones == 0:
+            break
+    return historial
+
+# --- Estado de cada agente (proceso): vista sobre la tabla compartida ---
+_agente = {}
 
-print("--- Búsqueda Online LRTA* ---")
-print(f"Objetivo: {OBJETIVO}. Heurísticas iniciales: {dict(heuristica)}")
-print("-" * 50)
+def _adjuntar_tabla(nombre_memoria, nombres, grafo, objetivo):
+    memoria = SharedMemory(name=nombre_memoria)
+    _agente['memoria'] = memoria  # Mantiene viva la asignación
+    _agente['tabla'] = TablaH(nombres, np.ndarray(len(nombres), dtype=np.float64, buffer=memoria.buf))
+    _agente['grafo'] = grafo
+    _agente['objetivo'] = objetivo
 
-while nodo_actual != OBJETIVO and nodo_actual is not None:
+def _trabajo_agente(argumentos):
+    inicio, ensayos = argumentos
+    return ejecutar_ensayos(_agente['grafo'], _agente['tabla'], inicio, _agente['objetivo'],
+                            ensayos, hasta_converger=False)
+
+def ensayos_compartidos(grafo, tabla, inicios, objetivo, ensayos, procesos=None):
+    """
+    Varios agentes (uno por elemento de 'inicios') entrenan a la vez sobre UNA
+    tabla h en memoria compartida. Las escrituras no usan bloqueo: cada una es
+    un mínimo de costo + h vecino, así que un valor pisado solo retrasa el
+    aprendizaje sin volverlo incorrecto. Al terminar, la tabla local recibe
+    los valores aprendidos. Devuelve el historial de cada agente.
+    """
+    memoria = SharedMemory(create=True, size=max(tabla.valores.nbytes, 1))
+    try:
+        compartidos = np.ndarray(tabla.valores.shape, dtype=np.float64, buffer=memoria.buf)
+        compartidos[:] = tabla.valores
+        with Pool(procesos or min(len(inicios), os.cpu_count()), initializer=_adjuntar_tabla,
+                  initargs=(memoria.name, tabla.nombres, grafo, objetivo)) as pool:
+            historiales = pool.map(_trabajo_agente, [(inicio, ensayos) for inicio in inicios])
+        tabla.valores[:] = compartidos
+        del compartidos
+    finally:
+        memoria.close()
+        memoria.unlink()
+    return historiales
+
+
+if __name__ == "__main__":  # Los agentes en paralelo pueden reimportar este script
+    # =================================================================
+    # --- SIMULACIÓN DE BÚSQUEDA ONLINE ---
+    # =================================================================
+
+    nodo_actual = INICIO
+
+    print("--- Búsqueda Online LRTA* ---")
+    print(f"Objetivo: {OBJETIVO}. Heurísticas iniciales: {dict(heuristica)}")
+    print("-" * 50)
+
+    while nodo_actual != OBJETIVO and nodo_actual is not None:
     
-    print(f"ITERACIÓN | En el nodo: {nodo_actual}")
+        print(f"ITERACIÓN | En el nodo: {nodo_actual}")
     
-    # 1. Agente toma la decisión LRTA*
-    nodo_siguiente, costo_movimiento = lrta_star_decision(nodo_actual, heuristica, GRAFO_COSTOS)
+        # 1. Agente toma la decisión LRTA*
+        nodo_siguiente, costo_movimiento = lrta_star_decision(nodo_actual, heuristica, GRAFO_COSTOS)
     
-    # Si nodo_siguiente es None, es que no hay salida
-    if nodo_siguiente is None:
-        print(f"  El nodo {nodo_actual} no tiene salidas. Búsqueda fallida.")
-        break
+        # Si nodo_siguiente es None, es que no hay salida
+        if nodo_siguiente is None:
+            print(f"  El nodo {nodo_actual} no tiene salidas. Búsqueda fallida.")
+            break
         
-    # 2. El agente "aprende" (actualiza h(nodo_actual))
-    print(f"  * Heurística de {nodo_actual} actualizada a: {heuristica[nodo_actual]}")
+        # 2. El agente "aprende" (actualiza h(nodo_actual))
+        print(f"  * Heurística de {nodo_actual} actualizada a: {heuristica[nodo_actual]}")
     
-    # 3. El agente se mueve
-    print(f"  * Moviendo a: {nodo_siguiente} (Costo real: {costo_movimiento})")
+        # 3. El agente se mueve
+        print(f"  * Moviendo a: {nodo_siguiente} (Costo real: {costo_movimiento})")
     
-    ruta_tomada.append((nodo_actual, nodo_siguiente))
-    costo_real_acumulado += costo_movimiento
-    nodo_actual = nodo_siguiente
+        ruta_tomada.append((nodo_actual, nodo_siguiente))
+        costo_real_acumulado += costo_movimiento
+        nodo_actual = nodo_siguiente
     
-    print(f"  Estado de las heurísticas: {dict(heuristica)}")
-    print("-" * 50)
+        print(f"  Estado de las heurísticas: {dict(heuristica)}")
+        print("-" * 50)
+
+    # --- RESULTADOS FINALES ---
+    if nodo_actual == OBJETIVO:
+        print(f"¡OBJETIVO ALCANZADO: {OBJETIVO}!")
+        print(f"  Ruta tomada: {' -> '.join(n[0] for n in ruta_tomada) + ' -> ' + OBJETIVO}")
+        print(f"  Costo real total: {costo_real_acumulado}")
+    else:
+        print("La búsqueda terminó sin alcanzar el objetivo.")
+
+    print("=" * 50)
+    # Laberinto 60 x 60 con muros: la distancia Manhattan inicial subestima mucho
+    random.seed(5)
+    LADO = 60
+    libres = {(f, c) for f in range(LADO) for c in range(LADO) if random.random() > 0.33}
+    libres |= {(0, 0), (LADO - 1, LADO - 1)}
+    alcanzables, pendientes = {(LADO - 1, LADO - 1)}, [(LADO - 1, LADO - 1)]
+    while pendientes:  # Solo la componente conexa del objetivo (si no, LRTA* nunca termina)
+        f, c = pendientes.pop()
+        for vecino in ((f - 1, c), (f + 1, c), (f, c - 1), (f, c + 1)):
+            if vecino in libres and vecino not in alcanzables:
+                alcanzables.add(vecino)
+                pendientes.append(vecino)
+    libres = alcanzables
+    laberinto = {
+        f"{f},{c}": {f"{f + df},{c + dc}": 1 for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                     if (f + df, c + dc) in libres}
+        for f, c in libres
+    }
+    meta = f"{LADO - 1},{LADO - 1}"
+    laberinto[meta] = {}  # Objetivo, sin salidas
+    h_manhattan = {f"{f},{c}": (LADO - 1 - f) + (LADO - 1 - c) for f, c in libres}
+    salida = "{},{}".format(*min(libres, key=sum))  # Celda alcanzable más cercana a (0, 0)
+
+    # 1. Entrenamiento en frío hasta converger y guardado en disco
+    tabla = TablaH.desde_heuristica(laberinto, h_manhattan)
+    t0 = time.perf_counter()
+    historial = ejecutar_ensayos(laberinto, tabla, salida, meta, ensayos=1000)
+    print(f"En frío: {len(historial)} ensayos hasta converger ({time.perf_counter() - t0:.2f}s), "
+          f"costo del primero {historial[0]['costo']}, del último {historial[-1]['costo']}")
+    with tempfile.TemporaryDirectory() as directorio:  # El archivo se borra al salir
+        ruta_tabla = os.path.join(directorio, "lrta_h_laberinto.npz")
+        tabla.guardar(ruta_tabla)
+        print(f"Tabla guardada en {ruta_tabla} ({os.path.getsize(ruta_tabla)} bytes, {len(tabla)} nodos)")
+
+        # 2. Arranque en caliente desde el archivo
+        tabla = TablaH.cargar(ruta_tabla, laberinto, h_manhattan)
+    historial = ejecutar_ensayos(laberinto, tabla, salida, meta, ensayos=1000)
+    print(f"En caliente: {len(historial)} ensayo(s) hasta converger, costo {historial[-1]['costo']}")
 
-# --- RESULTADOS FINALES ---
-if nodo_actual == OBJETIVO:
-    print(f"¡OBJETIVO ALCANZADO: {OBJETIVO}!")
-    print(f"  Ruta tomada: {' -> '.join(n[0] for n in ruta_tomada) + ' -> ' + OBJETIVO}")
-    print(f"  Costo real total: {costo_real_acumulado}")
-else:
-    print("La búsqueda terminó sin alcanzar el objetivo.")
\ No newline at end of file
+    # 3. Varios agentes desde esquinas distintas comparten una sola tabla
+    inicios = [salida] + [n for n in (f"0,{LADO - 1}", f"{LADO - 1},0", f"{LADO // 2},{LADO // 2}")
+                          if n in laberinto]
+    tabla = TablaH.desde_heuristica(laberinto, h_manhattan)
+    historiales = ensayos_compartidos(laberinto, tabla, inicios, meta, ensayos=20)
+    for inicio, historial in zip(inicios, historiales):
+        print(f"  Agente desde {inicio:>5}: costo del ensayo 1 = {historial[0]['costo']:>4}, "
+              f"del ensayo 20 = {historial[-1]['costo']:>3}")
+    historial = ejecutar_ensayos(laberinto, tabla, salida, meta, ensayos=1000)
+    print(f"Con la tabla compartida, '{salida}' converge en {len(historial)} ensayo(s), costo {historial[-1]['costo']}")
@@ -0,0 +1,101 @@
+# Instrumentación de Búsquedas: Observadores Intercambiables
+
+import contextlib
+import io
+import os
+import random
+import time
+from collections import Counter, defaultdict, deque
+
+import runpy
+
+# Interfaz común: dls_recursivo (004_Busqueda_Prof_Limit.py), busqueda_voraz
+# (002_Busqueda_Voraz.py) y lrta_star_decision (009Busqueda_Online.py) aceptan
+# un parámetro opcional observador(evento, nodo, dato).
+#   - observador=None (por defecto): la función solo evalúa un 'is not None'
+#     por expansión; no imprime ni acumula nada.
+#   - cualquier función o clase invocable: recibe cada evento ('expandir',
+#     'actualizar_h', ...) con el nodo y un dato (profundidad, h(n), ...).
+
+class ObservadorBusqueda:
+    """
+    Observador con contadores por evento, histograma del dato de cada evento
+    (profundidad, h, ...) y, opcionalmente, una traza en un búfer circular
+    que solo guarda los últimos 'capacidad_traza' eventos.
+    """
+
+    def __init__(self, capacidad_traza=0):
+        self.contadores = Counter()
+        self.histogramas = defaultdict(Counter)
+        self.traza = deque(maxlen=capacidad_traza) if capacidad_traza else None
+
+    def __call__(self, evento, nodo, dato=None):
+        self.contadores[evento] += 1
+        self.histogramas[evento][dato] += 1
+        if self.traza is not None:
+            self.traza.append((evento, nodo, dato))
+
+    def resumen(self):
+        lineas = []
+        for evento, total in self.contadores.items():
+            histograma = dict(sorted(self.histogramas[evento].items(), key=lambda x: (x[0] is None, x[0])))
+            lineas.append(f"  {evento}: {total} eventos, histograma {histograma}")
+        return "\n".join(lineas)
+
+def cargar_funcion(ruta, nombre):
+    """Ejecuta un script del repositorio (silenciando su demostración) y devuelve una función."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return runpy.run_path(ruta, run_name="instrumentacion")[nombre]
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+dls_recursivo = cargar_funcion(
+    os.path.join(os.path.dirname(DIRECTORIO), "01_Búsqueda_No_Informada", "004_Busqueda_Prof_Limit.py"),
+    "dls_recursivo")
+busqueda_voraz = cargar_funcion(os.path.join(DIRECTORIO, "002_Busqueda_Voraz.py"), "busqueda_voraz")
+lrta_star_decision = cargar_funcion(os.path.join(DIRECTORIO, "009Busqueda_Online.py"), "lrta_star_decision")
+
+# 1. Árbol binario de profundidad 12 para DLS y voraz (h aleatoria, 0 en la hoja objetivo)
+random.seed(0)
+PROFUNDIDAD = 12
+arbol = {i: [2 * i + 1, 2 * i + 2] for i in range(2 ** PROFUNDIDAD - 1)}
+objetivo = 2 ** (PROFUNDIDAD + 1) - 2  # Última hoja
+heuristica = {i: random.randint(0, 9) for i in range(2 ** (PROFUNDIDAD + 1) - 1)}
+heuristica[objetivo] = 0
+
+observador = ObservadorBusqueda(capacidad_traza=5)
+dls_recursivo(arbol, 0, objetivo, 0, PROFUNDIDAD, observador)
+print("DLS con ObservadorBusqueda:")
+print(observador.resumen())
+print(f"  Últimos eventos (búfer circular): {list(observador.traza)}")
+
+observador = ObservadorBusqueda()
+busqueda_voraz(arbol, heuristica, 0, objetivo, observador)
+print("Voraz con ObservadorBusqueda:")
+print(observador.resumen())
+
+# 2. LRTA*: varias decisiones sobre una cadena con heurística inicial nula
+cadena = {i: {i + 1: 1} for i in range(20)}
+h_table = dict.fromkeys(range(21), 0)
+observador = ObservadorBusqueda()
+for _ in range(3):
+    nodo = 0
+    while nodo != 20:
+        nodo, _ = lrta_star_decision(nodo, h_table, cadena, observador)
+print("LRTA* (3 recorridos) con ObservadorBusqueda:")
+print(f"  contadores: {dict(observador.contadores)}")
+print("-" * 60)
+
+# 3. Costo de la instrumentación sobre la misma DLS
+def medir(observador):
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        dls_recursivo(arbol, 0, objetivo, 0, PROFUNDIDAD, observador)
+    return time.perf_counter() - t0
+
+def imprimir_visita(evento, nodo, profundidad):
+    print(f"  Visitando: {nodo} (Profundidad: {profundidad})")
+
+print(f"DLS sin observador:        {medir(None) * 1000:7.2f} ms")
+print(f"DLS con ObservadorBusqueda: {medir(ObservadorBusqueda()) * 1000:7.2f} ms")
+print(f"DLS imprimiendo cada nodo: {medir(imprimir_visita) * 1000:7.2f} ms")
@@ -0,0 +1,62 @@
+# Tablero de N Reinas con Conteo Incremental de Ataques
+# Módulo compartido por 004_Ascencion_Colinas.py, 005_Busqueda_Tabu.py,
+# 006_Temple_Simulado.py y 007_Haz_Local.py (sin demostración: solo la clase)
+
+class TableroReinas:
+    """
+    Tablero de n reinas, una por columna (filas[columna] = fila), con contadores
+    de ocupación por fila, diagonal (fila - columna) y antidiagonal (fila + columna).
+    'conflictos' es el número de pares que se atacan y se mantiene al mover:
+    el delta de un movimiento y su aplicación cuestan O(1) en lugar de recontar
+    los O(n²) pares.
+    """
+
+    def __init__(self, filas):
+        self.n = n = len(filas)
+        self.filas = list(filas)
+        self.por_fila = [0] * n
+        self.por_diagonal = [0] * (2 * n - 1)      # Índice: fila - columna + n - 1
+        self.por_antidiagonal = [0] * (2 * n - 1)  # Índice: fila + columna
+        for columna, fila in enumerate(self.filas):
+            self.por_fila[fila] += 1
+            self.por_diagonal[fila - columna + n - 1] += 1
+            self.por_antidiagonal[fila + columna] += 1
+        self.conflictos = sum(k * (k - 1) // 2 for contadores in
+                              (self.por_fila, self.por_diagonal, self.por_antidiagonal) for k in contadores)
+
+    @property
+    def valoracion(self):
+        """Pares que NO se atacan (la función a maximizar en los scripts de reinas)."""
+        return self.n * (self.n - 1) // 2 - self.conflictos
+
+    def ataques_de(self, columna):
+        """Reinas que atacan a la de 'columna' (O(1))."""
+        fila = self.filas[columna]
+        return (self.por_fila[fila] + self.por_diagonal[fila - columna + self.n - 1]
+                + self.por_antidiagonal[fila + columna] - 3)
+
+    def delta(self, columna, nueva_fila):
+        """Cambio en 'conflictos' si la reina de 'columna' pasara a 'nueva_fila' (O(1))."""
+        fila = self.filas[columna]
+        if fila == nueva_fila:
+            return 0
+        # La fila, diagonal y antidiagonal de destino son distintas de las de origen
+        return (self.por_fila[nueva_fila] + self.por_diagonal[nueva_fila - columna + self.n - 1]
+                + self.por_antidiagonal[nueva_fila + columna]) - self.ataques_de(columna)
+
+    def mover(self, columna, nueva_fila):
+        """Aplica el movimiento en O(1) y devuelve su delta."""
+        cambio = self.delta(columna, nueva_fila)
+        fila, n = self.filas[columna], self.n
+        self.por_fila[fila] -= 1
+        self.por_diagonal[fila - columna + n - 1] -= 1
+        self.por_antidiagonal[fila + columna] -= 1
+        self.por_fila[nueva_fila] += 1
+        self.por_diagonal[nueva_fila - columna + n - 1] += 1
+        self.por_antidiagonal[nueva_fila + columna] += 1
+        self.filas[columna] = nueva_fila
+        self.conflictos += cambio
+        return cambio
+
+    def tupla(self):
+        return tuple(self.filas)